@@ -0,0 +1,40 @@
+import numpy as np
+
+
+class AnalysisResult(object):
+    """
+    Results of Beam.analyze(), held as NumPy arrays.
+
+    Responses are ordered (shear, bending, angle, deflection), planes are ordered (XY, XZ).
+    """
+    def __init__(self, xVals, xyParams, xzParams, constants, extremaLocations, extremaValues, hasXY=True, hasXZ=True):
+        """
+        `xVals` - array of points along the beam (x-axis)
+
+        `xyParams` - (4 x len(xVals)) array of responses in xy
+
+        `xzParams` - (4 x len(xVals)) array of responses in xz
+
+        `constants` - (2 x 2) array of singularity constants, `[[C1xy, C2xy], [C1xz, C2xz]]`
+
+        `extremaLocations` - (2 x 4) array of where the largest absolute responses occur
+
+        `extremaValues` - (2 x 4) array of the largest absolute responses (signed)
+
+        `hasXY`, `hasXZ` - whether any loads act in each plane
+        """
+        self.X = np.asarray(xVals, dtype=float)
+        self.XY = np.asarray(xyParams, dtype=float)
+        self.XZ = np.asarray(xzParams, dtype=float)
+        self.Constants = np.asarray(constants, dtype=float)
+        self.ExtremaLocations = np.asarray(extremaLocations, dtype=float)
+        self.ExtremaValues = np.asarray(extremaValues, dtype=float)
+        self.HasXY = hasXY
+        self.HasXZ = hasXZ
+
+
+    def getAbsMax(self):
+        """
+        returns a (2 x 4) array of the maximum absolute responses in XY and XZ
+        """
+        return abs(self.ExtremaValues)
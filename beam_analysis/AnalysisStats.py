@@ -0,0 +1,88 @@
+import time
+from contextlib import contextmanager
+
+import beam_analysis.instrument as instrument
+
+
+class AnalysisStats(object):
+    """
+    Per-phase wall times, call counts, and array sizes recorded by Beam and Singularity.
+
+    Record by using an instance as a context manager, or for long running processes with `instrument.enable(stats)`.
+    When no AnalysisStats is active, instrumented code only checks `instrument.ACTIVE is None`.
+    """
+    def __init__(self, hook=None):
+        """
+        `hook` - optional function called as `hook(kind, name, value)` for every record,
+        where `kind` is "time", "count", or "size", e.g. to forward to a metrics client
+        """
+        self.Times = {}
+        self.Counts = {}
+        self.Sizes = {}
+        self.Hook = hook
+        self.Previous = None
+
+
+    def __enter__(self):
+        self.Previous = instrument.ACTIVE
+        return instrument.enable(self)
+
+
+    def __exit__(self, excType, excValue, traceback):
+        instrument.enable(self.Previous)
+        self.Previous = None
+
+
+    @contextmanager
+    def phase(self, name):
+        """
+        `name` - name of the phase
+
+        Context manager adding the wall time of its body to `Times[name]`
+        """
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.addTime(name, time.perf_counter() - start)
+
+
+    def addTime(self, name, seconds):
+        """
+        Adds `seconds` of wall time to phase `name`
+        """
+        self.Times[name] = self.Times.get(name, 0.0) + seconds
+        if self.Hook is not None:
+            self.Hook("time", name, seconds)
+
+
+    def addCount(self, name, count=1):
+        """
+        Adds `count` calls of `name`
+        """
+        self.Counts[name] = self.Counts.get(name, 0) + count
+        if self.Hook is not None:
+            self.Hook("count", name, count)
+
+
+    def addSize(self, name, size):
+        """
+        Records an array of `size` elements handled by `name`, keeping `[arrays, total elements, largest]`
+        """
+        sizes = self.Sizes.setdefault(name, [0, 0, 0])
+        sizes[0] += 1
+        sizes[1] += size
+        sizes[2] = max(sizes[2], size)
+        if self.Hook is not None:
+            self.Hook("size", name, size)
+
+
+    def toDict(self):
+        """
+        returns the records as plain dicts, ready for JSON or a metrics client
+        """
+        return {
+            "times": dict(self.Times),
+            "counts": dict(self.Counts),
+            "sizes": {name: {"arrays": s[0], "total": s[1], "largest": s[2]} for name, s in self.Sizes.items()}
+        }
@@ -1,6 +1,8 @@
 from enum import Enum
+import numpy as np
 
 from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+from beam_analysis.utils import macaulay
 
 
 class AppliedLoadTypes(Enum):
@@ -13,6 +15,8 @@ class AppliedLoadTypes(Enum):
 
 
 class AppliedLoad(object):
+    __slots__ = ("Magnitude", "AppliedLoadType")
+
     def __init__(self, magnitude, appliedLoadType):
         self.Magnitude = magnitude
         self.AppliedLoadType = appliedLoadType
@@ -21,18 +25,42 @@ class AppliedLoad(object):
     def evaluateAt(self, x, beamAnalysisType):
         pass
     
+
+    def getLocation(self):
+        """
+        returns the distance along the beam where the load begins to act
+        """
+        pass
+    
+
+    def evaluateOver(self, xVals, beamAnalysisType):
+        """
+        `xVals` - array of distances along the beam
+
+        `beamAnalysisType` - shear, moment, angle, deflection
+
+        returns an array of the load's contribution at every point of `xVals`
+        """
+        pass
+    
     
     def getString(self, beamAnalysisType):
         pass
 
 
 class DistributedLoad(AppliedLoad):
+    __slots__ = ("Start", "Stop")
+
     def __init__(self, start, stop, magnitude):
         super().__init__(magnitude, AppliedLoadTypes.DISTRIBUTED_LOAD)
         self.Start = start
         self.Stop = stop
     
 
+    def getLocation(self):
+        return self.Start
+    
+
     def evaluateAt(self, x, beamAnalysisType):
         if not (self.Start <= x):
             return 0.0
@@ -46,6 +74,17 @@ class DistributedLoad(AppliedLoad):
             return (self.Magnitude / 24) * (x - self.Start) ** 4
     
 
+    def evaluateOver(self, xVals, beamAnalysisType):
+        if beamAnalysisType == BeamAnalysisTypes.SHEAR:
+            return self.Magnitude * macaulay(xVals, self.Start, 1)
+        if beamAnalysisType == BeamAnalysisTypes.BENDING:
+            return (self.Magnitude / 2) * macaulay(xVals, self.Start, 2)
+        if beamAnalysisType == BeamAnalysisTypes.ANGLE:
+            return (self.Magnitude / 6) * macaulay(xVals, self.Start, 3)
+        if beamAnalysisType == BeamAnalysisTypes.DEFLECTION:
+            return (self.Magnitude / 24) * macaulay(xVals, self.Start, 4)
+    
+
     def getString(self, beamAnalysisType):
         mag = abs(self.Magnitude)
         if beamAnalysisType == BeamAnalysisTypes.SHEAR:
@@ -67,11 +106,17 @@ class DistributedLoad(AppliedLoad):
 
 
 class PointLoad(AppliedLoad):
+    __slots__ = ("Location",)
+
     def __init__(self, location, magnitude):
         super().__init__(magnitude, AppliedLoadTypes.POINT_LOAD)
         self.Location = location
     
 
+    def getLocation(self):
+        return self.Location
+    
+
     def evaluateAt(self, x, beamAnalysisType):
         if not (self.Location <= x):
             return 0.0
@@ -85,6 +130,17 @@ class PointLoad(AppliedLoad):
             return (self.Magnitude / 6) * (x - self.Location) ** 3
     
 
+    def evaluateOver(self, xVals, beamAnalysisType):
+        if beamAnalysisType == BeamAnalysisTypes.SHEAR:
+            return self.Magnitude * macaulay(xVals, self.Location, 0)
+        if beamAnalysisType == BeamAnalysisTypes.BENDING:
+            return self.Magnitude * macaulay(xVals, self.Location, 1)
+        if beamAnalysisType == BeamAnalysisTypes.ANGLE:
+            return (self.Magnitude / 2) * macaulay(xVals, self.Location, 2)
+        if beamAnalysisType == BeamAnalysisTypes.DEFLECTION:
+            return (self.Magnitude / 6) * macaulay(xVals, self.Location, 3)
+    
+
     def getString(self, beamAnalysisType):
         mag = abs(self.Magnitude)        
         if beamAnalysisType == BeamAnalysisTypes.SHEAR:
@@ -100,11 +156,17 @@ class PointLoad(AppliedLoad):
 
 
 class Moment(AppliedLoad):
+    __slots__ = ("Location",)
+
     def __init__(self, location, magnitude):
         super().__init__(magnitude, AppliedLoadTypes.MOMENT)
         self.Location = location
     
 
+    def getLocation(self):
+        return self.Location
+    
+
     def evaluateAt(self, x, beamAnalysisType):
         if not (self.Location <= x):
             return 0.0
@@ -118,6 +180,17 @@ class Moment(AppliedLoad):
             return (self.Magnitude / 2) * (x - self.Location) ** 2
     
 
+    def evaluateOver(self, xVals, beamAnalysisType):
+        if beamAnalysisType == BeamAnalysisTypes.SHEAR:
+            return np.zeros(np.shape(xVals))
+        if beamAnalysisType == BeamAnalysisTypes.BENDING:
+            return self.Magnitude * macaulay(xVals, self.Location, 0)
+        if beamAnalysisType == BeamAnalysisTypes.ANGLE:
+            return self.Magnitude * macaulay(xVals, self.Location, 1)
+        if beamAnalysisType == BeamAnalysisTypes.DEFLECTION:
+            return (self.Magnitude / 2) * macaulay(xVals, self.Location, 2)
+    
+
     def getString(self, beamAnalysisType):
         mag = abs(self.Magnitude)
         if beamAnalysisType == BeamAnalysisTypes.SHEAR:
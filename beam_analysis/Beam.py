@@ -1,14 +1,19 @@
 import os
 import numpy as np
-from matplotlib import pyplot as plt
+from collections import OrderedDict
 
+from beam_analysis.AnalysisResult import AnalysisResult
+from beam_analysis.EnvelopeResult import EnvelopeResult
 from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
-from beam_analysis.Singularity import Singularity
+from beam_analysis.Singularity import Singularity, solveSingularities
 from beam_analysis.AppliedLoad import DistributedLoad, PointLoad, Moment
 from beam_analysis.BoundaryCondition import BoundaryCondition
+from beam_analysis.Support import Support
 from beam_analysis.Unit import Unit, UnitTypes
 from beam_analysis.CrossSection import CrossSection, CrossSectionTypes
-import beam_analysis.utils as utils
+from beam_analysis.Failures import getStressField
+import beam_analysis.export as export
+import beam_analysis.instrument as instrument
 
 
 class Beam(object):
@@ -17,40 +22,61 @@ class Beam(object):
     
     Add loads and perform analysis on this instance.
     """
-    def __init__(self, l, e, i=None, crossSection=None):
+    def __init__(self, l, e, i=None, crossSection=None, iy=None):
         """
         `l` - Beam length
 
         `e` - Young's Modulus
 
-        `i` - Moment of Intertia. Enter either this or give a crossSection.
+        `i` - Moment of Intertia, resisting bending in XY. Enter either this or give a crossSection.
 
         `crossSection` - a CrossSectionObject. This is preferred over a Moment of Inertia value (gives plot).
+
+        `iy` - optional Moment of Inertia resisting bending in XZ when `i` is given, default is `i`
         """
         self.Tol = 1E-6
         self.L = l
         self.E = e
 
+        # without a crossSection, a placeholder is kept for plots only
+        self.HasCrossSection = crossSection is not None
         if crossSection is not None:
             self.CrossSection = crossSection
-            self.I = crossSection.getI()
+            self.Iz = crossSection.getIz()
+            self.Iy = crossSection.getIy()
         elif i is not None:
             self.CrossSection = CrossSection(CrossSectionTypes.CIRC, dims=[1])
-            self.I = i
+            self.Iz = i
+            self.Iy = i if iy is None else iy
         else:
             raise Exception("Unable to determine Moment of Intertia. Either I or a CrossSection is required.")
-        
+        self.I = self.Iz
 
-        self.SingularityXY = Singularity(l, e, self.I)
-        self.SingularityXZ = Singularity(l, e, self.I)
+        self.SingularityXY = Singularity(l, e, self.Iz)
+        self.SingularityXZ = Singularity(l, e, self.Iy)
         
         self.ShearUnits = Unit(UnitTypes.Shear, "[N]")
         self.MomentUnits = Unit(UnitTypes.Bending, "[N-m]")
         self.AngleUnits = Unit(UnitTypes.Angle, "[rad]")
         self.DeflectionUnits = Unit(UnitTypes.Deflection, "[m]")
 
+        # unit-load responses keyed by load geometry, least recently used first, see getInfluence()
+        self.InfluenceCacheSize = 256
+        self.InfluenceCache = OrderedDict()
+        # [unit-load responses, boundary condition response] of the most recent grids, keyed by grid, least recently used first
+        self.InfluenceGridCount = 4
+        self.InfluenceGrids = OrderedDict()
+
+        # (xy loads, xz loads) by load group name, ungrouped loads are only held by the singularities
+        self.LoadGroups = {}
+
+        # (singularity, singularity load id, group list, load) of each plane's component, by load id.
+        # group list and load are None for ungrouped loads
+        self.AppliedLoadIds = {}
+        self.NextLoadId = 0
 
-    def addDistributedLoad(self, start, stop, magnitude, angle):
+
+    def addDistributedLoad(self, start, stop, magnitude, angle, group=None):
         """
         `start` - start distance of the distributed load
         
@@ -59,60 +85,99 @@ class Beam(object):
         `magnitude` - force of the distributed load
 
         `angle` - degrees in radians from the XY axis towards the XZ axis
+
+        `group` - optional load group name, e.g. "dead" or "live", used by combine()
+
+        returns an id for removeAppliedLoad()
         """
         if (start < 0 or self.L < stop or stop <= start):
             raise Exception(f"invalid start / stop for Distributed Load: {start} / {stop}")
         
-        rads = angle * (np.pi / 180)
-        xyComp = np.cos(rads)
-        if (xyComp != 0):
-            self.SingularityXY.addAppliedLoad(DistributedLoad(start, stop, xyComp * magnitude))
-        
-        xzComp = np.sin(rads)
-        if (xzComp != 0):
-            self.SingularityXZ.addAppliedLoad(DistributedLoad(start, stop, xzComp * magnitude))
+        return self.addAppliedLoad(lambda m: DistributedLoad(start, stop, m), magnitude, angle, group)
 
 
-    def addPointLoad(self, location, magnitude, angle):
+    def addPointLoad(self, location, magnitude, angle, group=None):
         """
         `location` - the distance along the beam to the boundary condition
 
         `magnitude` - force of the applied load
 
         `angle` - degrees in radians from the XY axis towards the XZ axis
+
+        `group` - optional load group name, e.g. "dead" or "live", used by combine()
+
+        returns an id for removeAppliedLoad()
         """
         if (location < 0 or self.L < location):
             raise Exception(f"invalid location for Point Load: {location}")
         
-        rads = angle * (np.pi / 180)
-        xyComp = np.cos(rads)
-        if (xyComp != 0):
-            self.SingularityXY.addAppliedLoad(PointLoad(location, xyComp * magnitude))
-        
-        xzComp = np.sin(rads)
-        if (xzComp != 0):
-            self.SingularityXZ.addAppliedLoad(PointLoad(location, xzComp * magnitude))
+        return self.addAppliedLoad(lambda m: PointLoad(location, m), magnitude, angle, group)
 
     
-    def addAppliedMoment(self, location, magnitude, angle):
+    def addAppliedMoment(self, location, magnitude, angle, group=None):
         """
         `location` - the distance along the beam to the boundary condition
                 
         `magnitude` - moment
 
         `angle` - degrees in radians from the XY axis towards the XZ axis
+
+        `group` - optional load group name, e.g. "dead" or "live", used by combine()
+
+        returns an id for removeAppliedLoad()
         """
         if (location < 0 or self.L < location):
             raise Exception(f"invalid location for Applied Moment: {location}")
         
+        return self.addAppliedLoad(lambda m: Moment(location, m), magnitude, angle, group)
+
+
+    def addAppliedLoad(self, makeLoad, magnitude, angle, group=None):
+        """
+        `makeLoad` - function returning the distributed load, point load, or moment for a given magnitude
+
+        `magnitude` - magnitude of the load
+
+        `angle` - degrees in radians from the XY axis towards the XZ axis
+
+        `group` - optional load group name
+
+        Splits the load into its XY and XZ components, and records them under `group` in `LoadGroups` when grouped.
+
+        returns an id for removeAppliedLoad()
+        """
+        groupLoads = None if group is None else self.LoadGroups.setdefault(group, ([], []))
+        components = []
+        
         rads = angle * (np.pi / 180)
-        xyComp = np.cos(rads)
-        if (xyComp != 0):
-            self.SingularityXY.addAppliedLoad(Moment(location, xyComp * magnitude))
+        for plane, (singularity, comp) in enumerate([(self.SingularityXY, np.cos(rads)), (self.SingularityXZ, np.sin(rads))]):
+            if (comp != 0):
+                load = makeLoad(comp * magnitude)
+                if groupLoads is None:
+                    components.append((singularity, singularity.addAppliedLoad(load), None, None))
+                else:
+                    groupLoads[plane].append(load)
+                    components.append((singularity, singularity.addAppliedLoad(load), groupLoads[plane], load))
         
-        xzComp = np.sin(rads)
-        if (xzComp != 0):
-            self.SingularityXZ.addAppliedLoad(Moment(location, xzComp * magnitude))
+        loadId = self.NextLoadId
+        self.NextLoadId += 1
+        self.AppliedLoadIds[loadId] = components
+        return loadId
+
+
+    def removeAppliedLoad(self, loadId):
+        """
+        `loadId` - id returned when the load was added
+
+        Removes the load from both planes and its load group. Solved planes are updated without solving again.
+        """
+        if loadId not in self.AppliedLoadIds:
+            raise Exception(f"No applied load with id: {loadId}")
+        
+        for singularity, singularityLoadId, groupLoads, load in self.AppliedLoadIds.pop(loadId):
+            singularity.removeAppliedLoad(singularityLoadId)
+            if groupLoads is not None:
+                groupLoads.remove(load)
 
 
     def addBoundaryCondition(self, location, boundaryConditionType, boundaryConditionValue):
@@ -128,11 +193,486 @@ class Beam(object):
         
         self.SingularityXY.addBoundaryCondition(BoundaryCondition(location, boundaryConditionType, boundaryConditionValue))
         self.SingularityXZ.addBoundaryCondition(BoundaryCondition(location, boundaryConditionType, boundaryConditionValue))
+        self.clearInfluences()
+    
+
+    def addSupport(self, location, supportType):
+        """
+        `location` - the distance along the beam to the support
+
+        `supportType` - the type of the support. e.g: PIN, ROLLER, FIXED
+
+        Reactions at supports are solved for, so they should not also be added as loads.
+        """
+        if (location < 0 or self.L < location):
+            raise Exception(f"invalid location for Support: {location}")
+        
+        self.SingularityXY.addSupport(Support(location, supportType))
+        self.SingularityXZ.addSupport(Support(location, supportType))
+        self.clearInfluences()
+    
+
+    def getBoundarySingularity(self, homogeneous, e=1, i=1):
+        """
+        `homogeneous` - when True, boundary condition values are taken as 0
+
+        `e`, `i` - optional Young's Modulus and Moment of Inertia, default 1 so angle and deflection are unscaled
+
+        returns a Singularity without loads, with this beam's supports and boundary conditions
+        """
+        boundarySingularity = Singularity(self.L, e, i)
+        for bc in self.SingularityXY.BoundaryConditions:
+            boundarySingularity.addBoundaryCondition(BoundaryCondition(bc.Location, bc.Type, 0 if homogeneous else bc.Value))
+        for support in self.SingularityXY.Supports:
+            boundarySingularity.addSupport(Support(support.Location, support.SupportType))
+        return boundarySingularity
+    
+
+    def clearInfluences(self):
+        """
+        Drops every cached unit-load and boundary condition response, e.g. when supports or boundary conditions change
+        """
+        self.InfluenceGrids.clear()
+        self.InfluenceCache = OrderedDict()
+
+
+    def getInfluenceGrid(self, xVals):
+        """
+        `xVals` - array of distances along the beam
+
+        returns the `[influences, boundaryResponse]` cached for `xVals`, keeping those of at most `InfluenceGridCount` grids.
+        `InfluenceCache` is set to its influences.
+        """
+        key = np.asarray(xVals, dtype=float).tobytes()
+        if key not in self.InfluenceGrids:
+            self.InfluenceGrids[key] = [OrderedDict(), None]
+            if self.InfluenceGridCount < len(self.InfluenceGrids):
+                self.InfluenceGrids.popitem(last=False)
+        self.InfluenceGrids.move_to_end(key)
+        grid = self.InfluenceGrids[key]
+        self.InfluenceCache = grid[0]
+        return grid
+
+
+    def getBoundaryResponse(self, xVals):
+        """
+        `xVals` - array of distances along the beam
+
+        returns a (4 x len(xVals)) array of the response to the boundary condition values with no loads, solved with E*I = 1,
+        or None when every value is 0. Solved once per grid, see getInfluenceGrid().
+        """
+        if all(bc.Value == 0 for bc in self.SingularityXY.BoundaryConditions):
+            return None
+        
+        grid = self.getInfluenceGrid(xVals)
+        if grid[1] is None:
+            boundarySingularity = self.getBoundarySingularity(homogeneous=False)
+            boundarySingularity.solve()
+            grid[1] = np.stack(boundarySingularity.evaluateAllOver(np.asarray(xVals, dtype=float)))
+        return grid[1]
+
+
+    def getInfluence(self, appliedLoad, xVals):
+        """
+        `appliedLoad` - distributed load, point load, moment. Only its type and location are used.
+
+        `xVals` - array of distances along the beam
+
+        returns a (4 x len(xVals)) array of the response to a unit load, ordered (shear, bending, angle, deflection).
+        Angle and deflection are not divided by E*I, and boundary condition values are taken as 0.
+
+        Responses are cached per load type and location for each of the most recent grids (see getInfluenceGrid()),
+        keeping at most `InfluenceCacheSize` of them per grid.
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        self.getInfluenceGrid(xVals)
+        
+        stop = appliedLoad.Stop if isinstance(appliedLoad, DistributedLoad) else None
+        key = (appliedLoad.AppliedLoadType, appliedLoad.getLocation(), stop)
+        if key in self.InfluenceCache:
+            self.InfluenceCache.move_to_end(key)
+            return self.InfluenceCache[key]
+        
+        # solve the unit load alone with homogeneous boundary conditions
+        unitSingularity = self.getBoundarySingularity(homogeneous=True)
+        if isinstance(appliedLoad, DistributedLoad):
+            unitSingularity.addAppliedLoad(DistributedLoad(appliedLoad.Start, appliedLoad.Stop, 1.0))
+        else:
+            unitSingularity.addAppliedLoad(type(appliedLoad)(appliedLoad.Location, 1.0))
+        unitSingularity.solve()
+
+        influence = np.stack(unitSingularity.evaluateAllOver(xVals))
+        self.InfluenceCache[key] = influence
+        if self.InfluenceCacheSize < len(self.InfluenceCache):
+            self.InfluenceCache.popitem(last=False)
+        return influence
     
 
-    def runAnalysis(self, n=10**3, showPlots=True, outputToFile=False):
+    def evaluateLoadCase(self, appliedLoads, xVals, i=None):
+        """
+        `appliedLoads` - list of distributed loads, point loads, moments acting in one plane
+
+        `xVals` - array of distances along the beam
+
+        `i` - optional Moment of Inertia of the plane, default is `Iz` (XY)
+
+        returns a (4 x len(xVals)) array of the response, ordered (shear, bending, angle, deflection).
+        Built by superposing cached unit-load responses, without solving the beam's singularities.
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        response = np.zeros((len(BeamAnalysisTypes), len(xVals)))
+        if 0 < len(appliedLoads):
+            magnitudes = np.array([load.Magnitude for load in appliedLoads], dtype=float)
+            influences = np.array([self.getInfluence(load, xVals) for load in appliedLoads]).reshape(len(appliedLoads), -1)
+            response += (magnitudes @ influences).reshape(response.shape)
+
+        ei = self.E * (self.Iz if i is None else i)
+        response[2:] /= ei
+
+        # response to non-zero boundary condition values, solved with E*I = 1
+        boundaryResponse = self.getBoundaryResponse(xVals)
+        if boundaryResponse is not None:
+            response[:2] += ei * boundaryResponse[:2]
+            response[2:] += boundaryResponse[2:]
+        return response
+    
+
+    def getGroupResponses(self, xVals):
+        """
+        `xVals` - array of distances along the beam
+
+        returns `(groups, responses, base)` where `groups` lists the load group names,
+        `responses` is a (groups x 2 x 4 x len(xVals)) array of each group's response in (XY, XZ) with boundary condition values taken as 0,
+        and `base` is the (2 x 4 x len(xVals)) response to the ungrouped loads and boundary condition values.
+        Every group is solved together with a single call to solveSingularities(), and `base` is what remains of the beam's own response.
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        groups = list(self.LoadGroups)
+        
+        self.solve()
+        base = np.array([self.SingularityXY.evaluateAllOver(xVals), self.SingularityXZ.evaluateAllOver(xVals)])
+        if len(groups) == 0:
+            return groups, np.zeros((0,) + base.shape), base
+
+        singularities = []
+        for group in groups:
+            for loads, i in zip(self.LoadGroups[group], [self.Iz, self.Iy]):
+                singularity = self.getBoundarySingularity(homogeneous=True, e=self.E, i=i)
+                for load in loads:
+                    singularity.addAppliedLoad(load)
+                singularities.append(singularity)
+        solveSingularities(singularities)
+
+        responses = np.array([singularity.evaluateAllOver(xVals) for singularity in singularities])
+        responses = responses.reshape((len(groups),) + base.shape)
+        return groups, responses, base - np.sum(responses, axis=0)
+
+
+    def combine(self, combinations, n=10**3):
+        """
+        `combinations` - dict of load combinations, each a dict of factors by load group,
+        e.g. `{"1.2D+1.6L": {"dead": 1.2, "live": 1.6}, "1.4D": {"dead": 1.4}}`.
+        Groups missing from a combination have a factor of 0, ungrouped loads always have a factor of 1.
+
+        `n` - optional number of data points along the beam, default is 10^3
+
+        returns an EnvelopeResult over every combination (the cases, by name).
+        Each group is solved once, and every combination is formed by a single matrix multiply.
+        """
+        if len(combinations) == 0:
+            raise Exception("combine requires at least one load combination")
+        
+        xVals = np.linspace(0, self.L, n)
+        groups, responses, base = self.getGroupResponses(xVals)
+        
+        names = list(combinations)
+        factors = np.zeros((len(names), len(groups)))
+        for row, name in enumerate(names):
+            for group, factor in combinations[name].items():
+                if group not in groups:
+                    raise Exception(f"Unknown load group in combination {name}: {group}")
+                factors[row, groups.index(group)] = factor
+        
+        if len(groups) == 0:
+            # only the ungrouped loads and boundary condition values, the same for every combination
+            combined = np.broadcast_to(base, (len(names),) + base.shape)
+        else:
+            combined = (factors @ responses.reshape(len(groups), -1)).reshape((len(names),) + base.shape) + base
+        maxCases, minCases = np.argmax(combined, axis=0), np.argmin(combined, axis=0)
+        return EnvelopeResult(
+            xVals, names,
+            np.take_along_axis(combined, maxCases[None], axis=0)[0],
+            np.take_along_axis(combined, minCases[None], axis=0)[0],
+            maxCases, minCases
+        )
+
+
+    def movingLoad(self, axles, spacing, positions, angle=0, n=10**3):
+        """
+        `axles` - magnitude of each axle load in a train, leading axle first
+
+        `spacing` - distance between consecutive axles, a scalar or one value per gap
+
+        `positions` - array of locations of the leading axle. Trailing axles are at `position - spacing`, and are ignored when off the beam.
+
+        `angle` - degrees from the XY axis towards the XZ axis
+
+        `n` - optional number of data points along the beam, default is 10^3
+
+        returns an EnvelopeResult over every position (the cases), including the response to the beam's own loads.
+        Each distinct axle location is solved once with a unit load, and the train's response at every position is
+        a weighted sum of those influence lines.
+        """
+        axles = np.atleast_1d(np.asarray(axles, dtype=float))
+        positions = np.atleast_1d(np.asarray(positions, dtype=float))
+        if len(positions) == 0:
+            raise Exception("movingLoad requires at least one position")
+        
+        offsets = np.concatenate(([0.0], np.cumsum(np.broadcast_to(spacing, (len(axles) - 1,)))))
+        locations = positions[:, None] - offsets[None, :]
+        onBeam = (0 <= locations) & (locations <= self.L)
+
+        # (positions x distinct locations) weights of the axles on the beam
+        unique, inverse = np.unique(locations[onBeam], return_inverse=True)
+        weights = np.zeros((len(positions), len(unique)))
+        np.add.at(weights, (np.nonzero(onBeam)[0], inverse), np.broadcast_to(axles, locations.shape)[onBeam])
+
+        xVals = np.linspace(0, self.L, n)
+        self.solve()
+        
+        rads = angle * (np.pi / 180)
+        shape = (2, len(BeamAnalysisTypes), n)
+        maxima, minima = np.zeros(shape), np.zeros(shape)
+        maxCases, minCases = np.zeros(shape, dtype=int), np.zeros(shape, dtype=int)
+        for plane, (singularity, comp) in enumerate([(self.SingularityXY, np.cos(rads)), (self.SingularityXZ, np.sin(rads))]):
+            static = np.stack(singularity.evaluateAllOver(xVals))
+            if comp != 0:
+                lines = singularity.getInfluenceLines(xVals, unique)
+            for bat in BeamAnalysisTypes:
+                k = bat.value - 1
+                if comp == 0:
+                    maxima[plane, k] = minima[plane, k] = static[k]
+                    continue
+                responses = comp * (weights @ lines[k]) + static[k]
+                maxCases[plane, k] = np.argmax(responses, axis=0)
+                minCases[plane, k] = np.argmin(responses, axis=0)
+                maxima[plane, k] = np.take_along_axis(responses, maxCases[plane, k][None], axis=0)[0]
+                minima[plane, k] = np.take_along_axis(responses, minCases[plane, k][None], axis=0)[0]
+        
+        return EnvelopeResult(xVals, positions, maxima, minima, maxCases, minCases)
+    
+
+    def optimizeSection(self, catalog, limits, n=10**3):
+        """
+        `catalog` - a SectionLibrary of candidate sections
+
+        `limits` - dict of allowable values, any of:
+            "stress"        -   bending stress at the extreme fiber, |M_XY| / Sz + |M_XZ| / Sy (exact for RECT and I, conservative for CIRC)
+
+            "deflection"    -   deflection magnitude, sqrt(y_XY^2 + y_XZ^2)
+
+            "angle"         -   angle magnitude, sqrt(a_XY^2 + a_XZ^2)
+
+        `n` - optional number of data points along the beam, default is 10^3
+
+        returns `(index, passing)`, the index in `catalog` of the lightest (least area) section meeting every limit, or None,
+        and the boolean mask of every section meeting them.
+        The beam is solved once with its own Iz and Iy. Shear and bending do not depend on I, and angle and deflection
+        scale with 1 / (E*I) apart from the response to non-zero boundary condition values, so every section is checked at once.
+        """
+        unknown = set(limits) - {"stress", "deflection", "angle"}
+        if 0 < len(unknown):
+            raise Exception(f"Unknown limits for optimizeSection: {sorted(unknown)}")
+
+        xVals = np.linspace(0, self.L, n)
+        self.solve()
+        vals = np.array([self.SingularityXY.evaluateAllOver(xVals), self.SingularityXZ.evaluateAllOver(xVals)])
+
+        # response to non-zero boundary condition values, solved with E*I = 1, then removed to leave the part scaling with 1 / (E*I)
+        boundary = self.getBoundaryResponse(xVals)
+        if boundary is None:
+            boundary = np.zeros((len(BeamAnalysisTypes), len(xVals)))
+        ei = self.E * np.array([self.Iz, self.Iy])[:, None, None]
+        loadPart = vals.copy()
+        loadPart[:, :2] -= ei * boundary[:2]
+        loadPart[:, 2:] = (loadPart[:, 2:] - boundary[2:]) * ei
+
+        # (sections x 2 x 1) E*I of every candidate in (XY, XZ)
+        sectionEI = self.E * np.stack((catalog.getColumn("Iz"), catalog.getColumn("Iy")), axis=1)[:, :, None]
+        passing = np.ones(len(catalog), dtype=bool)
+        if "stress" in limits:
+            moments = abs(loadPart[None, :, 1] + sectionEI * boundary[1])
+            moduli = np.stack((catalog.getColumn("Sz"), catalog.getColumn("Sy")), axis=1)[:, :, None]
+            passing &= np.max(np.sum(moments / moduli, axis=1), axis=1) <= limits["stress"]
+        for name, bat in [("angle", BeamAnalysisTypes.ANGLE), ("deflection", BeamAnalysisTypes.DEFLECTION)]:
+            if name in limits:
+                k = bat.value - 1
+                planes = loadPart[None, :, k] / sectionEI + boundary[k]
+                passing &= np.max(np.sqrt(np.sum(planes**2, axis=1)), axis=1) <= limits[name]
+
+        return catalog.getLightest(passing), passing
+
+
+    def getStressField(self, n=10**3, m=20):
+        """
+        `n` - optional number of data points along the beam, default is 10^3
+
+        `m` - optional number of grid points across the CrossSection, see CrossSection.getStressPoints()
+
+        returns a StressResult of the bending, shear, and von Mises stresses over (x x section points),
+        from the shear and bending of both planes. Use its getFos() and getCritical() for factors of safety and the critical location.
+        Requires the beam to be made with a crossSection.
+        """
+        if not self.HasCrossSection:
+            raise Exception("getStressField requires a Beam made with a crossSection, not only a Moment of Inertia")
+        xVals = np.linspace(0, self.L, n)
+        self.solve()
+        shears = [singularity.evaluateOver(xVals, BeamAnalysisTypes.SHEAR) for singularity in [self.SingularityXY, self.SingularityXZ]]
+        moments = [singularity.evaluateOver(xVals, BeamAnalysisTypes.BENDING) for singularity in [self.SingularityXY, self.SingularityXZ]]
+        return getStressField(self.CrossSection, xVals, shears, moments, m)
+
+
+    def solve(self):
+        """
+        Solves for the singularity constants and reactions in XY and XZ together.
+        Does nothing when both are already solved, since loads added or removed since then update them in place.
+        """
+        if self.SingularityXY.System is not None and self.SingularityXZ.System is not None:
+            return
+        with instrument.phase("solve"):
+            solveSingularities([self.SingularityXY, self.SingularityXZ])
+    
+
+    def getExtrema(self):
+        """
+        Finds the exact maximum absolute shear, bending, angle, and deflection in XY and XZ.
+
+        returns a dict `{"XY": (locations, values), "XZ": (locations, values)}` where each array is ordered (shear, bending, angle, deflection)
+        """
+        if self.SingularityXY.Coefficients is None or self.SingularityXZ.Coefficients is None:
+            self.solve()
+        return {
+            "XY": self.SingularityXY.getExtrema(),
+            "XZ": self.SingularityXZ.getExtrema()
+        }
+    
+
+    def analyze(self, n=10**3, adaptive=False, tol=1E-3):
         """
         `n` - optional number of data points to run the analysis, default is 10^3
+
+        `adaptive` - optionally sample adaptively instead of at `n` uniform points, see getAdaptiveGrid()
+
+        `tol` - with `adaptive`, the relative tolerance of the sampled diagrams
+
+        returns an AnalysisResult. Does not print, plot, or write files.
+        """
+        self.solve()
+
+        with instrument.phase("sample"):
+            if adaptive:
+                xVals, xySegments, xzSegments = self.getAdaptiveGrid(tol)
+                xyParams = [self.SingularityXY.evaluateCompiled(xVals, bat, xySegments) for bat in BeamAnalysisTypes]
+                xzParams = [self.SingularityXZ.evaluateCompiled(xVals, bat, xzSegments) for bat in BeamAnalysisTypes]
+            else:
+                xVals = np.linspace(0, self.L, n)
+                xyParams = self.SingularityXY.evaluateAllOver(xVals)
+                xzParams = self.SingularityXZ.evaluateAllOver(xVals)
+        if instrument.ACTIVE is not None:
+            instrument.ACTIVE.addSize("Beam.analyze", len(xVals))
+
+        with instrument.phase("extrema"):
+            extrema = self.getExtrema()
+        constants = [
+            [self.SingularityXY.C1, self.SingularityXY.C2],
+            [self.SingularityXZ.C1, self.SingularityXZ.C2]
+        ]
+        return AnalysisResult(
+            xVals, xyParams, xzParams, constants,
+            [extrema["XY"][0], extrema["XZ"][0]],
+            [extrema["XY"][1], extrema["XZ"][1]],
+            hasXY=0 < len(self.SingularityXY.Loads),
+            hasXZ=0 < len(self.SingularityXZ.Loads)
+        )
+    
+
+    def getAdaptiveGrid(self, tol=1E-3, maxDepth=30):
+        """
+        `tol` - largest allowed gap between a diagram and its linear interpolation, relative to the diagram's maximum
+
+        `maxDepth` - most times a single interval is halved
+
+        returns `(xVals, xySegments, xzSegments)` where the segments are the compiled segment of each x in XY and XZ.
+        Every load breakpoint is included, twice at discontinuities (left limit then right limit),
+        and each segment is halved until all 8 diagrams meet `tol`.
+
+        `NOTE` - requires solve() to be called first
+        """
+        singularities = [self.SingularityXY, self.SingularityXZ]
+        
+        # breakpoints of both planes split the beam into smooth segments
+        breakpoints = np.unique(np.concatenate([s.Breakpoints for s in singularities] + [[0, self.L]]))
+        breakpoints = breakpoints[(0 <= breakpoints) & (breakpoints <= self.L)]
+        starts, stops = breakpoints[:-1], breakpoints[1:]
+        segments = [s.getSegments(starts) for s in singularities]
+        
+        def evaluate(xVals, segment):
+            vals = [s.evaluateCompiled(xVals, bat, segs[segment]) for s, segs in zip(singularities, segments) for bat in BeamAnalysisTypes]
+            return np.array(vals)
+        
+        # scale each diagram by its maximum, found exactly
+        extrema = self.getExtrema()
+        scale = abs(np.concatenate([extrema["XY"][1], extrema["XZ"][1]]))[:, None]
+        scale[scale == 0] = 1.0
+        
+        # seed each segment with 4 intervals, so symmetric curvature is not mistaken for a line
+        seed = np.linspace(0, 1, 5)
+        left = (starts[:, None] + (stops - starts)[:, None] * seed[:-1]).ravel()
+        right = (starts[:, None] + (stops - starts)[:, None] * seed[1:]).ravel()
+        segment = np.repeat(np.arange(len(starts)), len(seed) - 1)
+        
+        accepted = []
+        for _depth in range(maxDepth):
+            if len(left) == 0:
+                break
+            mid = (left + right) / 2
+            error = abs(evaluate(mid, segment) - (evaluate(left, segment) + evaluate(right, segment)) / 2) / scale
+            refine = tol < error.max(axis=0)
+            accepted.append((left[~refine], right[~refine], segment[~refine]))
+            left, right, segment = np.concatenate([left[refine], mid[refine]]), np.concatenate([mid[refine], right[refine]]), np.tile(segment[refine], 2)
+        accepted.append((left, right, segment))
+        
+        # unique points of each segment, ordered by segment then x
+        xVals = np.concatenate([np.concatenate([l, r]) for l, r, _seg in accepted])
+        segment = np.concatenate([np.concatenate([seg, seg]) for _l, _r, seg in accepted])
+        order = np.lexsort((xVals, segment))
+        xVals, segment = xVals[order], segment[order]
+        keep = np.ones(len(xVals), dtype=bool)
+        keep[1:] = (xVals[1:] != xVals[:-1]) | (segment[1:] != segment[:-1])
+        xVals, segment = xVals[keep], segment[keep]
+
+        # keep a breakpoint twice only where a diagram jumps
+        vals = evaluate(xVals, segment)
+        keep = np.ones(len(xVals), dtype=bool)
+        keep[1:] = (xVals[1:] != xVals[:-1]) | (1E-12 < (abs(vals[:, 1:] - vals[:, :-1]) / scale).max(axis=0))
+        xVals, segment = xVals[keep], segment[keep]
+        
+        return xVals, segments[0][segment], segments[1][segment]
+    
+
+    def runAnalysis(self, n=10**3, showPlots=True, outputToFile=False, adaptive=False, tol=1E-3, outputDiagrams=False):
+        """
+        `n` - optional number of data points to run the analysis, default is 10^3
+
+        `adaptive` - optionally sample adaptively instead of at `n` uniform points, see getAdaptiveGrid()
+
+        `tol` - with `adaptive`, the relative tolerance of the sampled diagrams
+
+        `outputDiagrams` - with `outputToFile`, also write the full diagrams to a `-diagrams.csv` file next to the summary
+
+        Reports the results of analyze() to the console, and optionally as plots and a .csv file.
+
+        returns the AnalysisResult
         """
         pre = "[BEAM ANALYSIS] - "
         print(f"{pre}Running analysis with beam parameters:")
@@ -142,12 +682,19 @@ class Beam(object):
         bI = "Moment of inertia:"
         print(f"{pre}{bL:30} {self.L}")
         print(f"{pre}{bE:30} {self.E}")
-        print(f"{pre}{bI:30} {self.I}")
+        print(f"{pre}{bI:30} {self.Iz} (Iz), {self.Iy} (Iy)")
 
         # =================================== #
-        # = Solve for Singularity Constants = *
+        # ========== Beam Results =========== #
         # =================================== #
-        self.SingularityXY.solve()
+        result = self.analyze(n, adaptive=adaptive, tol=tol)
+        hasXY = result.HasXY
+        hasXZ = result.HasXZ
+        if not (hasXY or hasXZ):
+            print("No analysis available in XY or XZ.")
+            return result
+        
+        report = instrument.startPhase("report")
         xySingularities = [
             self.SingularityXY.getString(BeamAnalysisTypes.SHEAR),
             self.SingularityXY.getString(BeamAnalysisTypes.BENDING),
@@ -155,7 +702,6 @@ class Beam(object):
             self.SingularityXY.getString(BeamAnalysisTypes.DEFLECTION)
         ]
 
-        self.SingularityXZ.solve()
         xzSingularities = [
             self.SingularityXZ.getString(BeamAnalysisTypes.SHEAR),
             self.SingularityXZ.getString(BeamAnalysisTypes.BENDING),
@@ -163,32 +709,6 @@ class Beam(object):
             self.SingularityXZ.getString(BeamAnalysisTypes.DEFLECTION)
         ]
 
-        # determine if there is any anlaysis to run
-        hasXY = not all(s == "" for s in xySingularities)
-        hasXZ = not all(s == "" for s in xzSingularities)
-        if not (hasXY or hasXZ):
-            print("No analysis available in XY or XZ.")
-            print("Quitting...")
-            quit()
-        
-
-        # =================================== #
-        # ========== Beam Results =========== #
-        # =================================== #
-        xVals = np.linspace(0, self.L, n)
-        xyShear, xyBending, xyAngle, xyDeflection = [], [], [], []
-        xzShear, xzBending, xzAngle, xzDeflection = [], [], [], []
-        for x in xVals:
-            xyShear.append(self.SingularityXY.evaluateAt(x, BeamAnalysisTypes.SHEAR))
-            xyBending.append(self.SingularityXY.evaluateAt(x, BeamAnalysisTypes.BENDING))
-            xyAngle.append(self.SingularityXY.evaluateAt(x, BeamAnalysisTypes.ANGLE))
-            xyDeflection.append(self.SingularityXY.evaluateAt(x, BeamAnalysisTypes.DEFLECTION))
-
-            xzShear.append(self.SingularityXZ.evaluateAt(x, BeamAnalysisTypes.SHEAR))
-            xzBending.append(self.SingularityXZ.evaluateAt(x, BeamAnalysisTypes.BENDING))
-            xzAngle.append(self.SingularityXZ.evaluateAt(x, BeamAnalysisTypes.ANGLE))
-            xzDeflection.append(self.SingularityXZ.evaluateAt(x, BeamAnalysisTypes.DEFLECTION))
-        
 
         # =================================== #
         # ============= Report ============== #
@@ -209,14 +729,22 @@ class Beam(object):
         # write singularity constants in XY to console
         if hasXY:
             print(sep)
-            print(f"{pre}{pre_solving}Solved for xy angle constant C1 = {self.SingularityXY.C1}")
-            print(f"{pre}{pre_solving}Solved for xy deflection constant C2 = {self.SingularityXY.C2}")
+            print(f"{pre}{pre_solving}Solved for xy angle constant C1 = {result.Constants[0, 0]}")
+            print(f"{pre}{pre_solving}Solved for xy deflection constant C2 = {result.Constants[0, 1]}")
+            if self.SingularityXY.isOverdetermined(self.Tol):
+                print(f"{pre}{pre_solving}Boundary conditions in xy are overdetermined, least squares residual = {self.SingularityXY.Residual}")
+            for reaction in self.SingularityXY.Reactions:
+                print(f"{pre}{pre_solving}Solved for xy {reaction.AppliedLoadType.name} reaction at {reaction.Location} = {reaction.Magnitude}")
         
         # write singularity constants in XZ to console
         if hasXZ:
             print(sep)
-            print(f"{pre}{pre_solving}Solved for xz angle constant C1 = {self.SingularityXZ.C1}")
-            print(f"{pre}{pre_solving}Solved for xz deflection constant C2 = {self.SingularityXZ.C2}")
+            print(f"{pre}{pre_solving}Solved for xz angle constant C1 = {result.Constants[1, 0]}")
+            print(f"{pre}{pre_solving}Solved for xz deflection constant C2 = {result.Constants[1, 1]}")
+            if self.SingularityXZ.isOverdetermined(self.Tol):
+                print(f"{pre}{pre_solving}Boundary conditions in xz are overdetermined, least squares residual = {self.SingularityXZ.Residual}")
+            for reaction in self.SingularityXZ.Reactions:
+                print(f"{pre}{pre_solving}Solved for xz {reaction.AppliedLoadType.name} reaction at {reaction.Location} = {reaction.Magnitude}")
         
         # write singularities in XY to console
         if hasXY:
@@ -232,12 +760,15 @@ class Beam(object):
             for s in xzSingularities:
                 print(s)
         
+        # exact maxima from the piecewise polynomials
+        xyMax, xzMax = result.getAbsMax()
+
         # write max vals in XY to console
         if hasXY:
-            mSxy = utils.getAbsMax(xyShear, rdSh)
-            mBxy = utils.getAbsMax(xyBending, rdB)
-            mAxy = utils.getAbsMax(xyAngle, rdA)
-            mDxy = utils.getAbsMax(xyDeflection, rdD)
+            mSxy = round(xyMax[0], rdSh)
+            mBxy = round(xyMax[1], rdB)
+            mAxy = round(xyMax[2], rdA)
+            mDxy = round(xyMax[3], rdD)
 
             print(sep)
             print(f"{pre}Report in XY:")
@@ -248,10 +779,10 @@ class Beam(object):
         
         # write max vals in XZ to console
         if hasXZ:
-            mSxz = utils.getAbsMax(xzShear, rdSh)
-            mBxz = utils.getAbsMax(xzBending, rdB)
-            mAxz = utils.getAbsMax(xzAngle, rdA)
-            mDxz = utils.getAbsMax(xzDeflection, rdD)
+            mSxz = round(xzMax[0], rdSh)
+            mBxz = round(xzMax[1], rdB)
+            mAxz = round(xzMax[2], rdA)
+            mDxz = round(xzMax[3], rdD)
 
             print(sep)
             print(f"{pre}Report in XZ:")
@@ -262,17 +793,18 @@ class Beam(object):
         
         # done w console ouput
         print(sep)
+        instrument.endPhase(report)
 
         # Show plots of XY/XZ params & final beam deflection
         if showPlots:
             print(f"{pre}generating beam plots...")
-            xyParams = (xyShear, xyBending, xyAngle, xyDeflection)
-            xzParams = (xzShear, xzBending, xzAngle, xzDeflection)
-            self.showPlots(xVals, xyParams, xzParams)
+            with instrument.phase("plot"):
+                self.showPlots(result.X, result.XY, result.XZ)
             print(f"done.")
         
         # if desired, output results to .csv file
         if outputToFile:
+            output = instrument.startPhase("output")
             # if the output folder doesnt exist, create it
             outputFolderName = "beam-analysis-results"
             if not os.path.exists(outputFolderName):
@@ -282,63 +814,73 @@ class Beam(object):
             print(f"{pre}outputting to file in {outputFolderName}/...")
             filename = outputFolderName + "/" + f"beam-analysis-results-l{self.L}-cs{self.CrossSection.CrossSectionType.name}".replace('.', '_') + ".csv"
             
-            # write the mS, mB, mA, MD vals for XY and XZ as well as some beam params
+            # collect the mS, mB, mA, MD vals for XY and XZ as well as some beam params
+            lines = []
+            lines.append("Beam Analysis Results\n")
+
+            lines.append("\n")
+
+            lines.append("Beam\n")
+            lines.append(f"length:, {self.L}\n")
+            lines.append(f"cross-section:, {self.CrossSection.CrossSectionType.name}\n")
+            lines.append(f"E:, {self.E}\n")
+            lines.append(f"Iz:, {self.Iz}\n")
+            lines.append(f"Iy:, {self.Iy}\n")
+
+            lines.append("\n")
+
+            # loads in XY
+            if hasXY:
+                lines.append("Applied Loads in XY\n")
+                lines.append("Load Type, Start, Stop, Magnitude\n")
+                for load in self.SingularityXY.AppliedLoads:
+                    if isinstance(load, DistributedLoad):
+                        lines.append(f"{load.AppliedLoadType.name}, {load.Start}, {load.Stop}, {load.Magnitude}\n")
+                    else:
+                        lines.append(f"{load.AppliedLoadType.name}, {load.Location}, N/A, {load.Magnitude}\n")
+                lines.append("\n")
+
+            # loads in XZ
+            if hasXZ:
+                lines.append("Applied Loads in XZ\n")
+                lines.append("Load Type, Start, Stop, Magnitude\n")
+                for load in self.SingularityXZ.AppliedLoads:
+                    if isinstance(load, DistributedLoad):
+                        lines.append(f"{load.AppliedLoadType.name}, {load.Start}, {load.Stop}, {load.Magnitude}\n")
+                    else:
+                        lines.append(f"{load.AppliedLoadType.name}, {load.Location}, N/A, {load.Magnitude}\n")
+                lines.append("\n")
+
+            # max vals in XY
+            if hasXY:
+                lines.append("XY Plane\n")
+                lines.append(f"{mS} {self.ShearUnits.Label}, {mSxy}\n")
+                lines.append(f"{mM} {self.MomentUnits.Label}, {mBxy}\n")
+                lines.append(f"{mA} {self.AngleUnits.Label}, {mAxy}\n")
+                lines.append(f"{mD} {self.DeflectionUnits.Label}, {mDxy}\n")
+                lines.append("\n")
+
+            # max vals in XZ
+            if hasXZ:
+                lines.append("XZ Plane\n")
+                lines.append(f"{mS} {self.ShearUnits.Label}, {mSxz}\n")
+                lines.append(f"{mM} {self.MomentUnits.Label}, {mBxz}\n")
+                lines.append(f"{mA} {self.AngleUnits.Label}, {mAxz}\n")
+                lines.append(f"{mD} {self.DeflectionUnits.Label}, {mDxz}\n")
+                lines.append("\n")
+
+            # one buffered write for the summary, then optionally the full diagrams in chunks
             with open(filename, 'w') as resultsFile:
-                resultsFile.write("Beam Analysis Results\n")
-                
-                resultsFile.write("\n")
-                
-                resultsFile.write("Beam\n")
-                resultsFile.write(f"length:, {self.L}\n")
-                resultsFile.write(f"cross-section:, {self.CrossSection.CrossSectionType.name}\n")
-                resultsFile.write(f"E:, {self.E}\n")
-                resultsFile.write(f"I:, {self.I}\n") 
-                
-                resultsFile.write("\n")
-
-                # loads in XY
-                if hasXY:
-                    resultsFile.write("Applied Loads in XY\n")
-                    resultsFile.write("Load Type, Start, Stop, Magnitude\n")
-                    for load in self.SingularityXY.AppliedLoads:
-                        if isinstance(load, DistributedLoad):
-                            resultsFile.write(f"{load.AppliedLoadType.name}, {load.Start}, {load.Stop}, {load.Magnitude}\n")
-                        else:
-                            resultsFile.write(f"{load.AppliedLoadType.name}, {load.Location}, N/A, {load.Magnitude}\n")
-                    resultsFile.write("\n")
-                
-                # loads in XZ
-                if hasXZ:
-                    resultsFile.write("Applied Loads in XZ\n")
-                    resultsFile.write("Load Type, Start, Stop, Magnitude\n")
-                    for load in self.SingularityXZ.AppliedLoads:
-                        if isinstance(load, DistributedLoad):
-                            resultsFile.write(f"{load.AppliedLoadType.name}, {load.Start}, {load.Stop}, {load.Magnitude}\n")
-                        else:
-                            resultsFile.write(f"{load.AppliedLoadType.name}, {load.Location}, N/A, {load.Magnitude}\n")
-                    resultsFile.write("\n")
-                
-                # max vals in XY
-                if hasXY:
-                    resultsFile.write("XY Plane\n")
-                    resultsFile.write(f"{mS} {self.ShearUnits}, {mSxy}\n")
-                    resultsFile.write(f"{mM} {self.MomentUnits}, {mBxy}\n")
-                    resultsFile.write(f"{mA} {self.AngleUnits}, {mAxy}\n")
-                    resultsFile.write(f"{mD} {self.DeflectionUnits}, {mDxy}\n")
-                    resultsFile.write("\n")
-                
-                # max vals in XZ
-                if hasXZ:
-                    resultsFile.write("XZ Plane\n")
-                    resultsFile.write(f"{mS} {self.ShearUnits}, {mSxz}\n")
-                    resultsFile.write(f"{mM} {self.MomentUnits}, {mBxz}\n")
-                    resultsFile.write(f"{mA} {self.AngleUnits}, {mAxz}\n")
-                    resultsFile.write(f"{mD} {self.DeflectionUnits}, {mDxz}\n")
-                    resultsFile.write("\n")
-            print(f"done.")  
+                resultsFile.write("".join(lines))
+            if outputDiagrams:
+                export.writeCsv(result, filename.replace(".csv", "-diagrams.csv"))
+            instrument.endPhase(output)
+            print(f"done.")
+        
+        return result
 
     
-    def showPlots(self, xVals, xyParams, xzParams, w=12, h=6):
+    def showPlots(self, xVals, xyParams, xzParams, w=12, h=6, filename=None):
         """
         Makes plots of beam params and a 3d plot of final beam deflection.
 
@@ -347,120 +889,14 @@ class Beam(object):
         `xyParams` - a tuple of singularity values in xy: (xyShear, xyBending, xyAngle, xyDeflection)
 
         `xzParams` - a tuple of singularity values in xz: (xzShear, xzBending, xzAngle, xzDeflection)
-        """
-        """
-        PLOT LAYOUT
-        |    XY      |     XZ     |     3D Plot       |
-        |   Shear    |   Shear    |    |  /           |
-        |  Bending   |  Bending   |    | /            |
-        |   Angle    |   Angle    |    |/__________   |
-        | Deflection | Deflection |   /|              |
-        """
-        # Main Fig -> 1x2 figs (2D/3D)
-        # Left Fig -> 2x4 figs (XY/XZ plots)
-        # Right Fig -> 1x1 fig (3D plot)
-        fig_main = plt.figure(figsize=(w, h))
-        fig_main.suptitle("Beam Analysis Results")
-        
-        fig_left, fig_right = fig_main.subfigures(nrows=1, ncols=2)
-        fig_left.suptitle("2D")
-        fig_right.suptitle("3D")
-
-        # =================================== #
-        # ============ 2D Plots ============= #
-        # =================================== #
-        ax2d = fig_left.subplots(4, 2, sharex='col', sharey='row')
-        ax2d[0, 0].set_title("XY Plane")
-        ax2d[0, 1].set_title("XZ Plane")
 
-        # std plot params
-        n = len(xVals)
-        axis0 = [0]*n
+        `filename` - optionally render straight to this file (e.g. .png or .svg) instead of showing the plots
 
-        # plot styles
-        beamStyle = 'k--'
-        shearStyle = 'b-'
-        bendingStyle = 'r-'
-        angleStyle = 'y-'
-        deflectionStyle = 'g-'
-        
-        # plot Shear, Bending, Angle, and Deflection in 2D
-        # XY on left, XZ on right
-        ax2d[0, 0].set_ylabel(f"Shear {self.ShearUnits.Label}")
-        ax2d[0, 0].plot(xVals, axis0, beamStyle)
-        ax2d[0, 0].plot(xVals, xyParams[0], shearStyle)
-        
-        ax2d[1, 0].set_ylabel(f"Bending {self.MomentUnits.Label}")
-        ax2d[1, 0].plot(xVals, axis0, beamStyle)
-        ax2d[1, 0].plot(xVals, xyParams[1], bendingStyle)
-        
-        ax2d[2, 0].set_ylabel(f"Angle {self.AngleUnits.Label}")
-        ax2d[2, 0].plot(xVals, axis0, beamStyle)
-        ax2d[2, 0].plot(xVals, xyParams[2], angleStyle)
-
-        ax2d[3, 0].set_ylabel(f"Deflection {self.DeflectionUnits.Label}")
-        ax2d[3, 0].plot(xVals, axis0, beamStyle)
-        ax2d[3, 0].plot(xVals, xyParams[3], deflectionStyle)
-
-        ax2d[0, 1].plot(xVals, axis0, beamStyle)
-        ax2d[0, 1].plot(xVals, xzParams[0], shearStyle)
-
-        ax2d[1, 1].plot(xVals, axis0, beamStyle)
-        ax2d[1, 1].plot(xVals, xzParams[1], bendingStyle)
-
-        ax2d[2, 1].plot(xVals, axis0, beamStyle)
-        ax2d[2, 1].plot(xVals, xzParams[2], angleStyle)
-
-        ax2d[3, 1].plot(xVals, axis0, beamStyle)
-        ax2d[3, 1].plot(xVals, xzParams[3], deflectionStyle)
-
-        fig_left.align_ylabels()
+        Curves are decimated to about one point per pixel, always keeping their extremes and the load locations.
+        """
+        breakpoints = [s.Breakpoints for s in [self.SingularityXY, self.SingularityXZ] if s.Breakpoints is not None]
+        breakpoints = np.concatenate(breakpoints) if 0 < len(breakpoints) else []
 
-        
-        # =================================== #
-        # ============ 3D Plot ============== #
-        # =================================== #
-        ax3d = fig_right.add_subplot(111, projection='3d')
-
-        # convention is that y is vertical in 2d and z is vertical in 3d, 
-        # so swap to keep consistent feel across both
-        ax3d.set_xlabel("X")
-        ax3d.set_ylabel("Z")
-        ax3d.set_zlabel("Y")
-        
-        # calculate beam center coordinates
-        # dict format { x = [y, z] }
-        yzDeflectionByX = {}
-        for i in range(n):
-            yzDeflectionByX[xVals[i]] = [xyParams[3][i], xzParams[3][i]]
-        
-        # add beam mesh coordinates
-        beam3d = [[], [], []]
-        for ix in range(n):
-            if ix % 5 == 0:
-                xVal = xVals[ix]
-                yOffset, zOffset = yzDeflectionByX[xVal]
-                x, y, z = self.CrossSection.getPlotPoints(xVal, yOffset, zOffset)
-                beam3d[0].extend(x)
-                beam3d[1].extend(y)
-                beam3d[2].extend(z)
-        
-        # plot beam centerline and cross-sections
-        ax3d.plot(xVals, xzParams[3], xyParams[3], 'k--')
-        ax3d.plot(beam3d[0], beam3d[1], beam3d[2], 'b-', alpha=0.7)
-        
-        # axis lines
-        axMax = self.L/2
-        axPerp = np.linspace(-axMax, axMax, n)
-        ax3d.plot(xVals, axis0, axis0, 'k-')
-        ax3d.plot(axis0, axPerp, axis0, 'k-')
-        ax3d.plot(axis0, axis0, axPerp, 'k-')
-
-        # set axis scale
-        ax3d.set_xlim(0, self.L)
-        ax3d.set_ylim(-axMax, axMax)
-        ax3d.set_zlim(-axMax, axMax)
-
-        # size to fit ylabels on left
-        plt.subplots_adjust(left=0.2, right=0.9)
-        plt.show()
+        # matplotlib is only imported when plots are requested
+        from beam_analysis import plotting
+        plotting.showPlots(self, xVals, xyParams, xzParams, w=w, h=h, filename=filename, breakpoints=breakpoints)
@@ -0,0 +1,202 @@
+import numpy as np
+
+from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+from beam_analysis.Singularity import Singularity, getConstantsMatrix, solveSystem
+from beam_analysis.AppliedLoad import DistributedLoad, PointLoad, Moment
+from beam_analysis.BoundaryCondition import BoundaryCondition
+
+
+class BeamBatch(object):
+    """
+    Many beams sharing a length, load locations, and boundary conditions.
+
+    Load magnitudes, E, and I may differ per beam. All beams are solved together.
+    """
+    def __init__(self, l, e, i):
+        """
+        `l` - Beam length, shared by every beam
+
+        `e` - Young's Modulus, a scalar or an array with one value per beam
+
+        `i` - Moment of Intertia, a scalar or an array with one value per beam
+        """
+        self.L = l
+        self.E = np.asarray(e, dtype=float)
+        self.I = np.asarray(i, dtype=float)
+
+        # each load is stored with unit magnitude in its own Singularity,
+        # alongside the magnitudes of every beam
+        self.LoadsXY, self.MagnitudesXY = [], []
+        self.LoadsXZ, self.MagnitudesXZ = [], []
+        self.BoundaryConditions = []
+
+        self.C1XY, self.C2XY = None, None
+        self.C1XZ, self.C2XZ = None, None
+        self.ResidualXY, self.ResidualXZ = None, None
+
+
+    def addDistributedLoad(self, start, stop, magnitudes, angle):
+        """
+        `start` - start distance of the distributed load
+
+        `stop` - end distance of the distributed load
+
+        `magnitudes` - force of the distributed load, a scalar or one value per beam
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        if (start < 0 or self.L < stop or stop <= start):
+            raise Exception(f"invalid start / stop for Distributed Load: {start} / {stop}")
+        self.addAppliedLoad(DistributedLoad(start, stop, 1.0), magnitudes, angle)
+
+
+    def addPointLoad(self, location, magnitudes, angle):
+        """
+        `location` - the distance along the beam to the point load
+
+        `magnitudes` - force of the applied load, a scalar or one value per beam
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        if (location < 0 or self.L < location):
+            raise Exception(f"invalid location for Point Load: {location}")
+        self.addAppliedLoad(PointLoad(location, 1.0), magnitudes, angle)
+
+
+    def addAppliedMoment(self, location, magnitudes, angle):
+        """
+        `location` - the distance along the beam to the moment
+
+        `magnitudes` - moment, a scalar or one value per beam
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        if (location < 0 or self.L < location):
+            raise Exception(f"invalid location for Applied Moment: {location}")
+        self.addAppliedLoad(Moment(location, 1.0), magnitudes, angle)
+
+
+    def addAppliedLoad(self, unitLoad, magnitudes, angle):
+        """
+        `unitLoad` - distributed load, point load, moment with a magnitude of 1
+
+        `magnitudes` - a scalar or one value per beam
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        magnitudes = np.asarray(magnitudes, dtype=float)
+
+        rads = angle * (np.pi / 180)
+        xyComp = np.cos(rads)
+        if (xyComp != 0):
+            self.LoadsXY.append(self.getUnitSingularity(unitLoad))
+            self.MagnitudesXY.append(xyComp * magnitudes)
+
+        xzComp = np.sin(rads)
+        if (xzComp != 0):
+            self.LoadsXZ.append(self.getUnitSingularity(unitLoad))
+            self.MagnitudesXZ.append(xzComp * magnitudes)
+
+
+    def addBoundaryCondition(self, location, boundaryConditionType, boundaryConditionValue):
+        """
+        `location` - the distance along the beam to the boundary condition
+
+        `boundaryConditionType` - the type of the boundary condition. e.g: ANGLE, DEFLECTION
+
+        `boundaryConditionValue` - the value of the boundary condition, typically 0
+        """
+        if (location < 0 or self.L < location):
+            raise Exception(f"invalid location for Boundary Condition: {location}")
+        self.BoundaryConditions.append(BoundaryCondition(location, boundaryConditionType, boundaryConditionValue))
+
+
+    def getUnitSingularity(self, unitLoad):
+        """
+        returns a Singularity holding only `unitLoad`, with E*I = 1 so angle and deflection are unscaled
+        """
+        unitSingularity = Singularity(self.L, 1, 1)
+        unitSingularity.addAppliedLoad(unitLoad)
+        return unitSingularity
+
+
+    def getBeamCount(self):
+        """
+        returns the number of beams, broadcast from E, I, and every load's magnitudes
+        """
+        shapes = [self.E.shape, self.I.shape] + [np.shape(m) for m in self.MagnitudesXY + self.MagnitudesXZ]
+        return int(np.prod(np.broadcast_shapes(*shapes), dtype=int))
+
+
+    def getMagnitudes(self, loads, magnitudes):
+        """
+        returns a (beams x loads) matrix of load magnitudes
+        """
+        n = self.getBeamCount()
+        if len(loads) == 0:
+            return np.zeros((n, 0))
+        return np.stack([np.broadcast_to(m, (n,)) for m in magnitudes], axis=1)
+
+
+    def getBasis(self, loads, xVals, beamAnalysisType):
+        """
+        returns a (loads x len(xVals)) matrix of each unit load evaluated over `xVals`
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        if len(loads) == 0:
+            return np.zeros((0, len(xVals)))
+        return np.stack([load.evaluateOver(xVals, beamAnalysisType, includeConstants=False) for load in loads])
+
+
+    def solve(self):
+        """
+        Solves C1 and C2 for every beam and both planes with a single linear solve over every boundary condition,
+        by least squares when overdetermined
+        """
+        n = self.getBeamCount()
+        ei = np.broadcast_to(self.E * self.I, (n,))
+
+        boundaryConditions = self.BoundaryConditions
+        a = getConstantsMatrix(boundaryConditions)
+
+        # right hand side: (boundary conditions x [XY beams, XZ beams])
+        b = np.zeros((len(boundaryConditions), 2 * n))
+        for row, bc in enumerate(boundaryConditions):
+            bat = BeamAnalysisTypes[bc.Type.name]
+            xyLoads = self.getMagnitudes(self.LoadsXY, self.MagnitudesXY) @ self.getBasis(self.LoadsXY, [bc.Location], bat)
+            xzLoads = self.getMagnitudes(self.LoadsXZ, self.MagnitudesXZ) @ self.getBasis(self.LoadsXZ, [bc.Location], bat)
+            b[row, :n] = ei * bc.Value - xyLoads[:, 0]
+            b[row, n:] = ei * bc.Value - xzLoads[:, 0]
+
+        c, residual = solveSystem(a, b)
+        self.C1XY, self.C2XY = c[0, :n], c[1, :n]
+        self.C1XZ, self.C2XZ = c[0, n:], c[1, n:]
+        self.ResidualXY, self.ResidualXZ = residual[:n], residual[n:]
+
+
+    def evaluateOver(self, xVals):
+        """
+        `xVals` - array of distances along the beam shared by every beam
+
+        returns a tuple of arrays `(xy, xz)`, each of shape (beams x len(xVals) x 4) ordered (shear, bending, angle, deflection)
+
+        `NOTE` - must call solve() before evaluating
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        n = self.getBeamCount()
+        ei = np.broadcast_to(self.E * self.I, (n,))[:, None]
+
+        results = []
+        for loads, magnitudes, c1, c2 in [(self.LoadsXY, self.MagnitudesXY, self.C1XY, self.C2XY), (self.LoadsXZ, self.MagnitudesXZ, self.C1XZ, self.C2XZ)]:
+            result = np.zeros((n, len(xVals), len(BeamAnalysisTypes)))
+            m = self.getMagnitudes(loads, magnitudes)
+            for bat in BeamAnalysisTypes:
+                vals = m @ self.getBasis(loads, xVals, bat)
+                if bat == BeamAnalysisTypes.ANGLE:
+                    vals = (vals + c1[:, None]) / ei
+                elif bat == BeamAnalysisTypes.DEFLECTION:
+                    vals = (vals + c1[:, None] * xVals + c2[:, None]) / ei
+                result[:, :, bat.value - 1] = vals
+            results.append(result)
+
+        return results[0], results[1]
@@ -7,6 +7,8 @@ class BoundaryConditionTypes(Enum):
 
 
 class BoundaryCondition(object):
+    __slots__ = ("Location", "Type", "Value")
+
     def __init__(self, location, type, value):
         """
         `location` - the distance along the beam to the boundary condition
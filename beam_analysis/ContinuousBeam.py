@@ -0,0 +1,321 @@
+import numpy as np
+
+from beam_analysis.AnalysisResult import AnalysisResult
+from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+from beam_analysis.Singularity import Singularity
+from beam_analysis.AppliedLoad import AppliedLoadTypes, DistributedLoad, PointLoad, Moment
+from beam_analysis.Support import Support, SupportTypes
+
+# scipy is optional, solveTridiagonal() falls back to the Thomas algorithm
+try:
+    from scipy.linalg import solve_banded
+except ImportError:
+    solve_banded = None
+
+
+def solveTridiagonal(lower, diagonal, upper, b):
+    """
+    `lower` - (n - 1) sub-diagonal
+
+    `diagonal` - (n) main diagonal
+
+    `upper` - (n - 1) super-diagonal
+
+    `b` - right hand side, (n,) or (n x systems)
+
+    Solves in O(n) with scipy.linalg.solve_banded when available, otherwise with the Thomas algorithm
+    (no pivoting, the three-moment equations are diagonally dominant).
+
+    returns the solution, shaped as `b`
+    """
+    n = len(diagonal)
+    if solve_banded is not None:
+        ab = np.zeros((3, n))
+        ab[0, 1:] = upper
+        ab[1] = diagonal
+        ab[2, :-1] = lower
+        return solve_banded((1, 1), ab, b)
+
+    b = np.array(b, dtype=float)
+    c = np.zeros(n)
+    d = np.array(diagonal, dtype=float)
+    for k in range(1, n):
+        c[k - 1] = upper[k - 1] / d[k - 1]
+        d[k] -= lower[k - 1] * c[k - 1]
+        b[k] -= lower[k - 1] * b[k - 1] / d[k - 1]
+
+    b[n - 1] /= d[n - 1]
+    for k in range(n - 2, -1, -1):
+        b[k] = b[k] / d[k] - c[k] * b[k + 1]
+    return b
+
+
+class ContinuousBeam(object):
+    """
+    A beam continuous over many supports.
+
+    Each span is a simply supported Singularity. The bending moments over the supports are the unknowns,
+    found from slope compatibility at every interior support (the three-moment equations), one tridiagonal system per plane.
+    """
+    def __init__(self, l, e, i, iy=None):
+        """
+        `l` - Beam length
+
+        `e` - Young's Modulus
+
+        `i` - Moment of Intertia, resisting bending in XY
+
+        `iy` - optional Moment of Inertia resisting bending in XZ, default is `i`
+        """
+        self.L = l
+        self.E = e
+        self.Iz = i
+        self.Iy = i if iy is None else iy
+        self.I = self.Iz
+
+        self.Supports = []
+        self.LoadsXY = []
+        self.LoadsXZ = []
+
+        # solved state, see solve()
+        self.Spans = None
+        self.SpansXY = None
+        self.SpansXZ = None
+        self.SupportMoments = None
+
+
+    def addSupport(self, location, supportType):
+        """
+        `location` - the distance along the beam to the support
+
+        `supportType` - PIN or ROLLER, or FIXED at either end of the beam
+        """
+        if (location < 0 or self.L < location):
+            raise Exception(f"invalid location for Support: {location}")
+
+        self.Supports.append(Support(location, supportType))
+        self.Spans = None
+
+
+    def addDistributedLoad(self, start, stop, magnitude, angle):
+        """
+        `start` - start distance of the distributed load
+
+        `stop` - end distance of the distributed load
+
+        `magnitude` - force of the distributed load
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        if (start < 0 or self.L < stop or stop <= start):
+            raise Exception(f"invalid start / stop for Distributed Load: {start} / {stop}")
+        self.addAppliedLoad(lambda m: DistributedLoad(start, stop, m), magnitude, angle)
+
+
+    def addPointLoad(self, location, magnitude, angle):
+        """
+        `location` - the distance along the beam to the point load
+
+        `magnitude` - force of the applied load
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        if (location < 0 or self.L < location):
+            raise Exception(f"invalid location for Point Load: {location}")
+        self.addAppliedLoad(lambda m: PointLoad(location, m), magnitude, angle)
+
+
+    def addAppliedMoment(self, location, magnitude, angle):
+        """
+        `location` - the distance along the beam to the moment
+
+        `magnitude` - moment
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        if (location < 0 or self.L < location):
+            raise Exception(f"invalid location for Applied Moment: {location}")
+        self.addAppliedLoad(lambda m: Moment(location, m), magnitude, angle)
+
+
+    def addAppliedLoad(self, makeLoad, magnitude, angle):
+        """
+        `makeLoad` - function returning the distributed load, point load, or moment for a given magnitude
+
+        `magnitude` - magnitude of the load
+
+        `angle` - degrees from the XY axis towards the XZ axis
+        """
+        rads = angle * (np.pi / 180)
+        xyComp = np.cos(rads)
+        if (xyComp != 0):
+            self.LoadsXY.append(makeLoad(xyComp * magnitude))
+
+        xzComp = np.sin(rads)
+        if (xzComp != 0):
+            self.LoadsXZ.append(makeLoad(xzComp * magnitude))
+        self.Spans = None
+
+
+    def getSupportLocations(self):
+        """
+        returns the sorted support locations, checking that they run from 0 to L with fixed supports only at the ends
+        """
+        supports = sorted(self.Supports, key=lambda support: support.Location)
+        locations = np.array([support.Location for support in supports], dtype=float)
+        if len(locations) < 2 or locations[0] != 0 or locations[-1] != self.L:
+            raise Exception("ContinuousBeam requires at least two supports, with one at each end of the beam")
+        if np.any(np.diff(locations) <= 0):
+            raise Exception("ContinuousBeam supports must be at distinct locations")
+        if any(support.SupportType == SupportTypes.FIXED for support in supports[1:-1]):
+            raise Exception("ContinuousBeam supports may only be FIXED at the ends of the beam")
+        return locations, supports
+
+
+    def getSpanSingularity(self, span, loads, i):
+        """
+        `span` - index of the span
+
+        `loads` - loads in one plane, in beam coordinates
+
+        `i` - Moment of Inertia of the plane
+
+        returns a simply supported Singularity of the span carrying the part of `loads` on it, in span coordinates
+        """
+        start, stop = self.Spans[span], self.Spans[span + 1]
+        length = stop - start
+        singularity = Singularity(length, self.E, i)
+        singularity.addSupport(Support(0, SupportTypes.PIN))
+        singularity.addSupport(Support(length, SupportTypes.ROLLER))
+
+        last = span == len(self.Spans) - 2
+        for load in loads:
+            if load.AppliedLoadType == AppliedLoadTypes.DISTRIBUTED_LOAD:
+                a, b = max(load.Start, start), min(load.Stop, stop)
+                if a < b:
+                    singularity.addAppliedLoad(DistributedLoad(a - start, b - start, load.Magnitude))
+            elif start <= load.Location < stop or (last and load.Location == stop):
+                singularity.addAppliedLoad(type(load)(load.Location - start, load.Magnitude))
+        return singularity
+
+
+    def solve(self):
+        """
+        Solves the support moments of both planes together, then the reactions of every span.
+
+        For span k of length L with end moments M_k, M_k+1, the end slopes are linear in the end moments.
+        Equal slopes either side of each interior support, zero slope at fixed ends, and zero moment at pinned ends
+        give one tridiagonal equation per support.
+        """
+        locations, supports = self.getSupportLocations()
+        self.Spans = locations
+        spanCount = len(locations) - 1
+
+        # slopes at each end of every span from the loads (per plane) and from unit end moments
+        spansXY = [self.getSpanSingularity(k, self.LoadsXY, self.Iz) for k in range(spanCount)]
+        spansXZ = [self.getSpanSingularity(k, self.LoadsXZ, self.Iy) for k in range(spanCount)]
+        loadSlopes = np.zeros((spanCount, 2, 2))
+        momentSlopes = np.zeros((spanCount, 2, 2))
+        for k in range(spanCount):
+            for plane, span in enumerate([spansXY[k], spansXZ[k]]):
+                span.solve()
+                loadSlopes[k, :, plane] = [span.evaluateAt(0, BeamAnalysisTypes.ANGLE), span.evaluateAt(span.L, BeamAnalysisTypes.ANGLE)]
+
+            # internal moment M at x = 0 is Moment(0, M), at x = L it is Moment(L, -M)
+            lines = spansXY[k].getInfluenceLines([0, spansXY[k].L], [0, spansXY[k].L], AppliedLoadTypes.MOMENT)
+            momentSlopes[k] = lines[BeamAnalysisTypes.ANGLE.value - 1].T * [1, -1]
+
+        # the moment slopes are for XY, so scale the XZ load slopes by Iy / Iz to share one system
+        loadSlopes[:, :, 1] *= self.Iy / self.Iz
+
+        # row j: slope at the right of span j - 1 equals slope at the left of span j
+        n = len(locations)
+        lower, diagonal, upper = np.zeros(n - 1), np.zeros(n), np.zeros(n - 1)
+        b = np.zeros((n, 2))
+        for j in range(n):
+            if j == 0 or j == n - 1:
+                if supports[j].SupportType != SupportTypes.FIXED:
+                    diagonal[j] = 1
+                    continue
+            if 0 < j:
+                lower[j - 1] = momentSlopes[j - 1, 1, 0]
+                diagonal[j] += momentSlopes[j - 1, 1, 1]
+                b[j] -= loadSlopes[j - 1, 1]
+            if j < n - 1:
+                diagonal[j] -= momentSlopes[j, 0, 0]
+                upper[j] = -momentSlopes[j, 0, 1]
+                b[j] += loadSlopes[j, 0]
+
+        moments = solveTridiagonal(lower, diagonal, upper, b)
+
+        # apply the end moments to each span, updating the solved spans in place
+        for k in range(spanCount):
+            for plane, span in enumerate([spansXY[k], spansXZ[k]]):
+                span.addAppliedLoad(Moment(0, moments[k, plane]))
+                span.addAppliedLoad(Moment(span.L, -moments[k + 1, plane]))
+
+        self.SpansXY, self.SpansXZ = spansXY, spansXZ
+        self.SupportMoments = moments.T
+
+
+    def getReactions(self):
+        """
+        returns a (2 x supports) array of the force reaction at each support in (XY, XZ), ordered by location
+        """
+        if self.Spans is None:
+            self.solve()
+
+        reactions = np.zeros((2, len(self.Spans)))
+        for plane, spans in enumerate([self.SpansXY, self.SpansXZ]):
+            for k, span in enumerate(spans):
+                reactions[plane, k] += span.Reactions[0].Magnitude
+                reactions[plane, k + 1] += span.Reactions[1].Magnitude
+        return reactions
+
+
+    def evaluateOver(self, xVals):
+        """
+        `xVals` - array of distances along the beam
+
+        returns a (2 x 4 x len(xVals)) array of the responses in (XY, XZ), ordered (shear, bending, angle, deflection).
+        At a support, the span to its right is used.
+        """
+        if self.Spans is None:
+            self.solve()
+
+        xVals = np.asarray(xVals, dtype=float)
+        spanIndices = np.clip(np.searchsorted(self.Spans, xVals, side="right") - 1, 0, len(self.Spans) - 2)
+
+        vals = np.zeros((2, len(BeamAnalysisTypes), len(xVals)))
+        for plane, spans in enumerate([self.SpansXY, self.SpansXZ]):
+            for k, span in enumerate(spans):
+                at = spanIndices == k
+                if np.any(at):
+                    vals[plane, :, at] = np.stack(span.evaluateAllOver(xVals[at] - self.Spans[k])).T
+        return vals
+
+
+    def analyze(self, n=10**3):
+        """
+        `n` - optional number of data points to run the analysis, default is 10^3
+
+        returns an AnalysisResult. There is no single pair of constants for a continuous beam, so `Constants` are NaN.
+        """
+        self.solve()
+        xVals = np.linspace(0, self.L, n)
+        vals = self.evaluateOver(xVals)
+
+        # exact extrema of each span, keeping the largest over all spans
+        locations, values = np.zeros((2, len(BeamAnalysisTypes))), np.zeros((2, len(BeamAnalysisTypes)))
+        for plane, spans in enumerate([self.SpansXY, self.SpansXZ]):
+            for k, span in enumerate(spans):
+                spanLocations, spanValues = span.getExtrema()
+                larger = abs(values[plane]) < abs(spanValues)
+                locations[plane, larger] = spanLocations[larger] + self.Spans[k]
+                values[plane, larger] = spanValues[larger]
+
+        return AnalysisResult(
+            xVals, vals[0], vals[1], np.full((2, 2), np.nan), locations, values,
+            hasXY=0 < len(self.LoadsXY),
+            hasXZ=0 < len(self.LoadsXZ)
+        )
@@ -8,6 +8,70 @@ class CrossSectionTypes(Enum):
     I = 3
 
 
+# section properties, in the order of getSectionProperties()
+PROPERTY_NAMES = ["A", "Iz", "Iy", "Sz", "Sy", "J"]
+
+
+def getSectionProperties(crossSectionType, dims):
+    """
+    `crossSectionType` - RECT, CIRC, I
+
+    `dims` - (sections x dims) array, or one section's dims, in the order described by CrossSection
+
+    returns a (sections x 6) array (or (6,) for one section) of the properties in PROPERTY_NAMES:
+        A       -   area
+
+        Iz, Iy  -   second moments of area about the horizontal (z) and vertical (y) axes, resisting bending in XY and XZ
+
+        Sz, Sy  -   elastic section moduli about z and y
+
+        J       -   torsion constant
+    """
+    dims = np.asarray(dims, dtype=float)
+    single = dims.ndim == 1
+    dims = np.atleast_2d(dims)
+
+    if crossSectionType == CrossSectionTypes.RECT:
+        w, h = dims[:, 0], dims[:, 1]
+        a, b = np.maximum(w, h), np.minimum(w, h)
+        props = [
+            w * h,
+            w * h**3 / 12,
+            h * w**3 / 12,
+            w * h**2 / 6,
+            h * w**2 / 6,
+            a * b**3 * (1 / 3 - 0.21 * (b / a) * (1 - b**4 / (12 * a**4)))
+        ]
+    elif crossSectionType == CrossSectionTypes.CIRC:
+        r = dims[:, 0]
+        props = [
+            np.pi * r**2,
+            np.pi * r**4 / 4,
+            np.pi * r**4 / 4,
+            np.pi * r**3 / 4,
+            np.pi * r**3 / 4,
+            np.pi * r**4 / 2
+        ]
+    elif crossSectionType == CrossSectionTypes.I:
+        b, h, tf, tw = dims[:, 0], dims[:, 1], dims[:, 2], dims[:, 3]
+        wH = h - 2 * tf  # inner web height
+        iz = (b * h**3 - (b - tw) * wH**3) / 12
+        iy = (2 * tf * b**3 + wH * tw**3) / 12
+        props = [
+            2 * b * tf + wH * tw,
+            iz,
+            iy,
+            iz / (h / 2),
+            iy / (b / 2),
+            (2 * b * tf**3 + wH * tw**3) / 3
+        ]
+    else:
+        raise Exception(f"Invalid crossSectionType: {crossSectionType}")
+
+    props = np.column_stack(props)
+    return props[0] if single else props
+
+
 class CrossSection(object):
     def __init__(self, crossSectionType, dims=None):
         """
@@ -29,46 +93,173 @@ class CrossSection(object):
             raise Exception(f"Cannot create CrossSection {crossSectionType} without any dimensions")
         
         self.Dims = dims
+        self.Properties = None
+        self.PropertiesKey = None
     
 
+    def getProperties(self):
+        """
+        returns the (6,) array of section properties in PROPERTY_NAMES, computed once and cached until `Dims` change
+        """
+        key = tuple(self.Dims)
+        if self.PropertiesKey != key:
+            self.Properties = getSectionProperties(self.CrossSectionType, self.Dims)
+            self.PropertiesKey = key
+        return self.Properties
+
+
     def getArea(self):
-        if self.CrossSectionType == CrossSectionTypes.RECT:
-            return self.Dims[0] * self.Dims[1]
-        if self.CrossSectionType == CrossSectionTypes.CIRC:
-            return np.pi * self.Dims[0]**2
-        if self.CrossSectionType == CrossSectionTypes.I:
-            # 2 x Flanges + Web
-            return 2 * self.Dims[0] * self.Dims[2] + (self.Dims[1] - 2 * self.Dims[2]) * self.Dims[3]
+        return self.getProperties()[0]
     
 
     def getI(self):
+        """
+        returns the strong axis second moment of area, Iz
+        """
+        return self.getIz()
+    
+
+    def getIz(self):
+        """
+        returns the second moment of area about the horizontal (z) axis, resisting bending in XY
+        """
+        return self.getProperties()[1]
+    
+
+    def getIy(self):
+        """
+        returns the second moment of area about the vertical (y) axis, resisting bending in XZ
+        """
+        return self.getProperties()[2]
+    
+
+    def getSz(self):
+        """
+        returns the elastic section modulus about z, Iz / (distance to the extreme fiber in y)
+        """
+        return self.getProperties()[3]
+    
+
+    def getSy(self):
+        """
+        returns the elastic section modulus about y, Iy / (distance to the extreme fiber in z)
+        """
+        return self.getProperties()[4]
+    
+
+    def getJ(self):
+        """
+        returns the torsion constant
+        """
+        return self.getProperties()[5]
+    
+
+    def getRadiusOfGyration(self):
+        """
+        returns `(rz, ry)`, the radii of gyration sqrt(I / A) about z and y
+        """
+        a, iz, iy = self.getProperties()[:3]
+        return np.sqrt(iz / a), np.sqrt(iy / a)
+    
+
+    def getOutline(self, n=20):
+        """
+        `n` - number of points about the perimeter of a CIRC section
+
+        returns an (m x 2) array of the perimeter's (horizontal, vertical) coordinates about the centroid, in order and not closed:
+            RECT    -   the 4 corners
+
+            CIRC    -   `n` points
+
+            I       -   the 12 corners
+        """
         if self.CrossSectionType == CrossSectionTypes.RECT:
-            return (1 / 12) * self.Dims[0] * self.Dims[1] **3
+            w, h = self.Dims[0] / 2, self.Dims[1] / 2
+            return np.array([[-w, h], [w, h], [w, -h], [-w, -h]], dtype=float)
         if self.CrossSectionType == CrossSectionTypes.CIRC:
-            return (np.pi / 4) * self.Dims[0] ** 4
+            r = self.Dims[0]
+            th = np.arange(n) * (2 * np.pi / n)
+            return np.column_stack((np.cos(th) * r, np.sin(th) * r))
         if self.CrossSectionType == CrossSectionTypes.I:
-            wH = self.Dims[1] - 2 * self.Dims[2]  # inner web height
-            iW = (1 / 12) * wH  # web inertia
-            iF = (1 / 12) * (wH * self.Dims[2]**3) / 12 + (1 / 4) * self.Dims[2] * self.Dims[0] * self.Dims[3]**2  # flange inertia
-            return iW + 2 * iF
+            b, h = self.Dims[0] / 2, self.Dims[1] / 2
+            f, t = h - self.Dims[2], self.Dims[3] / 2
+            return np.array([
+                [-b, h], [b, h], [b, f], [t, f], [t, -f], [b, -f],
+                [b, -h], [-b, -h], [-b, -f], [-t, -f], [-t, f], [-b, f]
+            ], dtype=float)
     
 
-    def getPlotPoints(self, xOffset, yOffset, zOffset, n=20):
+    def getStressPoints(self, n=20):
         """
-        returns n x,y,z points about the perimeter of the CrossSection
+        `n` - number of grid points across the width and height, rounded up to odd so the grid holds the centroidal axes
+
+        returns an (m x 2) array of (horizontal, vertical) points about the centroid to evaluate stresses at:
+        the outline, which holds the extreme fibers, and an `n` x `n` grid clipped to the section, which holds the neutral axes
         """
-        x, y, z = [], [], []
+        outline = self.getOutline(n)
+        if self.CrossSectionType == CrossSectionTypes.CIRC:
+            b = h = self.Dims[0]
+        else:
+            b, h = self.Dims[0] / 2, self.Dims[1] / 2
+        n += 1 - n % 2
+        z, y = np.meshgrid(np.linspace(-b, b, n), np.linspace(-h, h, n))
+        z, y = z.ravel(), y.ravel()
+        if self.CrossSectionType == CrossSectionTypes.CIRC:
+            inside = z**2 + y**2 <= self.Dims[0]**2
+        elif self.CrossSectionType == CrossSectionTypes.I:
+            inside = (h - self.Dims[2] <= abs(y)) | (abs(z) <= self.Dims[3] / 2)
+        else:
+            inside = np.ones(len(z), dtype=bool)
+        return np.vstack((outline, np.column_stack((z[inside], y[inside]))))
+
+
+    def getShearFactors(self, points):
+        """
+        `points` - (m x 2) array of (horizontal, vertical) points about the centroid
+
+        returns an (m x 2) array of Q / t at each point, for shear in (y, z), so the transverse shear stress is V * Q / (I * t).
+        For an I section, shear in z is taken by the flanges alone.
+        """
+        z, y = points[:, 0], points[:, 1]
         if self.CrossSectionType == CrossSectionTypes.RECT:
-            # TODO
-            pass
+            w, h = self.Dims[0] / 2, self.Dims[1] / 2
+            return np.column_stack(((h**2 - y**2) / 2, (w**2 - z**2) / 2))
         if self.CrossSectionType == CrossSectionTypes.CIRC:
             r = self.Dims[0]
-            ith = 2 * np.pi / n  # radian fraction
-            for i in range(0, n):
-                x.append(xOffset)
-                y.append(zOffset + np.cos(ith * i) * r)
-                z.append(yOffset + np.sin(ith * i) * r)
-            return x, y, z
+            return np.column_stack(((r**2 - y**2) / 3, (r**2 - z**2) / 3))
         if self.CrossSectionType == CrossSectionTypes.I:
-            # TODO
-            pass
+            b, h = self.Dims[0], self.Dims[1] / 2
+            tf, tw = self.Dims[2], self.Dims[3]
+            f = h - tf
+            flange = (h**2 - y**2) / 2
+            web = (b * tf * (h - tf / 2) + tw * (f**2 - y**2) / 2) / tw
+            flangeZ = np.where(f <= abs(y), np.maximum((b**2 / 4 - z**2) / 2, 0), 0)
+            return np.column_stack((np.where(f < abs(y), flange, web), flangeZ))
+
+
+    def getMesh(self, xVals, yOffsets, zOffsets, n=20):
+        """
+        `xVals` - array of distances along the beam
+
+        `yOffsets` - array of the centroid's offset in y (e.g. xy deflection) at each x
+
+        `zOffsets` - array of the centroid's offset in z (e.g. xz deflection) at each x
+
+        `n` - number of points about the perimeter of a CIRC section
+
+        returns an (len(xVals) x m x 3) array of the perimeter at every x, in plot coordinates (x, z, y)
+        """
+        outline = self.getOutline(n)
+        xVals = np.asarray(xVals, dtype=float)
+        mesh = np.empty((len(xVals), len(outline), 3))
+        mesh[:, :, 0] = xVals[:, None]
+        mesh[:, :, 1] = np.asarray(zOffsets, dtype=float)[:, None] + outline[:, 0]
+        mesh[:, :, 2] = np.asarray(yOffsets, dtype=float)[:, None] + outline[:, 1]
+        return mesh
+    
+
+    def getPlotPoints(self, xOffset, yOffset, zOffset, n=20):
+        """
+        returns x, y, z arrays of points about the perimeter of the CrossSection, in plot coordinates (x, z, y)
+        """
+        return tuple(self.getMesh([xOffset], [yOffset], [zOffset], n)[0].T)
@@ -0,0 +1,47 @@
+import numpy as np
+
+
+class EnvelopeResult(object):
+    """
+    Maximum and minimum responses over many load cases, e.g. from Beam.movingLoad(), held as NumPy arrays.
+
+    Responses are ordered (shear, bending, angle, deflection), planes are ordered (XY, XZ).
+    """
+    def __init__(self, xVals, cases, maxima, minima, maxCases, minCases):
+        """
+        `xVals` - array of points along the beam (x-axis)
+
+        `cases` - array labelling each load case, e.g. load positions
+
+        `maxima`, `minima` - (2 x 4 x len(xVals)) arrays of the largest and smallest response at every x over all cases
+
+        `maxCases`, `minCases` - (2 x 4 x len(xVals)) arrays of the index into `cases` giving each maximum and minimum
+        """
+        self.X = np.asarray(xVals, dtype=float)
+        self.Cases = np.asarray(cases)
+        self.Max = np.asarray(maxima, dtype=float)
+        self.Min = np.asarray(minima, dtype=float)
+        self.MaxCases = np.asarray(maxCases, dtype=int)
+        self.MinCases = np.asarray(minCases, dtype=int)
+
+
+    def getAbsMax(self):
+        """
+        returns a (2 x 4 x len(X)) array of the largest absolute response at every x
+        """
+        return np.maximum(abs(self.Max), abs(self.Min))
+
+
+    def getCritical(self):
+        """
+        returns `(cases, locations, values)` arrays of shape (2 x 4): the load case and location giving
+        the largest absolute response in each plane, and that response (signed)
+        """
+        useMax = abs(self.Min) <= abs(self.Max)
+        envelope = np.where(useMax, self.Max, self.Min)
+        indices = np.where(useMax, self.MaxCases, self.MinCases)
+
+        at = np.argmax(abs(envelope), axis=-1)[..., None]
+        values = np.take_along_axis(envelope, at, axis=-1)[..., 0]
+        cases = self.Cases[np.take_along_axis(indices, at, axis=-1)[..., 0]]
+        return cases, self.X[at[..., 0]], values
@@ -1,16 +1,51 @@
 """
-TODO this is not in use by the package but may be incoorperated later...
+Stress states and failure theories.
+getStressField() evaluates bending and transverse shear stresses along a beam and across its CrossSection.
 """
+import numpy as np
+
+from beam_analysis.StressResult import StressResult
+
+
+def getStressField(crossSection, xVals, shears, moments, n=20):
+    """
+    `crossSection` - the CrossSection of the beam
+
+    `xVals` - array of points along the beam (x-axis)
+
+    `shears` - (2 x len(xVals)) array of the shear in (XY, XZ)
+
+    `moments` - (2 x len(xVals)) array of the bending moment in (XY, XZ)
+
+    `n` - number of grid points across the section, see CrossSection.getStressPoints()
+
+    returns a StressResult over (xVals x section points), with the bending stress -(M_XY * y / Iz + M_XZ * z / Iy)
+    and the transverse shear stress V * Q / (I * t) of both planes combined
+    """
+    shears, moments = np.asarray(shears, dtype=float), np.asarray(moments, dtype=float)
+    points = crossSection.getStressPoints(n)
+    iz, iy = crossSection.getIz(), crossSection.getIy()
+
+    # (len(xVals) x 1) against (1 x points)
+    normal = -(moments[0][:, None] * (points[:, 1] / iz) + moments[1][:, None] * (points[:, 0] / iy))
+    factors = crossSection.getShearFactors(points)
+    shear = np.hypot(shears[0][:, None] * (factors[:, 0] / iz), shears[1][:, None] * (factors[:, 1] / iy))
+    return StressResult(xVals, points, normal, shear)
 
 
 class StressElement(object):
-    def __init__(self, sigmaX, sigmaY, sigmaZ, shearXY=0, shearYZ=0, shearZX=0):
+    def __init__(self, sigmaX, sigmaY, sigmaZ, shearXY=0, shearYZ=0, shearZX=0, verbose=False):
+        """
+        `verbose` - optionally print the principal stresses and failure analyses
+        """
         self.SigmaX = sigmaX
         self.SigmaY = sigmaY
         self.SigmaZ = sigmaZ
         self.ShearXY = shearXY
         self.ShearYZ = shearYZ
         self.ShearZX = shearZX
+        self.Verbose = verbose
+        self.YieldStrength = None
         # obtain principle stresses
         if shearXY == 0 and shearYZ == 0 and shearZX == 0:
             self.Sigma1 = sigmaX
@@ -25,10 +60,11 @@ class StressElement(object):
             self.Sigma3 = 0
             self.R = r
         
-        print(f"Sigma1:         {self.Sigma1}")
-        print(f"Sigma2:         {self.Sigma2}")
-        print(f"Sigma3:         {self.Sigma3}")
-        print(f"R:              {self.R}")
+        if self.Verbose:
+            print(f"Sigma1:         {self.Sigma1}")
+            print(f"Sigma2:         {self.Sigma2}")
+            print(f"Sigma3:         {self.Sigma3}")
+            print(f"R:              {self.R}")
     
 
     def setYieldStrength(self, yieldStrength):
@@ -60,37 +96,43 @@ class StressElement(object):
         Ductile Materials:
             "MSS" - maximum shear stress theory
             "DE"  - distortion energy theory
+
+        returns `(stress, fos)`, the equivalent stress and its factor of safety (None without a yield strength)
         """
 
         if analysis == "MSS":
             # Mohr circle maximization, uses principle stresses
-            t1 = (self.Sigma1 - self.Sigma2)
-            t2 = (self.Sigma2 - self.Sigma3)
-            t3 = (self.Sigma1 - self.Sigma3)
+            t1 = abs(self.Sigma1 - self.Sigma2)
+            t2 = abs(self.Sigma2 - self.Sigma3)
+            t3 = abs(self.Sigma1 - self.Sigma3)
             shears = [t1, t2, t3]
-            vm = max(shears)
+            stress = max(shears)
 
-            print(f"\nMaximm Shear Stress Theory")
-            print(f"Shears:         {shears}")
-            print(f"Max Stress:     {vm}")
-            print(f"FOS:            {self.getFos(vm)}")
+            if self.Verbose:
+                print(f"\nMaximm Shear Stress Theory")
+                print(f"Shears:         {shears}")
         
         elif analysis == "DE":
             # plug into 3d von mises formula
             stresses = (self.SigmaX - self.SigmaY)**2 + (self.SigmaY - self.SigmaZ)**2 + (self.SigmaZ - self.SigmaX)**2
             shears = (self.ShearXY**2 + self.ShearYZ**2 + self.ShearZX**2)
-            de = (1/(2**.5))*(stresses + 6 * shears)**.5
+            stress = (1/(2**.5))*(stresses + 6 * shears)**.5
             
-            print(f"\nDistortion Energy Theory")
-            print(f"Max Stress:     {de}")
-            print(f"FOS:            {self.getFos(de)}")
+            if self.Verbose:
+                print(f"\nDistortion Energy Theory")
         
         else:
             raise Exception(f"No analysis named {analysis}")
 
+        fos = self.getFos(stress)
+        if self.Verbose:
+            print(f"Max Stress:     {stress}")
+            print(f"FOS:            {fos}")
+        return stress, fos
+
 
 if __name__ == "__main__":
-    Se = StressElement(-30, -65, 0, shearXY=40)
+    Se = StressElement(-30, -65, 0, shearXY=40, verbose=True)
     Se.setYieldStrength(295)
 
     Se.getFailureAnalysis("MSS")
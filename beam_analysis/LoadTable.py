@@ -0,0 +1,188 @@
+import numpy as np
+from math import factorial
+
+from beam_analysis.AppliedLoad import AppliedLoadTypes, DistributedLoad, PointLoad, Moment
+
+
+# one row per load, `Stop` is only meaningful for distributed loads
+LOAD_DTYPE = np.dtype([
+    ("Type", np.int8),
+    ("Start", np.float64),
+    ("Stop", np.float64),
+    ("Magnitude", np.float64)
+])
+
+# 1 / p! for the Macaulay bracket powers p = 0...4
+INVERSE_FACTORIALS = np.array([1 / factorial(p) for p in range(5)])
+
+
+class LoadTable(object):
+    """
+    Compact, array-backed table of the loads acting in one plane.
+
+    Rows are a structured array of `LOAD_DTYPE`, grown by doubling as loads are appended.
+    """
+    __slots__ = ("Rows", "Count")
+
+    def __init__(self, capacity=8):
+        """
+        `capacity` - number of rows to preallocate
+        """
+        self.Rows = np.zeros(capacity, dtype=LOAD_DTYPE)
+        self.Count = 0
+
+
+    def __len__(self):
+        return self.Count
+
+
+    def append(self, appliedLoadType, start, stop, magnitude):
+        """
+        `appliedLoadType` - distributed load, point load, moment
+
+        `start` - start distance (or location) of the load
+
+        `stop` - end distance of a distributed load, otherwise NaN
+
+        `magnitude` - magnitude of the load
+
+        returns the index of the new row
+        """
+        if self.Count == len(self.Rows):
+            self.Rows = np.resize(self.Rows, max(8, 2 * len(self.Rows)))
+        self.Rows[self.Count] = (appliedLoadType.value, start, stop, magnitude)
+        self.Count += 1
+        return self.Count - 1
+
+
+    def appendLoad(self, appliedLoad):
+        """
+        `appliedLoad` - distributed load, point load, moment
+
+        returns the index of the new row
+        """
+        stop = appliedLoad.Stop if isinstance(appliedLoad, DistributedLoad) else np.nan
+        return self.append(appliedLoad.AppliedLoadType, appliedLoad.getLocation(), stop, appliedLoad.Magnitude)
+
+
+    def remove(self, rows):
+        """
+        `rows` - indices of the rows to remove
+
+        Removes the rows and moves the later rows down, keeping the remaining rows in insertion order.
+        """
+        kept = np.delete(self.getRows(), list(rows))
+        self.Rows[:len(kept)] = kept
+        self.Count = len(kept)
+
+
+    def take(self, rows):
+        """
+        `rows` - indices of the rows to take
+
+        returns a new LoadTable holding copies of `rows`
+        """
+        table = LoadTable(max(1, len(rows)))
+        table.Rows[:len(rows)] = self.getRows()[list(rows)]
+        table.Count = len(rows)
+        return table
+
+
+    def getRows(self):
+        """
+        returns a view of the filled rows
+        """
+        return self.Rows[:self.Count]
+
+
+    def concatenate(self, other):
+        """
+        returns a new LoadTable with the rows of this table followed by `other`
+        """
+        table = LoadTable(max(1, self.Count + other.Count))
+        table.Rows[:self.Count] = self.getRows()
+        table.Rows[self.Count:self.Count + other.Count] = other.getRows()
+        table.Count = self.Count + other.Count
+        return table
+
+
+    def toLoads(self):
+        """
+        returns the rows as a list of DistributedLoad, PointLoad, and Moment objects
+        """
+        loads = []
+        for loadType, start, stop, magnitude in self.getRows().tolist():
+            loadType = AppliedLoadTypes(loadType)
+            if loadType == AppliedLoadTypes.DISTRIBUTED_LOAD:
+                loads.append(DistributedLoad(start, stop, magnitude))
+            elif loadType == AppliedLoadTypes.POINT_LOAD:
+                loads.append(PointLoad(start, magnitude))
+            else:
+                loads.append(Moment(start, magnitude))
+        return loads
+
+
+    def getPowers(self, beamAnalysisType):
+        """
+        returns the Macaulay bracket power of every row, negative where the load does not contribute
+        """
+        return beamAnalysisType.value - self.getRows()["Type"].astype(int) + 1
+
+
+    def getScales(self, beamAnalysisType):
+        """
+        returns magnitude / p! for every row, 0 where the load does not contribute
+        """
+        powers = self.getPowers(beamAnalysisType)
+        return np.where(0 <= powers, self.getRows()["Magnitude"] * INVERSE_FACTORIALS[np.clip(powers, 0, 4)], 0.0)
+
+
+    def evaluateEach(self, xVals, beamAnalysisType, start=0, stop=None):
+        """
+        `xVals` - array of distances along the beam
+
+        `beamAnalysisType` - shear, moment, angle, deflection
+
+        `start`, `stop` - range of rows to evaluate
+
+        returns a (rows x len(xVals)) array of each load evaluated at every point, without constants or dividing by E*I
+        """
+        flat = np.asarray(xVals, dtype=float).ravel()
+        rows = self.getRows()[start:stop]
+        powers = self.getPowers(beamAnalysisType)[start:stop]
+        scales = self.getScales(beamAnalysisType)[start:stop]
+
+        d = flat[None, :] - rows["Start"][:, None]
+        active = 0 <= d
+        brackets = np.where(active, np.where(active, d, 0.0) ** np.clip(powers, 0, 4)[:, None], 0.0)
+        return scales[:, None] * brackets
+
+
+    def evaluateOver(self, xVals, beamAnalysisType, chunkSize=2**20):
+        """
+        `xVals` - array of distances along the beam
+
+        `beamAnalysisType` - shear, moment, angle, deflection
+
+        `chunkSize` - most (loads x points) elements evaluated at once
+
+        returns the sum of every load evaluated at every point of `xVals`, without constants or dividing by E*I
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        vals = np.zeros(xVals.size)
+
+        step = max(1, chunkSize // max(1, xVals.size))
+        for start in range(0, self.Count, step):
+            vals += self.evaluateEach(xVals, beamAnalysisType, start, start + step).sum(axis=0)
+        return vals.reshape(xVals.shape)
+
+
+    def evaluateAt(self, x, beamAnalysisType):
+        """
+        `x` - distance along the beam
+
+        `beamAnalysisType` - shear, moment, angle, deflection
+
+        returns the sum of every load evaluated at `x`, without constants or dividing by E*I
+        """
+        return float(self.evaluateOver([x], beamAnalysisType)[0])
@@ -0,0 +1,153 @@
+import os
+import json
+import numpy as np
+
+import beam_analysis.export as export
+
+
+class ResultsStore(object):
+    """
+    Columnar store of many beam analyses.
+
+    Each column is a preallocated, memory-mapped .npy file in `directory`, described by a small `index.json`.
+    Reopening a store maps the columns without reading them into memory.
+    """
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, directory, capacity=None, parameterNames=(), n=0, writable=False):
+        """
+        `directory` - folder holding the column files
+
+        `capacity` - number of beams to preallocate. Give this to create a new store, omit it to open an existing one.
+
+        `parameterNames` - names of the per-beam parameters, e.g. ("L", "E", "I"), for a new store
+
+        `n` - points per full curve for a new store, 0 to store only extrema
+
+        `writable` - open an existing store for appending
+        """
+        self.Directory = directory
+        indexPath = os.path.join(directory, self.INDEX_FILENAME)
+
+        if capacity is not None:
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            self.Count = 0
+            self.Capacity = capacity
+            self.ParameterNames = list(parameterNames)
+            self.N = n
+            mode = "w+"
+        else:
+            with open(indexPath, "r") as indexFile:
+                index = json.load(indexFile)
+            self.Count = index["count"]
+            self.Capacity = index["capacity"]
+            self.ParameterNames = index["parameterNames"]
+            self.N = index["n"]
+            mode = "r+" if writable else "r"
+
+        self.BeamIds = self.openColumn("BeamIds", mode, np.int64, (self.Capacity,))
+        self.Parameters = self.openColumn("Parameters", mode, float, (self.Capacity, len(self.ParameterNames)))
+        self.ExtremaLocations = self.openColumn("ExtremaLocations", mode, float, (self.Capacity, 2, 4))
+        self.ExtremaValues = self.openColumn("ExtremaValues", mode, float, (self.Capacity, 2, 4))
+        self.Curves = None
+        if 0 < self.N:
+            self.Curves = self.openColumn("Curves", mode, float, (self.Capacity, len(export.COLUMNS), self.N))
+
+        if mode == "w+":
+            self.flush()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, excType, excValue, traceback):
+        if self.BeamIds.mode != "r":
+            self.flush()
+
+
+    def openColumn(self, name, mode, dtype, shape):
+        """
+        returns the memory-mapped column `name`, created with `dtype` and `shape` when `mode` is "w+"
+        """
+        path = os.path.join(self.Directory, f"{name}.npy")
+        if mode == "w+":
+            return np.lib.format.open_memmap(path, mode=mode, dtype=dtype, shape=shape)
+        return np.load(path, mmap_mode=mode)
+
+
+    def append(self, beamId, parameters, result):
+        """
+        `beamId` - integer id of the beam
+
+        `parameters` - values in the order of `ParameterNames`, or a dict keyed by them
+
+        `result` - the beam's AnalysisResult
+        """
+        if self.Capacity <= self.Count:
+            raise Exception(f"ResultsStore in {self.Directory} is full ({self.Capacity} beams)")
+        if isinstance(parameters, dict):
+            parameters = [parameters[name] for name in self.ParameterNames]
+
+        row = self.Count
+        self.BeamIds[row] = beamId
+        self.Parameters[row] = parameters
+        self.ExtremaLocations[row] = result.ExtremaLocations
+        self.ExtremaValues[row] = result.ExtremaValues
+        if self.Curves is not None:
+            if len(result.X) != self.N:
+                raise Exception(f"Expected curves of {self.N} points, got {len(result.X)}")
+            self.Curves[row] = export.getRows(result).T
+        self.Count += 1
+
+
+    def flush(self):
+        """
+        Writes the columns and the index to disk
+        """
+        for column in [self.BeamIds, self.Parameters, self.ExtremaLocations, self.ExtremaValues, self.Curves]:
+            if column is not None:
+                column.flush()
+
+        index = {
+            "count": self.Count,
+            "capacity": self.Capacity,
+            "parameterNames": self.ParameterNames,
+            "n": self.N,
+            "columns": ["BeamIds", "Parameters", "ExtremaLocations", "ExtremaValues"] + (["Curves"] if self.Curves is not None else [])
+        }
+        with open(os.path.join(self.Directory, self.INDEX_FILENAME), "w") as indexFile:
+            json.dump(index, indexFile)
+
+
+    def getBeamIds(self):
+        """
+        returns the ids of the stored beams
+        """
+        return self.BeamIds[:self.Count]
+
+
+    def getParameter(self, name):
+        """
+        `name` - one of `ParameterNames`
+
+        returns the parameter's value for every stored beam
+        """
+        return self.Parameters[:self.Count, self.ParameterNames.index(name)]
+
+
+    def getExtrema(self):
+        """
+        returns `(locations, values)` arrays of shape (beams x 2 x 4), planes (XY, XZ) and responses (shear, bending, angle, deflection)
+        """
+        return self.ExtremaLocations[:self.Count], self.ExtremaValues[:self.Count]
+
+
+    def getCurves(self):
+        """
+        returns the full curves, (beams x 9 x n) ordered as export.COLUMNS, or None when not stored
+        """
+        if self.Curves is None:
+            return None
+        return self.Curves[:self.Count]
@@ -0,0 +1,152 @@
+import csv
+import numpy as np
+
+from beam_analysis.CrossSection import CrossSection, CrossSectionTypes, PROPERTY_NAMES, getSectionProperties
+
+
+class SectionLibrary(object):
+    """
+    Catalog of named cross-sections with their properties precomputed into a NumPy table.
+
+    `Table` has one row per section and one column per name in PROPERTY_NAMES (A, Iz, Iy, Sz, Sy, J).
+    `Dims` has one row per section, padded with NaN to the 4 dims of an I section.
+    """
+    def __init__(self):
+        self.Names = []
+        self.Indices = {}
+        self.Types = np.zeros(0, dtype=int)
+        self.Dims = np.zeros((0, 4))
+        self.Table = np.zeros((0, len(PROPERTY_NAMES)))
+
+
+    def __len__(self):
+        return len(self.Names)
+
+
+    def addSections(self, crossSectionType, dims, names):
+        """
+        `crossSectionType` - RECT, CIRC, I, shared by every section
+
+        `dims` - (sections x dims) array in the order described by CrossSection
+
+        `names` - unique name of each section
+        """
+        dims = np.atleast_2d(np.asarray(dims, dtype=float))
+        if len(dims) != len(names):
+            raise Exception(f"Expected {len(dims)} names, got {len(names)}")
+        # check every name before changing any state
+        seen = set()
+        for name in names:
+            if name in self.Indices or name in seen:
+                raise Exception(f"Duplicate section name: {name}")
+            seen.add(name)
+        table = getSectionProperties(crossSectionType, dims)
+
+        for name in names:
+            self.Indices[name] = len(self.Names)
+            self.Names.append(name)
+
+        padded = np.full((len(dims), 4), np.nan)
+        padded[:, :dims.shape[1]] = dims
+        self.Types = np.concatenate((self.Types, np.full(len(dims), crossSectionType.value)))
+        self.Dims = np.vstack((self.Dims, padded))
+        self.Table = np.vstack((self.Table, table))
+
+
+    @classmethod
+    def fromCsv(cls, filename):
+        """
+        `filename` - .csv file with a header and rows of `name, type, dim1, dim2, ...`, where type is RECT, CIRC, or I
+
+        returns a SectionLibrary of every row, in the file's order
+        """
+        # consecutive rows of the same type are added together
+        runs = []
+        with open(filename, "r", newline="") as csvFile:
+            reader = csv.reader(csvFile)
+            next(reader)
+            for row in reader:
+                if len(row) == 0:
+                    continue
+                name, crossSectionType = row[0].strip(), CrossSectionTypes[row[1].strip()]
+                dims = [float(d) for d in row[2:] if d.strip() != ""]
+                if len(runs) == 0 or runs[-1][0] != crossSectionType:
+                    runs.append((crossSectionType, [], []))
+                runs[-1][1].append(name)
+                runs[-1][2].append(dims)
+
+        library = cls()
+        for crossSectionType, names, dims in runs:
+            library.addSections(crossSectionType, dims, names)
+        return library
+
+
+    def getIndices(self, names):
+        """
+        `names` - a section name or list of names
+
+        returns the row index of each name
+        """
+        if isinstance(names, str):
+            return self.Indices[names]
+        return np.array([self.Indices[name] for name in names], dtype=int)
+
+
+    def getColumn(self, propertyName):
+        """
+        `propertyName` - one of PROPERTY_NAMES
+
+        returns the property of every section
+        """
+        return self.Table[:, PROPERTY_NAMES.index(propertyName)]
+
+
+    def getProperties(self, names):
+        """
+        `names` - a section name or list of names
+
+        returns the (6,) or (names x 6) rows of `Table`
+        """
+        return self.Table[self.getIndices(names)]
+
+
+    def getCrossSection(self, index):
+        """
+        `index` - row index or name of a section
+
+        returns a CrossSection of the section
+        """
+        if isinstance(index, str):
+            index = self.Indices[index]
+        crossSectionType = CrossSectionTypes(int(self.Types[index]))
+        dims = self.Dims[index]
+        return CrossSection(crossSectionType, dims=list(dims[~np.isnan(dims)]))
+
+
+    def getPassing(self, **minimums):
+        """
+        `minimums` - smallest allowed value of each property by name, e.g. `Sz=2E-4, Iz=1E-5`
+
+        returns a boolean mask of the sections meeting every minimum
+        """
+        passing = np.ones(len(self), dtype=bool)
+        for propertyName, minimum in minimums.items():
+            passing &= minimum <= self.getColumn(propertyName)
+        return passing
+
+
+    def getLightest(self, passing=None, **minimums):
+        """
+        `passing` - optional boolean mask of allowed sections, e.g. from getPassing()
+
+        `minimums` - smallest allowed value of each property by name
+
+        returns the index of the section with the least area (weight per length) meeting every constraint, or None
+        """
+        allowed = self.getPassing(**minimums)
+        if passing is not None:
+            allowed &= passing
+        if not np.any(allowed):
+            return None
+        areas = np.where(allowed, self.getColumn("A"), np.inf)
+        return int(np.argmin(areas))
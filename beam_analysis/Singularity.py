@@ -1,6 +1,118 @@
-from beam_analysis.AppliedLoad import AppliedLoadTypes, DistributedLoad
+import numpy as np
+from math import comb
+
+from beam_analysis.AppliedLoad import AppliedLoadTypes
+from beam_analysis.LoadTable import LoadTable, INVERSE_FACTORIALS
 from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
 from beam_analysis.BoundaryCondition import BoundaryConditionTypes
+import beam_analysis.instrument as instrument
+
+
+# BINOMIALS[p, j] = C(p, j) for the Macaulay bracket powers p = 0...4
+BINOMIALS = np.array([[comb(p, j) for j in range(5)] for p in range(5)], dtype=float)
+
+
+def getConstantsMatrix(boundaryConditions):
+    """
+    `boundaryConditions` - list of BoundaryCondition
+
+    returns the matrix `A` of the system `A @ [C1, C2] = E*I*values - loads`, one row per boundary condition:
+
+    - `ANGLE` - `[1, 0]`
+
+    - `DEFLECTION` - `[x, 1]`
+    """
+    a = np.zeros((len(boundaryConditions), 2))
+    for row, bc in enumerate(boundaryConditions):
+        if bc.Type == BoundaryConditionTypes.ANGLE:
+            a[row] = [1, 0]
+        else:
+            a[row] = [bc.Location, 1]
+    return a
+
+
+def solveSystem(a, b):
+    """
+    `a` - (equations x unknowns) matrix
+
+    `b` - right hand side, (equations,) or (equations x systems) to solve several systems at once
+
+    Solves exactly when `a` is square, and in the least squares sense when overdetermined.
+
+    returns `(u, residual)` where `residual` is the norm of `a @ u - b` for each system
+    """
+    equations, unknowns = a.shape
+    if equations < unknowns or np.linalg.matrix_rank(a) < unknowns:
+        raise Exception(f"Invalid boundary conditions.\n{equations} equations (rank {np.linalg.matrix_rank(a)}) cannot determine {unknowns} unknowns.\nEither one angle and one deflection condition, or two deflection conditions are required.")
+    
+    if equations == unknowns:
+        u = np.linalg.solve(a, b)
+    else:
+        u = np.linalg.lstsq(a, b, rcond=None)[0]
+    residual = np.linalg.norm(a @ u - b, axis=0)
+    return u, residual
+
+
+def getCoefficients(table, breakpoints):
+    """
+    `table` - LoadTable of loads
+
+    `breakpoints` - sorted segment starts
+
+    returns an array of shape (4, len(breakpoints), 5) of the loads as polynomials on each segment,
+    in increasing powers of the local coordinate (x - breakpoints[segment]), without constants or dividing by E*I
+    """
+    rows = table.getRows()
+    coefficients = np.zeros((len(BeamAnalysisTypes), len(breakpoints), 5))
+    
+    # <x - a>^p = sum_j C(p, j) * (b - a)^(p - j) * (x - b)^j on a segment starting at b, when a <= b
+    d = breakpoints[:, None] - rows["Start"][None, :]
+    active = 0 <= d
+    d = np.where(active, d, 0.0)
+    types = rows["Type"].astype(int)
+    for loadType in np.unique(types):
+        of = types == loadType
+        magnitudes = rows["Magnitude"][of]
+        
+        # sums[q] = sum of magnitude * (b - a)^q over the loads of this type, for every segment
+        sums = np.stack([(active[:, of] * d[:, of] ** q) @ magnitudes for q in range(5)])
+        for bat in BeamAnalysisTypes:
+            p = bat.value - loadType + 1
+            for j in range(p + 1):
+                coefficients[bat.value - 1, :, j] += BINOMIALS[p, j] * INVERSE_FACTORIALS[p] * sums[p - j]
+    return coefficients
+
+
+def shiftCoefficients(coefficients, h):
+    """
+    `coefficients` - array (..., 5) of polynomials in increasing powers of t
+
+    `h` - shift of the origin
+
+    returns the coefficients of the same polynomials in t' = t - h
+    """
+    p, j = np.meshgrid(np.arange(5), np.arange(5), indexing="ij")
+    shift = np.where(j <= p, BINOMIALS * float(h) ** np.clip(p - j, 0, 4), 0.0)
+    return coefficients @ shift
+
+
+def solveSingularities(singularities):
+    """
+    `singularities` - list of Singularity, e.g. the XY and XZ planes of a Beam
+
+    Solves every Singularity with a single call to solveSystem() when they share supports and boundary condition locations,
+    otherwise solves each one separately.
+    """
+    systems = [singularity.getSystem() for singularity in singularities]
+    a = systems[0][0]
+    if not all(np.array_equal(a, system[0]) for system in systems):
+        for singularity in singularities:
+            singularity.solve()
+        return
+    
+    u, residual = solveSystem(a, np.stack([system[1] for system in systems], axis=1))
+    for col, singularity in enumerate(singularities):
+        singularity.applySolution(u[:, col], systems[col][2], residual[col], (a, systems[col][1]))
 
 
 class Singularity(object):
@@ -17,22 +129,108 @@ class Singularity(object):
         self.I = i
 
         # defaults
-        self.AppliedLoads = []
+        self.Loads = LoadTable()
+        self.ReactionLoads = LoadTable()
+        self.Table = None
         self.BoundaryConditions = []
+        self.Supports = []
+        self.Reactions = []
         self.C1 = None
         self.C2 = None
+        self.Residual = None
+        self.Breakpoints = None
+        self.Coefficients = None
+
+        # incremented on every change to the loads, boundary conditions, or supports
+        self.Version = 0
+
+        # rows of `Loads` by load id, and the load id of every row
+        self.LoadRows = {}
+        self.RowIds = []
+        self.NextLoadId = 0
+
+        # solved state kept for incremental updates, see updateSolution()
+        self.System = None
+        self.Solution = None
+        self.Pseudoinverse = None
+        self.Contributions = {}
+        self.LoadCoefficients = None
     
 
     def addAppliedLoad(self, appliedLoad):
         """
         `appliedLoad` - distributed load, point load, moment
+
+        When already solved, the solution and compiled polynomials are updated in place.
+
+        returns an id for removeAppliedLoad()
+        """
+        loadId = self.NextLoadId
+        self.NextLoadId += 1
+        rows = [self.Loads.appendLoad(appliedLoad)]
+
+        # add counteracting distributed load to offset beyond a point of interest, none is needed past the end of the beam
+        if appliedLoad.AppliedLoadType == AppliedLoadTypes.DISTRIBUTED_LOAD and appliedLoad.Stop < self.L:
+            rows.append(self.Loads.append(AppliedLoadTypes.DISTRIBUTED_LOAD, appliedLoad.Stop, self.L, -appliedLoad.Magnitude))
+        
+        self.LoadRows[loadId] = rows
+        self.RowIds.extend([loadId] * len(rows))
+        self.Table = None
+        self.Version += 1
+        
+        if self.System is not None:
+            self.updateSolution(loadId, 1)
+        else:
+            self.invalidate()
+        return loadId
+
+
+    def removeAppliedLoad(self, loadId):
+        """
+        `loadId` - id returned by addAppliedLoad()
+
+        When already solved, the solution and compiled polynomials are updated in place.
+        """
+        if loadId not in self.LoadRows:
+            raise Exception(f"No applied load with id: {loadId}")
+        
+        if self.System is not None:
+            self.updateSolution(loadId, -1)
+        else:
+            self.invalidate()
+        
+        # compact the rows in order, then renumber the rows of every remaining load
+        self.Loads.remove(self.LoadRows.pop(loadId))
+        self.RowIds = [rowId for rowId in self.RowIds if rowId != loadId]
+        self.LoadRows = {}
+        for row, rowId in enumerate(self.RowIds):
+            self.LoadRows.setdefault(rowId, []).append(row)
+        
+        self.Contributions.pop(loadId, None)
+        self.Table = None
+        self.Version += 1
+
+
+    def invalidate(self):
+        """
+        Discards the solved and compiled state, so the next solve() starts from scratch
         """
-        self.AppliedLoads.append(appliedLoad)
+        self.System = None
+        self.Solution = None
+        self.Pseudoinverse = None
+        self.Contributions = {}
+        self.LoadCoefficients = None
+        self.Breakpoints = None
+        self.Coefficients = None
 
-        # add counteracting distributed load to offset beyond a point of interest
-        if type(appliedLoad) is AppliedLoadTypes.DISTRIBUTED_LOAD:
-            counterLoad = DistributedLoad(appliedLoad.Stop, self.L, -appliedLoad.Magnitude)
-            self.AppliedLoads.append(counterLoad)
+
+    @property
+    def AppliedLoads(self):
+        """
+        the applied loads as a tuple of DistributedLoad, PointLoad, and Moment objects, built from `Loads` in insertion order.
+        Use addAppliedLoad() and removeAppliedLoad() to change them.
+        """
+        return tuple(self.Loads.toLoads())
 
 
     def addBoundaryCondition(self, boundaryCondition):
@@ -40,49 +238,352 @@ class Singularity(object):
         `boundaryCondition` - BoundaryCondition to add
         """
         self.BoundaryConditions.append(boundaryCondition)
+        self.Version += 1
+        self.invalidate()
+
+
+    def addSupport(self, support):
+        """
+        `support` - Support to add, its reactions are solved for by solve()
+        """
+        self.Supports.append(support)
+        self.Version += 1
+        self.invalidate()
+
+
+    def getLoads(self):
+        """
+        returns the applied loads followed by the solved reactions
+        """
+        return list(self.AppliedLoads) + self.Reactions
+
+
+    def getTable(self):
+        """
+        returns a LoadTable of the applied loads followed by the solved reactions
+        """
+        if self.Table is None:
+            self.Table = self.Loads.concatenate(self.ReactionLoads)
+        return self.Table
+
+
+    def getLoadsAt(self, x, beamAnalysisType):
+        """
+        returns the sum of the applied loads at `x`, without reactions, constants, or dividing by E*I
+        """
+        return self.Loads.evaluateAt(x, beamAnalysisType)
+
+
+    def getConditions(self):
+        """
+        returns `(conditions, boundaryConditions)` where `conditions` is the (location, BeamAnalysisType) of every row of getSystem(),
+        equilibrium rows first, and `boundaryConditions` are the BoundaryConditions of the remaining rows
+        """
+        boundaryConditions = [bc for support in self.Supports for bc in support.getBoundaryConditions()] + self.BoundaryConditions
+        
+        conditions = []
+        if 0 < len(self.Supports):
+            conditions = [(self.L, BeamAnalysisTypes.SHEAR), (self.L, BeamAnalysisTypes.BENDING)]
+        conditions.extend((bc.Location, BeamAnalysisTypes[bc.Type.name]) for bc in boundaryConditions)
+        return conditions, boundaryConditions
+
+
+    def getSystem(self):
+        """
+        Assembles the linear system `A @ [reactions..., C1, C2] = b` in units of E*I from:
+
+        - with supports, no shear or moment beyond the end of the beam (equilibrium), and the conditions enforced by each support
+
+        - every boundary condition
+
+        returns `(A, b, reactions)` where `reactions` holds a unit load for each unknown reaction
+        """
+        reactions = []
+        for support in self.Supports:
+            reactions.extend(support.getUnitReactions())
+        
+        conditions, boundaryConditions = self.getConditions()
+        equilibrium = len(conditions) - len(boundaryConditions)
+        a = np.zeros((len(conditions), len(reactions) + 2))
+        b = np.zeros(len(conditions))
+        for row, (location, bat) in enumerate(conditions):
+            a[row, :len(reactions)] = [reaction.evaluateAt(location, bat) for reaction in reactions]
+            b[row] = -self.getLoadsAt(location, bat)
+        
+        a[equilibrium:, -2:] = getConstantsMatrix(boundaryConditions)
+        b[equilibrium:] += (self.E * self.I) * np.array([bc.Value for bc in boundaryConditions], dtype=float)
+        return a, b, reactions
+
+
+    def getInfluenceLines(self, xVals, locations, appliedLoadType=AppliedLoadTypes.POINT_LOAD):
+        """
+        `xVals` - array of distances along the beam
+
+        `locations` - array of load locations
+
+        `appliedLoadType` - point load or moment
+
+        returns a (4 x len(locations) x len(xVals)) array of the response at every x to a unit load at each location,
+        ordered (shear, bending, angle, deflection), with boundary condition values taken as 0 and angle and deflection divided by E*I.
+        Every location is solved at once, as one system with a right hand side per location.
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        locations = np.asarray(locations, dtype=float).ravel()
+        lines = np.zeros((len(BeamAnalysisTypes), len(locations), len(xVals)))
+        if len(locations) == 0:
+            return lines
+        
+        units = LoadTable(len(locations))
+        for location in locations:
+            units.append(appliedLoadType, location, np.nan, 1.0)
+        
+        a, _, reactions = self.getSystem()
+        reactionLoads = LoadTable(max(1, len(reactions)))
+        for reaction in reactions:
+            reactionLoads.appendLoad(reaction)
+        
+        conditions, _ = self.getConditions()
+        b = np.zeros((len(conditions), len(locations)))
+        for row, (location, bat) in enumerate(conditions):
+            b[row] = -units.evaluateEach([location], bat)[:, 0]
+        u, _ = solveSystem(a, b)
+        
+        for bat in BeamAnalysisTypes:
+            vals = units.evaluateEach(xVals, bat) + u[:-2].T @ reactionLoads.evaluateEach(xVals, bat)
+            if bat == BeamAnalysisTypes.ANGLE:
+                vals = (vals + u[-2][:, None]) / (self.E * self.I)
+            elif bat == BeamAnalysisTypes.DEFLECTION:
+                vals = (vals + u[-2][:, None] * xVals + u[-1][:, None]) / (self.E * self.I)
+            lines[bat.value - 1] = vals
+        return lines
 
 
     def solve(self):
         """
-        Requires a minimum of 2 boundary conditions to solve:
+        Solves for the constants C1, C2 and the reactions of any supports using every boundary condition.
+
+        The system is solved exactly when determined, and by least squares when overdetermined,
+        with `Residual` holding the norm of the unmet conditions (in units of E*I).
+
+        Without supports, requires a minimum of 2 boundary conditions to solve:
 
         - `ANGLE, DEFLECTION, ...`
 
         - `DEFLECTION, DEFLECTION, ...`
         """
-        angleBcs = []
-        deflectionBcs = []
-        for bc in self.BoundaryConditions:
-            if bc.Type == BoundaryConditionTypes.ANGLE:
-                angleBcs.append(bc)
-            elif bc.Type == BoundaryConditionTypes.DEFLECTION:
-                deflectionBcs.append(bc)
-        
-        if 0 < len(angleBcs) and 0 < len(deflectionBcs):
-            # use one angleBc and the first deflectionBc
-            angleBc = angleBcs[0]
-            deflectionBc = deflectionBcs[0]
-
-            c1 = (self.E * self.I) * (angleBc.Value - self.evaluateAt(angleBc.Location, BeamAnalysisTypes.ANGLE, includeConstants=False))
-            c2 = (self.E * self.I) * (deflectionBc.Value - self.evaluateAt(deflectionBc.Location, BeamAnalysisTypes.DEFLECTION, includeConstants=False)) - (c1*deflectionBc.Location)
-            
-            self.C1 = c1
-            self.C2 = c2
+        with instrument.phase("Singularity.solve"):
+            a, b, reactions = self.getSystem()
+            u, residual = solveSystem(a, b)
+            self.applySolution(u, reactions, residual, (a, b))
+
+
+    def isOverdetermined(self, tol=1E-6):
+        """
+        `tol` - largest allowed `Residual`, relative to the norm of the system's right hand side
+
+        returns True when there are more conditions than unknowns and the least squares solution leaves them unmet.
+        `Residual` and the right hand side are both in units of E*I, so the comparison does not depend on E*I or the load size.
+        """
+        if self.System is None or self.Residual is None:
+            return False
+        a, b = self.System
+        if a.shape[0] <= a.shape[1]:
+            return False
+        return tol * np.linalg.norm(b) < self.Residual
+
+
+    def applySolution(self, u, reactions, residual, system=None):
+        """
+        `u` - solution of getSystem(), `[reactions..., C1, C2]`
+
+        `reactions` - unit loads for each unknown reaction, from getSystem()
+
+        `residual` - norm of the unmet conditions
+
+        `system` - optional `(A, b)` that `u` solves, kept so later load changes can update the solution in place
+        """
+        if system is not None:
+            self.invalidate()
+            self.System = system
+        self.Solution = u
+        self.ReactionLoads = LoadTable(max(1, len(reactions)))
+        for reaction, magnitude in zip(reactions, u[:-2]):
+            reaction.Magnitude = magnitude
+            self.ReactionLoads.appendLoad(reaction)
+        self.Reactions = reactions
+        self.Table = None
+        self.C1, self.C2 = u[-2], u[-1]
+        self.Residual = residual
+        
+        self.compile()
+
+
+    def updateSolution(self, loadId, sign):
+        """
+        `loadId` - id of an applied load in `Loads`
+
+        `sign` - 1 when the load was added, -1 when it is being removed
+
+        Adds (or subtracts) the load's cached contribution to the solved `[reactions..., C1, C2]` without solving again.
+        The load's own coefficients are added to `LoadCoefficients` of only the segments at or after the load.
+
+        `NOTE` - the change in the reactions and constants reaches every segment, so compile() still rebuilds
+        `Coefficients` in O(segments). The first change to a load also evaluates it at every condition, O(conditions).
+        """
+        if instrument.ACTIVE is not None:
+            instrument.ACTIVE.addCount("Singularity.updateSolution")
+        
+        table = self.Loads.take(self.LoadRows[loadId])
+        if loadId not in self.Contributions:
+            conditions, _ = self.getConditions()
+            b = -np.array([table.evaluateAt(location, bat) for location, bat in conditions], dtype=float)
+            if self.Pseudoinverse is None:
+                self.Pseudoinverse = np.linalg.pinv(self.System[0])
+            self.Contributions[loadId] = (b, self.Pseudoinverse @ b)
+        b, u = self.Contributions[loadId]
+
+        a, rhs = self.System
+        rhs = rhs + sign * b
+        self.System = (a, rhs)
+        
+        starts = table.getRows()["Start"]
+        for start in starts:
+            self.insertBreakpoint(start)
+        first = np.searchsorted(self.Breakpoints, starts.min())
+        self.LoadCoefficients[:, first:] += sign * getCoefficients(table, self.Breakpoints[first:])
+        
+        solution = self.Solution + sign * u
+        self.applySolution(solution, self.Reactions, np.linalg.norm(a @ solution - rhs))
+
+
+    def insertBreakpoint(self, x):
+        """
+        `x` - distance along the beam
+
+        Splits the compiled segment containing `x` into two at `x`, unless `x` is already a breakpoint
+        """
+        segment = np.searchsorted(self.Breakpoints, x)
+        if segment < len(self.Breakpoints) and self.Breakpoints[segment] == x:
+            return
+        
+        shifted = shiftCoefficients(self.LoadCoefficients[:, segment - 1], x - self.Breakpoints[segment - 1])
+        self.Breakpoints = np.insert(self.Breakpoints, segment, x)
+        self.LoadCoefficients = np.insert(self.LoadCoefficients, segment, shifted, axis=1)
+
+
+    def compile(self):
+        """
+        Compiles the solved singularity functions into piecewise polynomials of degree <= 4.
+
+        Sets `Breakpoints` - the sorted, unique load locations (starting at 0)
+
+        Sets `Coefficients` - an array of shape (4, len(Breakpoints), 5). For each BeamAnalysisType and segment,
+        the coefficients are in increasing powers of the local coordinate (x - Breakpoints[segment]).
+
+        The applied loads' part is kept in `LoadCoefficients` and only rebuilt after invalidate(). The reactions and
+        constants are added to it over every segment, so each call is O(segments).
+
+        `NOTE` - called by solve(), the constants C1 and C2 must be known
+        """
+        if self.LoadCoefficients is None:
+            starts = np.concatenate((self.Loads.getRows()["Start"], self.ReactionLoads.getRows()["Start"], [0.0]))
+            self.Breakpoints = np.unique(starts)
+            self.LoadCoefficients = getCoefficients(self.Loads, self.Breakpoints)
+        breakpoints = self.Breakpoints
+        coefficients = self.LoadCoefficients + getCoefficients(self.ReactionLoads, breakpoints)
+        
+        # add the constants of integration, (C1*x + C2) = C1*(x - b) + (C1*b + C2)
+        angle = BeamAnalysisTypes.ANGLE.value - 1
+        deflection = BeamAnalysisTypes.DEFLECTION.value - 1
+        coefficients[angle, :, 0] += self.C1
+        coefficients[deflection, :, 0] += self.C1 * breakpoints + self.C2
+        coefficients[deflection, :, 1] += self.C1
+        coefficients[angle:] /= (self.E * self.I)
+
+        self.Coefficients = coefficients
+    
+
+    def evaluateCompiled(self, xVals, beamAnalysisType, segments=None):
+        """
+        `xVals` - array of distances along the beam
+
+        `beamAnalysisType` - shear, moment, angle, deflection
+
+        `segments` - optional array of segment indices to evaluate each x with, e.g. to take left limits at breakpoints
 
-        elif 1 < len(deflectionBcs):
-            # use first two deflection bcs
-            deflectionBc1 = deflectionBcs[0]
-            deflectionBc2 = deflectionBcs[1]
+        returns an array of the compiled piecewise polynomial evaluated at every point of `xVals`
 
-            defBc1K = (self.E * self.I) * (deflectionBc1.Value - self.evaluateAt(deflectionBc1.Location, BeamAnalysisTypes.DEFLECTION, includeConstants=False))
-            defBc2K = (self.E * self.I) * (deflectionBc2.Value - self.evaluateAt(deflectionBc2.Location, BeamAnalysisTypes.DEFLECTION, includeConstants=False))
+        `NOTE` - requires solve() (or compile()) to be called first
+        """
+        xVals = np.asarray(xVals, dtype=float)
+        if segments is None:
+            segments = self.getSegments(xVals)
+        
+        t = xVals - self.Breakpoints[segments]
+        c = self.Coefficients[beamAnalysisType.value - 1][segments]
+        
+        # Horner's method
+        vals = c[..., 4]
+        for j in range(3, -1, -1):
+            vals = vals * t + c[..., j]
+        return vals
+    
+
+    def getExtremum(self, beamAnalysisType):
+        """
+        `beamAnalysisType` - shear, moment, angle, deflection
+
+        returns (location, value) of the largest absolute value over [0, L].
+        Candidates are the ends of every compiled segment (taking left limits at discontinuities)
+        and the real roots of the polynomial's derivative within each segment.
+
+        `NOTE` - requires solve() (or compile()) to be called first
+        """
+        coefficients = self.Coefficients[beamAnalysisType.value - 1]
+        starts = self.Breakpoints
+        stops = np.append(self.Breakpoints[1:], max(self.L, self.Breakpoints[-1]))
+        
+        bestLocation, bestValue = 0.0, 0.0
+        for segment in range(len(starts)):
+            c = coefficients[segment]
+            length = stops[segment] - starts[segment]
+            
+            candidates = [0.0, length]
+            derivative = np.trim_zeros(c[1:] * np.arange(1, 5), "b")
+            if 1 < len(derivative):
+                roots = np.polynomial.polynomial.polyroots(derivative)
+                roots = roots.real[abs(roots.imag) < 1E-12]
+                candidates.extend(roots[(0 < roots) & (roots < length)])
             
-            c1 = (defBc1K - defBc2K) / (deflectionBc1.Location - deflectionBc2.Location)
-            self.C1 = c1
-            self.C2 = defBc1K - c1 * deflectionBc1.Location
+            t = np.array(candidates)
+            vals = np.polynomial.polynomial.polyval(t, c)
+            i = np.argmax(abs(vals))
+            if abs(bestValue) < abs(vals[i]):
+                bestLocation, bestValue = starts[segment] + t[i], vals[i]
+        
+        return bestLocation, bestValue
+    
 
-        else:
-            raise Exception(f"Invalid boundary conditions.\nEither one angle and one deflection condition, or two deflection conditions are required.\n{self.BoundaryConditions}")
+    def getExtrema(self):
+        """
+        returns (locations, values) arrays of the largest absolute values, ordered (shear, bending, angle, deflection)
+
+        `NOTE` - requires solve() (or compile()) to be called first
+        """
+        locations, values = np.zeros(len(BeamAnalysisTypes)), np.zeros(len(BeamAnalysisTypes))
+        for bat in BeamAnalysisTypes:
+            locations[bat.value - 1], values[bat.value - 1] = self.getExtremum(bat)
+        return locations, values
+    
+
+    def getSegments(self, xVals):
+        """
+        `xVals` - array of distances along the beam
+
+        returns the index of the compiled segment containing each x
+        """
+        segments = np.searchsorted(self.Breakpoints, xVals, side="right") - 1
+        return np.clip(segments, 0, len(self.Breakpoints) - 1)
 
 
     def evaluateAt(self, x, beamAnalysisType, includeConstants=True):
@@ -95,12 +596,10 @@ class Singularity(object):
 
         `NOTE` - to properly perform angle and deflection analysis, must call solve() before evaluating
         """
-        if len(self.AppliedLoads) == 0:
-            return 0.0
+        if instrument.ACTIVE is not None:
+            instrument.ACTIVE.addCount("Singularity.evaluateAt")
         
-        val = 0.0
-        for load in self.AppliedLoads:
-            val += load.evaluateAt(x, beamAnalysisType)
+        val = self.getTable().evaluateAt(x, beamAnalysisType)
         
         if beamAnalysisType == BeamAnalysisTypes.ANGLE or beamAnalysisType == BeamAnalysisTypes.DEFLECTION:
             if includeConstants:
@@ -113,6 +612,53 @@ class Singularity(object):
         return val
     
 
+    def evaluateOver(self, xVals, beamAnalysisType, includeConstants=True):
+        """
+        `xVals` - array of distances along the beam to evaluate the singularity function at
+
+        `beamAnalysisType` - shear, moment, angle, deflection
+
+        `includeConstants` - optionally exclude constants from calculations
+
+        returns an array of the singularity function evaluated at every point of `xVals`.
+        Uses the compiled piecewise polynomials when available.
+
+        `NOTE` - to properly perform angle and deflection analysis, must call solve() before evaluating
+        """
+        if instrument.ACTIVE is not None:
+            instrument.ACTIVE.addSize("Singularity.evaluateOver", np.size(xVals))
+        
+        if includeConstants and self.Coefficients is not None:
+            return self.evaluateCompiled(xVals, beamAnalysisType)
+        
+        xVals = np.asarray(xVals, dtype=float)
+        vals = self.getTable().evaluateOver(xVals, beamAnalysisType)
+        
+        if beamAnalysisType == BeamAnalysisTypes.ANGLE or beamAnalysisType == BeamAnalysisTypes.DEFLECTION:
+            if includeConstants:
+                if beamAnalysisType == BeamAnalysisTypes.ANGLE:
+                    vals += self.C1
+                else:
+                    vals += self.C1*xVals + self.C2
+            vals /= (self.E * self.I)
+        
+        return vals
+    
+
+    def evaluateAllOver(self, xVals):
+        """
+        `xVals` - array of distances along the beam
+
+        returns a tuple of arrays: (shear, bending, angle, deflection)
+        """
+        return (
+            self.evaluateOver(xVals, BeamAnalysisTypes.SHEAR),
+            self.evaluateOver(xVals, BeamAnalysisTypes.BENDING),
+            self.evaluateOver(xVals, BeamAnalysisTypes.ANGLE),
+            self.evaluateOver(xVals, BeamAnalysisTypes.DEFLECTION)
+        )
+    
+
     def getString(self, beamAnalysisType, includeConstants=True):
         """
         `beamAnalysisType` - shear, moment, angle, deflection
@@ -123,11 +669,12 @@ class Singularity(object):
         """
         equiv0 = 1e-14
         s = ""
-        if len(self.AppliedLoads) == 0:
+        loads = self.getLoads()
+        if len(loads) == 0:
             return s
         
-        for i in range(len(self.AppliedLoads)):
-            load = self.AppliedLoads[i]
+        for i in range(len(loads)):
+            load = loads[i]
             if (abs(load.Magnitude) < equiv0):
                 continue
             if (0 < i and 0 <= load.Magnitude):
@@ -0,0 +1,65 @@
+import numpy as np
+
+
+class StressResult(object):
+    """
+    Normal and transverse shear stresses over a grid of points along the beam and across its CrossSection, held as NumPy arrays.
+
+    Each point is a uniaxial normal stress with a shear stress, so the equivalent stresses are those of
+    StressElement(normal, 0, 0, shearXY=shear).
+    """
+    def __init__(self, xVals, points, normal, shear):
+        """
+        `xVals` - array of points along the beam (x-axis)
+
+        `points` - (m x 2) array of (horizontal, vertical) points about the centroid of the CrossSection
+
+        `normal` - (len(xVals) x m) array of the bending stress
+
+        `shear` - (len(xVals) x m) array of the magnitude of the transverse shear stress
+        """
+        self.X = np.asarray(xVals, dtype=float)
+        self.Points = np.asarray(points, dtype=float)
+        self.Normal = np.asarray(normal, dtype=float)
+        self.Shear = np.asarray(shear, dtype=float)
+        self.VonMises = np.sqrt(self.Normal**2 + 3 * self.Shear**2)
+
+
+    def getEquivalent(self, analysis="DE"):
+        """
+        `analysis` - failure theory for ductile materials:
+            "MSS" - maximum shear stress theory
+
+            "DE"  - distortion energy theory (von Mises)
+
+        returns the (len(X) x m) array of equivalent stress
+        """
+        if analysis == "DE":
+            return self.VonMises
+        if analysis == "MSS":
+            return np.sqrt(self.Normal**2 + 4 * self.Shear**2)
+        raise Exception(f"No analysis named {analysis}")
+
+
+    def getFos(self, yieldStrength, analysis="DE"):
+        """
+        `yieldStrength` - yield strength of the material, in units consistent with the stresses
+
+        `analysis` - failure theory, see getEquivalent()
+
+        returns the (len(X) x m) array of yieldStrength / equivalent stress, inf where unstressed
+        """
+        equivalent = self.getEquivalent(analysis)
+        with np.errstate(divide="ignore"):
+            return np.where(equivalent == 0, np.inf, yieldStrength / equivalent)
+
+
+    def getCritical(self, analysis="DE"):
+        """
+        `analysis` - failure theory, see getEquivalent()
+
+        returns `(location, point, value)`: the x and (horizontal, vertical) section point of the largest equivalent stress, and that stress
+        """
+        equivalent = self.getEquivalent(analysis)
+        row, col = np.unravel_index(np.argmax(equivalent), equivalent.shape)
+        return self.X[row], self.Points[col], equivalent[row, col]
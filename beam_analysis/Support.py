@@ -0,0 +1,54 @@
+from enum import Enum
+
+from beam_analysis.AppliedLoad import PointLoad, Moment
+from beam_analysis.BoundaryCondition import BoundaryCondition, BoundaryConditionTypes
+
+
+class SupportTypes(Enum):
+    PIN = 1
+    ROLLER = 2
+    FIXED = 3
+
+
+class Support(object):
+    __slots__ = ("Location", "SupportType")
+
+    def __init__(self, location, supportType):
+        """
+        `location` - the distance along the beam to the support
+
+        `supportType` - pin, roller, fixed
+        """
+        if not supportType in set(st for st in SupportTypes):
+            raise Exception(f"Invalid supportType: {supportType}")
+
+        self.Location = location
+        self.SupportType = supportType
+
+
+    def getBoundaryConditions(self):
+        """
+        returns the BoundaryConditions enforced by the support:
+
+        - `PIN`, `ROLLER` - no deflection
+
+        - `FIXED` - no deflection and no angle
+        """
+        bcs = [BoundaryCondition(self.Location, BoundaryConditionTypes.DEFLECTION, 0)]
+        if self.SupportType == SupportTypes.FIXED:
+            bcs.append(BoundaryCondition(self.Location, BoundaryConditionTypes.ANGLE, 0))
+        return bcs
+
+
+    def getUnitReactions(self):
+        """
+        returns a unit load for each unknown reaction:
+
+        - `PIN`, `ROLLER` - a PointLoad
+
+        - `FIXED` - a PointLoad and a Moment
+        """
+        reactions = [PointLoad(self.Location, 1.0)]
+        if self.SupportType == SupportTypes.FIXED:
+            reactions.append(Moment(self.Location, 1.0))
+        return reactions
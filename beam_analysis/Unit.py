@@ -9,6 +9,8 @@ class UnitTypes(Enum):
 
 
 class Unit(object):
+    __slots__ = ("UnitType", "Label")
+
     def __init__(self, unitType, label):
         self.UnitType = unitType
         self.Label = label
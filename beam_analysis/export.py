@@ -0,0 +1,97 @@
+import numpy as np
+
+
+# column order of every diagram export, matching the rows of parallel.analyzeToArray()
+COLUMNS = [
+    "x",
+    "xy shear", "xy bending", "xy angle", "xy deflection",
+    "xz shear", "xz bending", "xz angle", "xz deflection"
+]
+
+
+def getRows(result, start=0, stop=None):
+    """
+    `result` - an AnalysisResult
+
+    `start`, `stop` - range of points to take
+
+    returns a (points x 9) array of x followed by the XY and XZ responses
+    """
+    return np.column_stack((result.X[start:stop], result.XY[:, start:stop].T, result.XZ[:, start:stop].T))
+
+
+def writeCsv(result, filename, chunkSize=10**5, fmt="%.10g"):
+    """
+    `result` - an AnalysisResult
+
+    `filename` - .csv file to write
+
+    `chunkSize` - points formatted and written at once
+
+    `fmt` - number format of each value
+
+    Writes the full x, shear, bending, angle, and deflection arrays for XY and XZ, one row per point.
+    """
+    rowFormat = ",".join([fmt] * len(COLUMNS)) + "\n"
+    with open(filename, "w", buffering=2**20) as csvFile:
+        csvFile.write(",".join(COLUMNS) + "\n")
+        for start in range(0, len(result.X), chunkSize):
+            rows = getRows(result, start, start + chunkSize)
+            csvFile.write((rowFormat * len(rows)) % tuple(rows.ravel()))
+
+
+def writeNpz(result, filename):
+    """
+    `result` - an AnalysisResult
+
+    `filename` - compressed .npz file to write
+
+    Writes every array of the result under its attribute name.
+    """
+    np.savez_compressed(
+        filename,
+        X=result.X, XY=result.XY, XZ=result.XZ,
+        Constants=result.Constants,
+        ExtremaLocations=result.ExtremaLocations,
+        ExtremaValues=result.ExtremaValues
+    )
+
+
+def writeNpy(result, filename):
+    """
+    `result` - an AnalysisResult
+
+    `filename` - .npy file to write
+
+    Writes a single (9 x points) float array ordered as COLUMNS, readable with `np.load(filename, mmap_mode="r")`.
+    """
+    out = np.lib.format.open_memmap(filename, mode="w+", dtype=float, shape=(len(COLUMNS), len(result.X)))
+    out[0] = result.X
+    out[1:5] = result.XY
+    out[5:] = result.XZ
+    out.flush()
+    del out
+
+
+def writeChunks(chunks, filename, count, n):
+    """
+    `chunks` - iterable of (beams x 9 x n) arrays, e.g. from parallel.imapMany()
+
+    `filename` - .npy file to write
+
+    `count` - total number of beams in all chunks
+
+    `n` - number of points per beam
+
+    Streams each chunk into a preallocated (count x 9 x n) memory-mapped .npy file, so only one chunk is held in memory.
+
+    returns the number of beams written
+    """
+    out = np.lib.format.open_memmap(filename, mode="w+", dtype=float, shape=(count, len(COLUMNS), n))
+    start = 0
+    for chunk in chunks:
+        out[start:start + len(chunk)] = chunk
+        start += len(chunk)
+        out.flush()
+    del out
+    return start
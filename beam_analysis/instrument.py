@@ -0,0 +1,62 @@
+import time
+from contextlib import nullcontext
+
+
+# the AnalysisStats recording, None when instrumentation is disabled
+ACTIVE = None
+
+# shared no-op returned by phase() when disabled
+NO_PHASE = nullcontext()
+
+
+def enable(stats):
+    """
+    `stats` - an AnalysisStats to record into, or None to disable instrumentation
+
+    returns `stats`
+    """
+    global ACTIVE
+    ACTIVE = stats
+    return stats
+
+
+def disable():
+    """
+    Stops recording, instrumented code then only checks `ACTIVE is None`
+    """
+    enable(None)
+
+
+def phase(name):
+    """
+    `name` - name of the phase, e.g. "solve"
+
+    returns a context manager timing its body into the active AnalysisStats, or a shared no-op when disabled
+    """
+    if ACTIVE is None:
+        return NO_PHASE
+    return ACTIVE.phase(name)
+
+
+def startPhase(name):
+    """
+    `name` - name of the phase
+
+    Starts timing a phase that does not fit a `with` block, e.g. a long section of a function.
+
+    returns a token for endPhase(), None when disabled
+    """
+    if ACTIVE is None:
+        return None
+    return (ACTIVE, name, time.perf_counter())
+
+
+def endPhase(token):
+    """
+    `token` - from startPhase()
+
+    Adds the wall time since startPhase() to its AnalysisStats
+    """
+    if token is not None:
+        stats, name, start = token
+        stats.addTime(name, time.perf_counter() - start)
@@ -0,0 +1,93 @@
+import os
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import beam_analysis.export as export
+
+
+def analyzeToArray(beam, n):
+    """
+    `beam` - the Beam to analyze
+
+    `n` - number of data points to run the analysis
+
+    returns a (9 x n) float array: rows are x, xy (shear, bending, angle, deflection), xz (shear, bending, angle, deflection)
+    """
+    result = beam.analyze(n)
+    return np.vstack((result.X, result.XY, result.XZ))
+
+
+def analyzeChunk(beams, n):
+    """
+    returns a (len(beams) x 9 x n) float array, one analyzeToArray() per beam
+    """
+    out = np.empty((len(beams), 9, n))
+    for i, beam in enumerate(beams):
+        out[i] = analyzeToArray(beam, n)
+    return out
+
+
+def imapMany(beams, n=10**3, workers=None, chunkSize=None):
+    """
+    `beams` - a list of Beam to analyze
+
+    `n` - number of data points per beam
+
+    `workers` - number of processes, defaults to the number of cores. 1 runs in this process.
+
+    `chunkSize` - beams sent to a worker at once, defaults to an even split of 4 chunks per worker
+
+    yields a (chunk x 9 x n) array per chunk, in input order.
+    At most 2 chunks per worker are pending at once, so memory stays bounded for large batches.
+    """
+    beams = list(beams)
+    if len(beams) == 0:
+        return
+
+    if workers == 1:
+        chunkSize = chunkSize or len(beams)
+        for start in range(0, len(beams), chunkSize):
+            yield analyzeChunk(beams[start:start + chunkSize], n)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if chunkSize is None:
+        chunkSize = max(1, len(beams) // (4 * workers))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for start in range(0, len(beams), chunkSize):
+            if len(pending) == 2 * workers:
+                yield pending.popleft().result()
+            pending.append(executor.submit(analyzeChunk, beams[start:start + chunkSize], n))
+        while len(pending) > 0:
+            yield pending.popleft().result()
+
+
+def runMany(beams, n=10**3, workers=None, chunkSize=None, filename=None):
+    """
+    `beams` - a list of Beam to analyze
+
+    `n` - number of data points per beam
+
+    `workers` - number of processes, defaults to the number of cores. 1 runs in this process.
+
+    `chunkSize` - beams sent to a worker at once
+
+    `filename` - optional .npy file to stream results into instead of holding them in memory
+
+    returns a (len(beams) x 9 x n) float array in input order, see analyzeToArray().
+    With `filename`, the array is a read-only memory map of the file.
+    """
+    beams = list(beams)
+    if filename is not None:
+        export.writeChunks(imapMany(beams, n=n, workers=workers, chunkSize=chunkSize), filename, len(beams), n)
+        return np.load(filename, mmap_mode="r")
+    
+    out = np.empty((len(beams), 9, n))
+    start = 0
+    for chunk in imapMany(beams, n=n, workers=workers, chunkSize=chunkSize):
+        out[start:start + len(chunk)] = chunk
+        start += len(chunk)
+    return out
@@ -0,0 +1,145 @@
+import numpy as np
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+from beam_analysis.utils import getDecimatedIndices
+
+
+def getStationIndices(xVals, length, count):
+    """
+    `xVals` - sorted array of points along the beam (x-axis)
+
+    `length` - length of the beam
+
+    `count` - number of stations
+
+    returns the indices of the first points of `xVals` at or after `count` evenly spaced stations from 0 to `length`,
+    without repeats
+    """
+    stations = np.linspace(0, length, max(2, count))
+    return np.unique(np.minimum(np.searchsorted(xVals, stations), len(xVals) - 1))
+
+
+def showPlots(beam, xVals, xyParams, xzParams, w=12, h=6, filename=None, bins=None, breakpoints=()):
+    """
+    Makes plots of beam params and a 3d plot of final beam deflection.
+
+    `beam` - the Beam that was analyzed
+
+    `xVals` - a linspace of points along the beam (x-axis)
+
+    `xyParams` - a tuple of singularity values in xy: (xyShear, xyBending, xyAngle, xyDeflection)
+
+    `xzParams` - a tuple of singularity values in xz: (xzShear, xzBending, xzAngle, xzDeflection)
+
+    `filename` - optionally render straight to this file (e.g. .png or .svg) without pyplot or a display
+
+    `bins` - number of bins to decimate the curves to, default is the figure width in pixels
+
+    `breakpoints` - locations of discontinuities (e.g. loads) always kept by decimation
+    """
+    if filename is not None:
+        fig = Figure(figsize=(w, h))
+        drawPlots(fig, beam, xVals, xyParams, xzParams, bins, breakpoints)
+        fig.savefig(filename)
+        return
+
+    # pyplot is only imported for interactive plots
+    from matplotlib import pyplot as plt
+    fig = plt.figure(figsize=(w, h))
+    drawPlots(fig, beam, xVals, xyParams, xzParams, bins, breakpoints)
+    plt.show()
+
+
+def drawPlots(fig_main, beam, xVals, xyParams, xzParams, bins=None, breakpoints=()):
+    """
+    Draws the plots of showPlots() onto the matplotlib Figure `fig_main`,
+    after min/max decimation of every curve to `bins` bins
+    """
+    """
+    PLOT LAYOUT
+    |    XY      |     XZ     |     3D Plot       |
+    |   Shear    |   Shear    |    |  /           |
+    |  Bending   |  Bending   |    | /            |
+    |   Angle    |   Angle    |    |/__________   |
+    | Deflection | Deflection |   /|              |
+    """
+    # Main Fig -> 1x2 figs (2D/3D)
+    # Left Fig -> 2x4 figs (XY/XZ plots)
+    # Right Fig -> 1x1 fig (3D plot)
+    fig_main.suptitle("Beam Analysis Results")
+
+    fig_left, fig_right = fig_main.subfigures(nrows=1, ncols=2)
+    fig_left.suptitle("2D")
+    fig_right.suptitle("3D")
+
+    # keep the extremes and discontinuities of every curve at about one point per pixel
+    xyParams, xzParams = np.asarray(xyParams, dtype=float), np.asarray(xzParams, dtype=float)
+    if bins is None:
+        bins = int(fig_main.get_figwidth() * fig_main.dpi)
+    xVals = np.asarray(xVals, dtype=float)
+    # cross-sections are drawn at evenly spaced stations of the undecimated deflections, about one per 5 pixels
+    stations = getStationIndices(xVals, beam.L, min(len(xVals), bins) // 5 + 1)
+    mesh = beam.CrossSection.getMesh(xVals[stations], xyParams[3][stations], xzParams[3][stations])
+    indices = getDecimatedIndices(xVals, np.vstack((xyParams, xzParams)), bins, breakpoints)
+    xVals, xyParams, xzParams = xVals[indices], xyParams[:, indices], xzParams[:, indices]
+
+    # =================================== #
+    # ============ 2D Plots ============= #
+    # =================================== #
+    ax2d = fig_left.subplots(4, 2, sharex='col', sharey='row')
+    ax2d[0, 0].set_title("XY Plane")
+    ax2d[0, 1].set_title("XZ Plane")
+
+    # plot styles
+    beamStyle = 'k--'
+    styles = ['b-', 'r-', 'y-', 'g-']
+    labels = [
+        f"Shear {beam.ShearUnits.Label}",
+        f"Bending {beam.MomentUnits.Label}",
+        f"Angle {beam.AngleUnits.Label}",
+        f"Deflection {beam.DeflectionUnits.Label}"
+    ]
+
+    # plot Shear, Bending, Angle, and Deflection in 2D
+    # XY on left, XZ on right
+    for row in range(4):
+        ax2d[row, 0].set_ylabel(labels[row])
+        for col, params in enumerate([xyParams, xzParams]):
+            ax2d[row, col].axhline(0, color='k', linestyle='--')
+            ax2d[row, col].plot(xVals, params[row], styles[row])
+
+    fig_left.align_ylabels()
+
+
+    # =================================== #
+    # ============ 3D Plot ============== #
+    # =================================== #
+    ax3d = fig_right.add_subplot(111, projection='3d')
+
+    # convention is that y is vertical in 2d and z is vertical in 3d,
+    # so swap to keep consistent feel across both
+    ax3d.set_xlabel("X")
+    ax3d.set_ylabel("Z")
+    ax3d.set_zlabel("Y")
+
+    # cross-sections at the stations, each closed and drawn as one collection
+    mesh = np.concatenate((mesh, mesh[:, :1]), axis=1)
+
+    # plot beam centerline and cross-sections
+    ax3d.plot(xVals, xzParams[3], xyParams[3], beamStyle)
+    ax3d.add_collection(Line3DCollection(mesh, colors='b', alpha=0.7))
+
+    # axis lines
+    axMax = beam.L/2
+    ax3d.plot([0, beam.L], [0, 0], [0, 0], 'k-')
+    ax3d.plot([0, 0], [-axMax, axMax], [0, 0], 'k-')
+    ax3d.plot([0, 0], [0, 0], [-axMax, axMax], 'k-')
+
+    # set axis scale
+    ax3d.set_xlim(0, beam.L)
+    ax3d.set_ylim(-axMax, axMax)
+    ax3d.set_zlim(-axMax, axMax)
+
+    # size to fit ylabels on left
+    fig_main.subplots_adjust(left=0.2, right=0.9)
@@ -1,3 +1,4 @@
+import numpy as np
 
 
 def getAbsMax(list, roundTo=None):
@@ -12,3 +13,61 @@ def getAbsMax(list, roundTo=None):
     if roundTo:
         x = round(x, roundTo)
     return x
+
+
+def macaulay(xVals, a, power):
+    """
+    `xVals` - array of distances along the beam
+
+    `a` - location of the bracket's singularity
+
+    `power` - exponent of the bracket, 0 or greater
+
+    returns the Macaulay bracket <x - a>^power evaluated over all of `xVals`.
+    """
+    xVals = np.asarray(xVals, dtype=float)
+    active = a <= xVals
+    if power == 0:
+        return active.astype(float)
+    return np.where(active, xVals - a, 0.0) ** power
+
+
+def getDecimatedIndices(xVals, yVals, bins, breakpoints=()):
+    """
+    `xVals` - sorted array of distances along the beam
+
+    `yVals` - array (or rows of arrays) sampled at `xVals`
+
+    `bins` - number of equal bins to reduce to, e.g. the plot width in pixels
+
+    `breakpoints` - optional locations of discontinuities, e.g. loads
+
+    returns sorted indices of the points to plot: the ends, minimum, and maximum of every row in each bin,
+    the points either side of every breakpoint, and both points of any repeated x (left and right limits).
+    Every point is kept when there are fewer than 4 per bin.
+    """
+    xVals = np.asarray(xVals, dtype=float)
+    yVals = np.atleast_2d(np.asarray(yVals, dtype=float))
+    n = len(xVals)
+    if n <= 4 * bins:
+        return np.arange(n)
+
+    # pad the last bin with its final value so every bin has `size` points
+    size = -(-n // bins)
+    padded = np.concatenate((yVals, np.repeat(yVals[:, -1:], bins * size - n, axis=1)), axis=1).reshape(len(yVals), bins, size)
+    offsets = np.arange(bins) * size
+    indices = [
+        offsets, np.minimum(offsets + size - 1, n - 1),
+        (np.argmin(padded, axis=2) + offsets).ravel(),
+        (np.argmax(padded, axis=2) + offsets).ravel()
+    ]
+
+    repeated = np.nonzero(np.diff(xVals) == 0)[0]
+    indices.extend([repeated, repeated + 1])
+
+    breakpoints = np.asarray(breakpoints, dtype=float)
+    for side in ["left", "right"]:
+        at = np.searchsorted(xVals, breakpoints, side=side)
+        indices.extend([at - 1, at])
+
+    return np.unique(np.clip(np.concatenate(indices), 0, n - 1))
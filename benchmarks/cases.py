@@ -0,0 +1,144 @@
+import io
+import os
+import sys
+import tempfile
+import subprocess
+import contextlib
+import numpy as np
+
+from beam_analysis.Beam import Beam
+from beam_analysis.Singularity import Singularity
+from beam_analysis.AppliedLoad import DistributedLoad, PointLoad, Moment
+from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+from beam_analysis.Support import Support, SupportTypes
+from beam_analysis.CrossSection import CrossSection, CrossSectionTypes
+import beam_analysis.export as export
+
+
+# every synthetic beam is drawn from this seed, so runs are comparable
+SEED = 0
+L, E, I = 10.0, 200E9, 1E-5
+
+
+def getSyntheticLoads(loadCount, seed=SEED):
+    """
+    returns a reproducible list of `loadCount` point loads, distributed loads, and moments over [0, L]
+    """
+    rng = np.random.default_rng(seed)
+    loads = []
+    for k in range(loadCount):
+        kind = k % 3
+        if kind == 0:
+            loads.append(PointLoad(rng.uniform(0, L), rng.uniform(-10E3, 10E3)))
+        elif kind == 1:
+            start, stop = np.sort(rng.uniform(0, L, 2))
+            loads.append(DistributedLoad(start, max(stop, start + 1E-3), rng.uniform(-5E3, 5E3)))
+        else:
+            loads.append(Moment(rng.uniform(0, L), rng.uniform(-1E3, 1E3)))
+    return loads
+
+
+def getSyntheticSingularity(loadCount, seed=SEED):
+    """
+    returns a simply supported Singularity carrying getSyntheticLoads()
+    """
+    singularity = Singularity(L, E, I)
+    singularity.addSupport(Support(0, SupportTypes.PIN))
+    singularity.addSupport(Support(L, SupportTypes.ROLLER))
+    for load in getSyntheticLoads(loadCount, seed):
+        singularity.addAppliedLoad(load)
+    return singularity
+
+
+def getSyntheticBeam(loadCount, seed=SEED):
+    """
+    returns a simply supported Beam carrying getSyntheticLoads() at reproducible angles
+    """
+    rng = np.random.default_rng(seed + 1)
+    beam = Beam(L, E, i=I)
+    beam.addSupport(0, SupportTypes.PIN)
+    beam.addSupport(L, SupportTypes.ROLLER)
+    for load in getSyntheticLoads(loadCount, seed):
+        angle = rng.uniform(0, 90)
+        if isinstance(load, DistributedLoad):
+            beam.addDistributedLoad(load.Start, load.Stop, load.Magnitude, angle)
+        elif isinstance(load, PointLoad):
+            beam.addPointLoad(load.Location, load.Magnitude, angle)
+        else:
+            beam.addAppliedMoment(load.Location, load.Magnitude, angle)
+    return beam
+
+
+def benchEvaluateAt(loadCount):
+    """
+    100 scalar evaluateAt() calls of each BeamAnalysisType on a Singularity of `loadCount` loads
+    """
+    singularity = getSyntheticSingularity(loadCount)
+    singularity.solve()
+    xVals = np.random.default_rng(SEED).uniform(0, L, 100)
+    def run():
+        for x in xVals:
+            for bat in BeamAnalysisTypes:
+                singularity.evaluateAt(x, bat)
+    return run
+
+
+def benchSolve(loadCount):
+    """
+    a full solve() of a Singularity of `loadCount` loads
+    """
+    singularity = getSyntheticSingularity(loadCount)
+    return singularity.solve
+
+
+def benchRunAnalysis(n):
+    """
+    runAnalysis() at `n` points of a 20 load Beam, without plots and with printing discarded
+    """
+    beam = getSyntheticBeam(20)
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            beam.runAnalysis(n, showPlots=False)
+    return run
+
+
+def benchWriteCsv(n):
+    """
+    export.writeCsv() of a 20 load Beam analyzed at `n` points, into a temporary directory removed by the teardown
+    """
+    result = getSyntheticBeam(20).analyze(n)
+    directory = tempfile.TemporaryDirectory()
+    filename = os.path.join(directory.name, "bench.csv")
+    return lambda: export.writeCsv(result, filename), directory.cleanup
+
+
+def benchGetPlotPoints(n):
+    """
+    getPlotPoints() of `n` perimeter points at 100 stations along the beam
+    """
+    crossSection = CrossSection(CrossSectionTypes.CIRC, dims=[0.05])
+    xVals = np.linspace(0, L, 100)
+    def run():
+        for x in xVals:
+            crossSection.getPlotPoints(x, 0, 0, n)
+    return run
+
+
+def benchImport(_size):
+    """
+    `from beam_analysis.Beam import Beam` in a fresh interpreter, including interpreter startup
+    """
+    command = [sys.executable, "-c", "from beam_analysis.Beam import Beam"]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return lambda: subprocess.run(command, cwd=root, check=True)
+
+
+# name: (setup function of a size returning the callable to time, or (callable, teardown), sizes, quick sizes)
+CASES = {
+    "Singularity.evaluateAt": (benchEvaluateAt, [1, 10, 100, 1000], [10]),
+    "Singularity.solve": (benchSolve, [10, 100, 1000], [10]),
+    "Beam.runAnalysis": (benchRunAnalysis, [10**3, 10**4, 10**5, 10**6], [10**3]),
+    "export.writeCsv": (benchWriteCsv, [10**3, 10**4, 10**5], [10**3]),
+    "CrossSection.getPlotPoints": (benchGetPlotPoints, [20, 200], [20]),
+    "import": (benchImport, [1], [1])
+}
@@ -0,0 +1,117 @@
+"""
+Offline benchmark runner.
+
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json
+
+Each result is the best time per call over several repeats. Exits with status 1 when any case is slower than
+its baseline by more than the threshold. Baselines are machine specific and not committed,
+so comparing against a missing baseline is skipped with a message.
+"""
+import os
+import sys
+import json
+import timeit
+import platform
+import argparse
+import numpy as np
+
+from benchmarks.cases import CASES
+
+
+def getKey(name, size):
+    return f"{name}[{size}]"
+
+
+def runCase(name, size, repeat=5):
+    """
+    returns the best seconds per call of case `name` at `size` over `repeat` runs
+    """
+    setup = CASES[name][0]
+    run = setup(size)
+    run, teardown = run if isinstance(run, tuple) else (run, None)
+    try:
+        timer = timeit.Timer(run)
+        number, _seconds = timer.autorange()
+        return min(timer.repeat(repeat=repeat, number=number)) / number
+    finally:
+        if teardown is not None:
+            teardown()
+
+
+def runAll(names=None, quick=False, repeat=5, log=None):
+    """
+    `names` - optional case names to run, default is every case
+
+    `quick` - only run each case at its smallest sizes
+
+    `repeat` - runs per case, the best is kept
+
+    `log` - optional function called with each (key, seconds)
+
+    returns a dict of seconds per call by "name[size]"
+    """
+    results = {}
+    for name in (names or list(CASES)):
+        _setup, sizes, quickSizes = CASES[name]
+        for size in (quickSizes if quick else sizes):
+            key = getKey(name, size)
+            results[key] = runCase(name, size, repeat)
+            if log is not None:
+                log(key, results[key])
+    return results
+
+
+def compare(results, baseline, threshold=1.25):
+    """
+    `results` - seconds per call by key, from runAll()
+
+    `baseline` - seconds per call by key, e.g. a saved run
+
+    `threshold` - slowest allowed ratio of result to baseline
+
+    returns a list of (key, baseline seconds, seconds, ratio) for every case slower than `threshold`
+    """
+    regressions = []
+    for key, seconds in results.items():
+        if key in baseline and threshold * baseline[key] < seconds:
+            regressions.append((key, baseline[key], seconds, seconds / baseline[key]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the beam_analysis benchmarks")
+    parser.add_argument("--filter", nargs="*", choices=list(CASES), help="case names to run")
+    parser.add_argument("--quick", action="store_true", help="only the smallest sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the best is kept")
+    parser.add_argument("--save", help="write the results to a JSON baseline")
+    parser.add_argument("--compare", help="JSON baseline to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowest allowed ratio to the baseline")
+    args = parser.parse_args(argv)
+
+    results = runAll(args.filter, args.quick, args.repeat, log=lambda key, seconds: print(f"{key:<40} {seconds * 1E3:12.4f} ms"))
+
+    if args.save:
+        with open(args.save, "w") as baselineFile:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.platform(),
+                "results": results
+            }, baselineFile, indent=2)
+    
+    if args.compare and not os.path.isfile(args.compare):
+        print(f"[SKIP] No baseline at {args.compare}, create one with --save {args.compare}")
+    elif args.compare:
+        with open(args.compare, "r") as baselineFile:
+            baseline = json.load(baselineFile)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"[REGRESSION] {key}: {before * 1E3:.4f} ms -> {after * 1E3:.4f} ms ({ratio:.2f}x)")
+        if 0 < len(regressions):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+from beam_analysis.AnalysisStats import AnalysisStats
+from beam_analysis.Beam import Beam
+from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+from beam_analysis.BoundaryCondition import BoundaryConditionTypes
+import beam_analysis.instrument as instrument
+
+
+def getSimplySupported(l=2.0, p=-10.0):
+    """
+    simply supported beam with reactions entered by hand, load `p` at midspan
+    """
+    B = Beam(l, 200E9, i=1E-6)
+    B.addPointLoad(0, -p / 2, 0)
+    B.addPointLoad(l / 2, p, 0)
+    B.addPointLoad(l, -p / 2, 0)
+    B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+    B.addBoundaryCondition(l, BoundaryConditionTypes.DEFLECTION, 0)
+    return B
+
+
+class Test_AnalysisStats:
+    def test_context_manager(self, capsys):
+        B = getSimplySupported()
+        
+        with AnalysisStats() as stats:
+            B.runAnalysis(101, showPlots=False)
+            B.SingularityXY.evaluateAt(0.5, BeamAnalysisTypes.SHEAR)
+        capsys.readouterr()
+        
+        assert set(["solve", "sample", "extrema", "report"]) <= set(stats.Times)
+        assert stats.Counts["Singularity.evaluateAt"] == 1
+        assert stats.Sizes["Beam.analyze"] == [1, 101, 101]
+        assert instrument.ACTIVE is None
+    
+    def test_hook(self):
+        records = []
+        B = getSimplySupported()
+        
+        stats = instrument.enable(AnalysisStats(hook=lambda kind, name, value: records.append((kind, name))))
+        B.analyze(11)
+        instrument.disable()
+        B.analyze(11)
+        
+        assert ("time", "sample") in records
+        assert ("size", "Beam.analyze") in records
+        assert stats.toDict()["sizes"]["Beam.analyze"] == {"arrays": 1, "total": 11, "largest": 11}
+    
+    def test_nested(self):
+        with AnalysisStats() as outer:
+            with AnalysisStats() as inner:
+                assert instrument.ACTIVE is inner
+            assert instrument.ACTIVE is outer
+        assert instrument.ACTIVE is None
+    
+    def test_startPhase(self):
+        assert instrument.startPhase("disabled") is None
+        instrument.endPhase(None)
+        
+        with AnalysisStats() as stats:
+            token = instrument.startPhase("manual")
+            instrument.endPhase(token)
+        
+        assert 0 <= stats.Times["manual"]
@@ -171,3 +171,17 @@ class Test_Moment:
         test = result == expected
         
         assert test
+
+
+class Test_AppliedLoad_evaluateOver:
+    def test_matches_evaluateAt(self):
+        loads = [PointLoad(1, 10), DistributedLoad(.5, 2, 5), Moment(1.5, 5)]
+        xVals = [0, .5, 1, 1.25, 1.5, 2]
+        
+        tol = 1E-10
+        for load in loads:
+            for bat in BeamAnalysisTypes:
+                result = load.evaluateOver(xVals, bat)
+                for i in range(len(xVals)):
+                    test = abs(result[i] - load.evaluateAt(xVals[i], bat)) < tol
+                    assert test
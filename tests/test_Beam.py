@@ -0,0 +1,467 @@
+import numpy as np
+import pytest
+
+from beam_analysis.Beam import Beam
+from beam_analysis.AppliedLoad import AppliedLoadTypes, DistributedLoad, PointLoad, Moment
+from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+from beam_analysis.BoundaryCondition import BoundaryConditionTypes
+from beam_analysis.Support import SupportTypes
+from beam_analysis.CrossSection import CrossSectionTypes
+from beam_analysis.SectionLibrary import SectionLibrary
+
+
+def getSimplySupported(l=2.0, e=200E9, i=1E-6, p=-10.0, a=None):
+    """
+    simply supported beam with reactions entered by hand, load `p` at `a`
+    """
+    a = l / 2 if a is None else a
+    B = Beam(l, e, i=i)
+    B.addPointLoad(0, -p * (l - a) / l, 0)
+    B.addPointLoad(a, p, 0)
+    B.addPointLoad(l, -p * a / l, 0)
+    B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+    B.addBoundaryCondition(l, BoundaryConditionTypes.DEFLECTION, 0)
+    return B
+
+
+class Test_Beam_getExtrema:
+    def test_center_load(self):
+        l, e, i, p = 2.0, 200E9, 1E-6, -10.0
+        B = getSimplySupported(l, e, i, p)
+        
+        locations, values = B.getExtrema()["XY"]
+        
+        tol = 1E-10
+        assert abs(abs(values[1]) - abs(p) * l / 4) < tol
+        assert abs(locations[1] - l / 2) < tol
+        assert abs(abs(values[3]) - abs(p) * l**3 / (48 * e * i)) < tol
+        assert abs(locations[3] - l / 2) < tol
+    
+    def test_off_center_deflection(self):
+        l, e, i, p, a = 3.0, 200E9, 1E-6, -10.0, 2.0
+        B = getSimplySupported(l, e, i, p, a)
+        
+        # max deflection of a simply supported beam with an off-center point load
+        b = l - a
+        xMax = np.sqrt((l**2 - b**2) / 3)
+        expected = abs(p) * b * (l**2 - b**2)**1.5 / (9 * np.sqrt(3) * l * e * i)
+        locations, values = B.getExtrema()["XY"]
+        
+        tol = 1E-10
+        assert abs(abs(values[3]) - expected) < tol
+        assert abs(locations[3] - xMax) < 1E-8
+    
+    def test_empty_plane(self):
+        B = getSimplySupported()
+        
+        _locations, values = B.getExtrema()["XZ"]
+        test = np.all(values == 0)
+        
+        assert test
+
+
+class Test_Beam_evaluateLoadCase:
+    def test_matches_solved_beam(self):
+        l, e, i = 2.0, 200E9, 1E-6
+        B = Beam(l, e, i=i)
+        B.addBoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0)
+        B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+        xVals = np.linspace(0, l, 41)
+        
+        loads = [PointLoad(l, -10), DistributedLoad(l / 4, l / 2, -3), Moment(l / 2, 2)]
+        result = B.evaluateLoadCase(loads, xVals)
+
+        for load in loads:
+            B.SingularityXY.addAppliedLoad(load)
+        B.solve()
+        expected = np.stack(B.SingularityXY.evaluateAllOver(xVals))
+        
+        tol = 1E-10
+        test = np.allclose(result, expected, rtol=tol, atol=tol)
+        
+        assert test
+    
+    def test_lru_bound(self):
+        B = getSimplySupported()
+        B.InfluenceCacheSize = 2
+        xVals = np.linspace(0, B.L, 11)
+        
+        for location in [0, .5, 1]:
+            B.getInfluence(PointLoad(location, 1), xVals)
+        
+        expected = [(AppliedLoadTypes.POINT_LOAD, .5, None), (AppliedLoadTypes.POINT_LOAD, 1, None)]
+        result = list(B.InfluenceCache.keys())
+        test = result == expected
+        
+        assert test
+    
+    def test_boundary_response_cached(self, monkeypatch):
+        l, e, i = 2.0, 200E9, 1E-6
+        B = Beam(l, e, i=i)
+        B.addBoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0.01)
+        B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+        xVals = np.linspace(0, l, 21)
+        loads = [PointLoad(l, -10)]
+        expected = B.evaluateLoadCase(loads, xVals)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("solved again")
+        monkeypatch.setattr(B, "getBoundarySingularity", fail)
+        result = B.evaluateLoadCase(loads, xVals)
+        
+        test = np.array_equal(result, expected)
+        assert test
+    
+    def test_zero_boundary_values(self):
+        B = getSimplySupported()
+        
+        test = B.getBoundaryResponse(np.linspace(0, B.L, 11)) is None
+        
+        assert test
+    
+    def test_grids_kept(self):
+        B = getSimplySupported()
+        coarse, fine = np.linspace(0, B.L, 11), np.linspace(0, B.L, 21)
+        
+        B.getInfluence(PointLoad(.5, 1), coarse)
+        B.getInfluence(PointLoad(.5, 1), fine)
+        B.getInfluence(PointLoad(1, 1), coarse)
+        
+        expected = [(AppliedLoadTypes.POINT_LOAD, .5, None), (AppliedLoadTypes.POINT_LOAD, 1, None)]
+        test = list(B.InfluenceCache.keys()) == expected and len(B.InfluenceGrids) == 2
+        
+        assert test
+
+
+class Test_Beam_analyze:
+    def test_result_arrays(self):
+        B = getSimplySupported()
+        n = 101
+        
+        result = B.analyze(n)
+        
+        assert result.X.shape == (n,)
+        assert result.XY.shape == (4, n)
+        assert result.XZ.shape == (4, n)
+        assert result.Constants.shape == (2, 2)
+        assert result.ExtremaValues.shape == (2, 4)
+        assert result.HasXY and not result.HasXZ
+    
+    def test_no_output(self, capsys):
+        B = getSimplySupported()
+        
+        B.analyze(11)
+        test = capsys.readouterr().out == ""
+        
+        assert test
+
+
+class Test_Beam_addSupport:
+    def test_simply_supported(self):
+        l, e, i, p = 2.0, 200E9, 1E-6, -10.0
+        B = Beam(l, e, i=i)
+        B.addSupport(0, SupportTypes.PIN)
+        B.addSupport(l, SupportTypes.ROLLER)
+        B.addPointLoad(l / 2, p, 0)
+        
+        B.solve()
+        reactions = [r.Magnitude for r in B.SingularityXY.Reactions]
+        _locations, values = B.getExtrema()["XY"]
+
+        tol = 1E-10
+        assert np.allclose(reactions, [-p / 2, -p / 2], rtol=tol, atol=tol)
+        assert abs(abs(values[3]) - abs(p) * l**3 / (48 * e * i)) < tol
+    
+    def test_cantilever(self):
+        l, e, i, p = 2.0, 200E9, 1E-6, -10.0
+        B = Beam(l, e, i=i)
+        B.addSupport(0, SupportTypes.FIXED)
+        B.addPointLoad(l, p, 0)
+        
+        B.solve()
+        force, moment = [r.Magnitude for r in B.SingularityXY.Reactions]
+        tip = B.SingularityXY.evaluateAt(l, BeamAnalysisTypes.DEFLECTION)
+
+        tol = 1E-10
+        assert abs(force + p) < tol
+        assert abs(moment - p * l) < tol
+        assert abs(tip - p * l**3 / (3 * e * i)) < tol
+    
+    def test_propped_cantilever(self):
+        l, e, i, w = 2.0, 200E9, 1E-6, -3.0
+        B = Beam(l, e, i=i)
+        B.addSupport(0, SupportTypes.FIXED)
+        B.addSupport(l, SupportTypes.ROLLER)
+        B.addDistributedLoad(0, l, w, 0)
+        
+        B.solve()
+        force, moment, prop = [r.Magnitude for r in B.SingularityXY.Reactions]
+        
+        tol = 1E-10
+        assert abs(prop + 3 * w * l / 8) < tol
+        assert abs(force + 5 * w * l / 8) < tol
+        assert abs(moment - w * l**2 / 8) < tol
+
+
+class Test_Beam_iy:
+    def test_plane_stiffness(self):
+        l, e, i, n = 3.0, 200E9, 1E-6, 31
+        B = Beam(l, e, i=i, iy=2 * i)
+        B.addSupport(0, SupportTypes.PIN)
+        B.addSupport(l, SupportTypes.ROLLER)
+        B.addPointLoad(1.0, -10.0, 45)
+        
+        result = B.analyze(n)
+        
+        tol = 1E-10
+        assert np.allclose(result.XY[:2], result.XZ[:2], rtol=tol, atol=tol)
+        assert np.allclose(result.XY[2:], 2 * result.XZ[2:], rtol=tol, atol=tol)
+    
+    def test_combine(self):
+        l, e, i, n = 3.0, 200E9, 1E-6, 31
+        B = Beam(l, e, i=i, iy=3 * i)
+        B.addSupport(0, SupportTypes.FIXED)
+        B.addPointLoad(2.0, -10.0, 30, group="live")
+        
+        envelope = B.combine({"1.0L": {"live": 1.0}}, n)
+        result = B.analyze(n)
+        
+        tol = 1E-10
+        assert np.allclose(envelope.Max[1], result.XZ, rtol=tol, atol=tol)
+
+
+class Test_Beam_getAdaptiveGrid:
+    def test_limits_at_point_load(self):
+        l, p = 2.0, -10.0
+        B = getSimplySupported(l=l, p=p)
+        
+        result = B.analyze(adaptive=True)
+        at = np.where(result.X == l / 2)[0]
+        
+        assert len(at) == 2
+        assert np.allclose(result.XY[0, at], [-p / 2, p / 2])
+    
+    def test_tolerance(self):
+        tol = 1E-4
+        B = getSimplySupported(l=3.0, a=1.0)
+        B.addDistributedLoad(.5, 2.5, -4, 0)
+        
+        result = B.analyze(adaptive=True, tol=tol)
+        xDense = np.linspace(0, B.L, 10**4)
+        dense = np.stack(B.SingularityXY.evaluateAllOver(xDense))
+        
+        assert len(result.X) < 1000
+        for bat in BeamAnalysisTypes:
+            row = bat.value - 1
+            interpolated = np.interp(xDense, result.X, result.XY[row])
+            # compare away from the jumps, where interpolation between duplicate x is undefined
+            smooth = np.all(abs(xDense[:, None] - np.array([0, 1.0, .5, 2.5, 3.0])) > 1E-3, axis=1)
+            error = abs(interpolated - dense[row])[smooth].max() / abs(dense[row]).max()
+            assert error < 2 * tol
+
+
+class Test_Beam_movingLoad:
+    def getSupported(self, l, e, i):
+        B = Beam(l, e, i=i)
+        B.addSupport(0, SupportTypes.PIN)
+        B.addSupport(l, SupportTypes.ROLLER)
+        return B
+
+    def test_single_axle(self):
+        l, e, i, p = 2.0, 200E9, 1E-6, -10.0
+        B = self.getSupported(l, e, i)
+        
+        envelope = B.movingLoad([p], 0, np.linspace(0, l, 21), n=21)
+        cases, locations, values = envelope.getCritical()
+        
+        tol = 1E-10
+        assert abs(abs(values[0, 1]) - abs(p) * l / 4) < tol
+        assert abs(locations[0, 1] - l / 2) < tol
+        assert abs(cases[0, 1] - l / 2) < tol
+        assert abs(abs(values[0, 3]) - abs(p) * l**3 / (48 * e * i)) < tol
+        assert np.allclose(envelope.Max[1], 0)
+    
+    def test_matches_rebuilt_beams(self):
+        l, e, i, n = 3.0, 200E9, 1E-6, 31
+        axles, spacing, positions = [-10.0, -6.0, -4.0], [0.5, 0.8], np.linspace(0, l + 1.3, 18)
+        B = self.getSupported(l, e, i)
+        B.addDistributedLoad(0, l, -2.0, 0)
+        
+        envelope = B.movingLoad(axles, spacing, positions, angle=30, n=n)
+        
+        responses = []
+        for position in positions:
+            R = self.getSupported(l, e, i)
+            R.addDistributedLoad(0, l, -2.0, 0)
+            for axle, location in zip(axles, position - np.array([0, 0.5, 1.3])):
+                if 0 <= location <= l:
+                    R.addPointLoad(location, axle, 30)
+            result = R.analyze(n)
+            responses.append([result.XY, result.XZ])
+        responses = np.array(responses)
+        
+        tol = 1E-8
+        assert np.allclose(envelope.Max, responses.max(axis=0), rtol=tol, atol=tol)
+        assert np.allclose(envelope.Min, responses.min(axis=0), rtol=tol, atol=tol)
+        assert np.allclose(np.take_along_axis(responses, envelope.MaxCases[None], axis=0)[0], envelope.Max, rtol=tol, atol=tol)
+
+
+class Test_Beam_combine:
+    def getLoaded(self, factors):
+        l, e, i = 3.0, 200E9, 1E-6
+        B = Beam(l, e, i=i)
+        B.addSupport(0, SupportTypes.FIXED)
+        B.addSupport(l, SupportTypes.ROLLER)
+        B.addPointLoad(1.0, -4.0, 0)
+        B.addDistributedLoad(0, l, -2.0 * factors.get("dead", 1), 0, group="dead")
+        B.addPointLoad(2.0, -10.0 * factors.get("live", 1), 45, group="live")
+        B.addAppliedMoment(1.5, 3.0 * factors.get("wind", 1), 90, group="wind")
+        return B
+
+    def test_matches_rebuilt_beams(self):
+        n = 31
+        combinations = {
+            "1.4D": {"dead": 1.4},
+            "1.2D+1.6L": {"dead": 1.2, "live": 1.6},
+            "0.9D+1.0W": {"dead": 0.9, "wind": 1.0},
+            "1.2D+1.0L+1.0W": {"dead": 1.2, "live": 1.0, "wind": 1.0}
+        }
+        B = self.getLoaded({})
+        
+        envelope = B.combine(combinations, n)
+        
+        responses = []
+        for factors in combinations.values():
+            factors = {group: factors.get(group, 0) for group in ["dead", "live", "wind"]}
+            result = self.getLoaded(factors).analyze(n)
+            responses.append([result.XY, result.XZ])
+        responses = np.array(responses)
+        
+        tol = 1E-8
+        assert np.allclose(envelope.Max, responses.max(axis=0), rtol=tol, atol=tol)
+        assert np.allclose(envelope.Min, responses.min(axis=0), rtol=tol, atol=tol)
+        assert list(envelope.Cases) == list(combinations)
+        assert np.allclose(np.take_along_axis(responses, envelope.MaxCases[None], axis=0)[0], envelope.Max, rtol=tol, atol=tol)
+    
+    def test_no_groups(self):
+        l, e, i, n = 3.0, 200E9, 1E-6, 31
+        B = Beam(l, e, i=i)
+        B.addSupport(0, SupportTypes.PIN)
+        B.addSupport(l, SupportTypes.ROLLER)
+        B.addPointLoad(1.0, -4.0, 30)
+        
+        envelope = B.combine({"base": {}, "again": {}}, n)
+        
+        result = B.analyze(n)
+        expected = np.array([result.XY, result.XZ])
+        tol = 1E-10
+        assert np.allclose(envelope.Max, expected, rtol=tol, atol=tol)
+        assert np.allclose(envelope.Min, expected, rtol=tol, atol=tol)
+        assert np.all(envelope.MaxCases == 0)
+    
+    def test_unknown_group(self):
+        B = self.getLoaded({})
+        
+        with pytest.raises(Exception):
+            B.combine({"1.6S": {"snow": 1.6}})
+
+
+class Test_Beam_removeAppliedLoad:
+    def test_matches_rebuilt_beam(self):
+        l, e, i, n = 3.0, 200E9, 1E-6, 31
+        B = Beam(l, e, i=i)
+        B.addSupport(0, SupportTypes.PIN)
+        B.addSupport(l, SupportTypes.ROLLER)
+        B.addDistributedLoad(0, l, -2.0, 0, group="dead")
+        B.analyze(n)
+        live = B.addPointLoad(1.0, -10.0, 30, group="live")
+        B.analyze(n)
+        
+        B.removeAppliedLoad(live)
+        B.addAppliedMoment(2.0, 4.0, 0)
+        result = B.analyze(n)
+        R = Beam(l, e, i=i)
+        R.addSupport(0, SupportTypes.PIN)
+        R.addSupport(l, SupportTypes.ROLLER)
+        R.addDistributedLoad(0, l, -2.0, 0)
+        R.addAppliedMoment(2.0, 4.0, 0)
+        expected = R.analyze(n)
+        
+        tol = 1E-9
+        assert np.allclose(result.XY, expected.XY, rtol=tol, atol=tol)
+        assert np.allclose(result.XZ, expected.XZ, rtol=tol, atol=tol)
+        assert B.LoadGroups["live"] == ([], [])
+    
+    def test_ungrouped_not_held(self):
+        B = Beam(3.0, 200E9, i=1E-6)
+        B.addSupport(0, SupportTypes.FIXED)
+        loadId = B.addPointLoad(1.0, -10.0, 30)
+        
+        assert B.LoadGroups == {}
+        B.removeAppliedLoad(loadId)
+        assert len(B.SingularityXY.LoadRows) == 0
+
+
+class Test_Beam_optimizeSection:
+    def getLibrary(self):
+        library = SectionLibrary()
+        widths, heights = np.meshgrid(np.linspace(0.02, 0.1, 5), np.linspace(0.04, 0.2, 5))
+        dims = np.column_stack((widths.ravel(), heights.ravel()))
+        library.addSections(CrossSectionTypes.RECT, dims, [f"R{k}" for k in range(len(dims))])
+        library.addSections(CrossSectionTypes.I, [[0.1, 0.2, 0.01, 0.006]], ["I1"])
+        return library
+    
+    def getPassing(self, library, makeBeam, limits, n):
+        """
+        brute force, analyzing a beam with every section
+        """
+        passing = []
+        for index in range(len(library)):
+            CS = library.getCrossSection(index)
+            result = makeBeam(CS).analyze(n)
+            stress = np.max(abs(result.XY[1]) / CS.getSz() + abs(result.XZ[1]) / CS.getSy())
+            deflection = np.max(np.hypot(result.XY[3], result.XZ[3]))
+            passing.append(stress <= limits["stress"] and deflection <= limits["deflection"])
+        return np.array(passing)
+    
+    def test_matches_brute_force(self):
+        l, e, n = 3.0, 200E9, 31
+        limits = {"stress": 250E6, "deflection": l / 360}
+        def makeBeam(CS):
+            B = Beam(l, e, crossSection=CS)
+            B.addSupport(0, SupportTypes.FIXED)
+            B.addSupport(l, SupportTypes.ROLLER)
+            B.addDistributedLoad(0, l, -20E3, 20)
+            B.addPointLoad(1.0, -30E3, 0)
+            return B
+        library = self.getLibrary()
+        
+        index, passing = makeBeam(library.getCrossSection(0)).optimizeSection(library, limits, n)
+        
+        expected = self.getPassing(library, makeBeam, limits, n)
+        assert np.array_equal(passing, expected)
+        assert 0 < np.sum(passing) < len(library)
+        assert index == library.getLightest(expected)
+    
+    def test_boundary_condition_values(self):
+        l, e, n = 2.0, 200E9, 21
+        limits = {"stress": 250E6, "deflection": 0.01}
+        def makeBeam(CS):
+            B = Beam(l, e, crossSection=CS)
+            B.addPointLoad(0, 5E3, 0)
+            B.addAppliedMoment(0, -5E3 * l, 0)
+            B.addPointLoad(l, -5E3, 0)
+            B.addBoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0)
+            B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, -0.005)
+            return B
+        library = self.getLibrary()
+        
+        _index, passing = makeBeam(library.getCrossSection(0)).optimizeSection(library, limits, n)
+        
+        assert np.array_equal(passing, self.getPassing(library, makeBeam, limits, n))
+    
+    def test_unknown_limit(self):
+        B = getSimplySupported()
+        
+        with pytest.raises(Exception):
+            B.optimizeSection(self.getLibrary(), {"buckling": 1.0})
@@ -0,0 +1,52 @@
+import numpy as np
+
+from beam_analysis.Beam import Beam
+from beam_analysis.BeamBatch import BeamBatch
+from beam_analysis.BoundaryCondition import BoundaryConditionTypes
+
+
+class Test_BeamBatch:
+    def test_matches_individual_beams(self):
+        l = 2.0
+        e = np.array([200E9, 70E9, 110E9])
+        i = np.array([1E-6, 2E-6, 3E-6])
+        p = np.array([-10.0, -20.0, 5.0])
+        w = np.array([-1.0, 0.0, 2.0])
+        
+        BB = BeamBatch(l, e, i)
+        BB.addPointLoad(l / 3, p, 30)
+        BB.addDistributedLoad(l / 4, 3 * l / 4, w, 0)
+        BB.addAppliedMoment(l, 4.0, 90)
+        BB.addBoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0)
+        BB.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+        BB.solve()
+
+        xVals = np.linspace(0, l, 51)
+        xy, xz = BB.evaluateOver(xVals)
+        assert xy.shape == (3, 51, 4)
+        
+        for b in range(3):
+            B = Beam(l, e[b], i=i[b])
+            B.addPointLoad(l / 3, p[b], 30)
+            B.addDistributedLoad(l / 4, 3 * l / 4, w[b], 0)
+            B.addAppliedMoment(l, 4.0, 90)
+            B.addBoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0)
+            B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+            B.solve()
+            
+            expectedXY = np.stack(B.SingularityXY.evaluateAllOver(xVals), axis=-1)
+            expectedXZ = np.stack(B.SingularityXZ.evaluateAllOver(xVals), axis=-1)
+
+            tol = 1E-10
+            assert np.allclose(xy[b], expectedXY, rtol=tol, atol=tol)
+            assert np.allclose(xz[b], expectedXZ, rtol=tol, atol=tol)
+    
+    def test_beam_count(self):
+        BB = BeamBatch(1, 1, [1, 2, 3, 4])
+        BB.addPointLoad(1, 1, 0)
+        
+        expected = 4
+        result = BB.getBeamCount()
+        test = result == expected
+        
+        assert test
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+import beam_analysis.ContinuousBeam as continuous
+from beam_analysis.ContinuousBeam import ContinuousBeam, solveTridiagonal
+from beam_analysis.Beam import Beam
+from beam_analysis.Support import SupportTypes
+
+
+class Test_solveTridiagonal:
+    def test_matches_dense(self, monkeypatch):
+        rng = np.random.default_rng(0)
+        n = 12
+        lower, upper = rng.uniform(-1, 1, n - 1), rng.uniform(-1, 1, n - 1)
+        diagonal = 4 + rng.uniform(0, 1, n)
+        b = rng.uniform(-1, 1, (n, 2))
+        dense = np.diag(diagonal) + np.diag(lower, -1) + np.diag(upper, 1)
+        
+        monkeypatch.setattr(continuous, "solve_banded", None)
+        x = solveTridiagonal(lower, diagonal, upper, b)
+        
+        tol = 1E-12
+        test = np.allclose(x, np.linalg.solve(dense, b), rtol=tol, atol=tol)
+        assert test
+
+
+class Test_ContinuousBeam:
+    def test_two_equal_spans(self):
+        l, e, i, w = 2.0, 200E9, 1E-6, -3.0
+        C = ContinuousBeam(2 * l, e, i)
+        C.addSupport(0, SupportTypes.PIN)
+        C.addSupport(l, SupportTypes.ROLLER)
+        C.addSupport(2 * l, SupportTypes.ROLLER)
+        C.addDistributedLoad(0, 2 * l, w, 0)
+        
+        C.solve()
+        reactions = C.getReactions()[0]
+        
+        tol = 1E-10
+        assert np.allclose(reactions, -w * l * np.array([3 / 8, 10 / 8, 3 / 8]), rtol=tol, atol=tol)
+        assert abs(abs(C.SupportMoments[0, 1]) - abs(w) * l**2 / 8) < tol
+    
+    def test_fixed_ends(self):
+        l, e, i, w = 3.0, 200E9, 1E-6, -2.0
+        C = ContinuousBeam(l, e, i)
+        C.addSupport(0, SupportTypes.FIXED)
+        C.addSupport(l, SupportTypes.FIXED)
+        C.addDistributedLoad(0, l, w, 0)
+        
+        result = C.analyze(101)
+        
+        tol = 1E-10
+        assert np.allclose(abs(C.SupportMoments[0]), abs(w) * l**2 / 12, rtol=tol, atol=tol)
+        assert abs(abs(result.ExtremaValues[0, 3]) - abs(w) * l**4 / (384 * e * i)) < tol
+    
+    def test_matches_beam(self):
+        l, e, i, n = 10.0, 200E9, 1E-6, 201
+        supports = [0, 2.5, 4.0, 7.0, 10.0]
+        C = ContinuousBeam(l, e, i)
+        B = Beam(l, e, i=i)
+        for beam in [C, B]:
+            beam.addSupport(0, SupportTypes.FIXED)
+            for location in supports[1:]:
+                beam.addSupport(location, SupportTypes.ROLLER)
+            beam.addDistributedLoad(1.0, 8.5, -2.0, 30)
+            beam.addPointLoad(3.0, -10.0, 0)
+            beam.addPointLoad(4.0, -5.0, 0)
+            beam.addAppliedMoment(6.0, 4.0, 90)
+        
+        result = C.analyze(n)
+        expected = B.analyze(n)
+        
+        tol = 1E-8
+        # shear and bending jump at supports, compare away from them
+        away = np.all(abs(result.X[:, None] - np.array(supports)[None, :]) > 1E-9, axis=1)
+        assert np.allclose(result.XY[:, away], expected.XY[:, away], rtol=tol, atol=tol)
+        assert np.allclose(result.XZ[2:], expected.XZ[2:], rtol=tol, atol=tol)
+        assert np.allclose(result.ExtremaValues[:, 3], expected.ExtremaValues[:, 3], rtol=tol, atol=tol)
+    
+    def test_iy(self):
+        l, e, i, n = 6.0, 200E9, 1E-6, 61
+        C = ContinuousBeam(l, e, i, iy=4 * i)
+        B = Beam(l, e, i=i, iy=4 * i)
+        for beam in [C, B]:
+            beam.addSupport(0, SupportTypes.PIN)
+            beam.addSupport(2.5, SupportTypes.ROLLER)
+            beam.addSupport(l, SupportTypes.FIXED)
+            beam.addDistributedLoad(0, l, -2.0, 60)
+        
+        result = C.analyze(n)
+        expected = B.analyze(n)
+        
+        tol = 1E-8
+        assert np.allclose(result.XZ[2:], expected.XZ[2:], rtol=tol, atol=tol)
+        assert np.allclose(C.getReactions()[1], [r.Magnitude for r in B.SingularityXZ.Reactions if r.AppliedLoadType.name == "POINT_LOAD"], rtol=tol, atol=tol)
+    
+    def test_invalid_supports(self):
+        C = ContinuousBeam(4.0, 200E9, 1E-6)
+        C.addSupport(0, SupportTypes.PIN)
+        C.addSupport(2.0, SupportTypes.FIXED)
+        C.addSupport(4.0, SupportTypes.ROLLER)
+        
+        with pytest.raises(Exception):
+            C.solve()
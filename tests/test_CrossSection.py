@@ -1,6 +1,6 @@
 import numpy as np
 
-from beam_analysis.CrossSection import CrossSection, CrossSectionTypes
+from beam_analysis.CrossSection import CrossSection, CrossSectionTypes, PROPERTY_NAMES, getSectionProperties
 
 
 class Test_CrossSection_getArea:
@@ -53,3 +53,83 @@ class Test_CrossSection_getInertia:
         test = abs(result - expected) < tol
         
         assert test
+
+
+def getShoelaceArea(outline):
+    y, z = outline[:, 0], outline[:, 1]
+    return abs(np.dot(y, np.roll(z, -1)) - np.dot(z, np.roll(y, -1))) / 2
+
+
+class Test_CrossSection_getMesh:
+    def test_outline_area(self):
+        for CS in [
+            CrossSection(CrossSectionTypes.RECT, dims=[2, 3]),
+            CrossSection(CrossSectionTypes.I, dims=[0.2, 0.3, 0.02, 0.01])
+        ]:
+            tol = 1E-10
+            test = abs(getShoelaceArea(CS.getOutline()) - CS.getArea()) < tol
+            
+            assert test
+    
+    def test_shape(self):
+        xVals = np.linspace(0, 2, 11)
+        for crossSectionType, dims, m in [
+            (CrossSectionTypes.RECT, [2, 3], 4),
+            (CrossSectionTypes.CIRC, [1], 16),
+            (CrossSectionTypes.I, [0.2, 0.3, 0.02, 0.01], 12)
+        ]:
+            CS = CrossSection(crossSectionType, dims=dims)
+            
+            mesh = CS.getMesh(xVals, np.zeros(11), np.zeros(11), n=16)
+            
+            assert mesh.shape == (11, m, 3)
+            assert np.array_equal(mesh[:, 0, 0], xVals)
+    
+    def test_getPlotPoints_CIRC(self):
+        r, n = 2, 20
+        CS = CrossSection(CrossSectionTypes.CIRC, dims=[r])
+        
+        x, y, z = CS.getPlotPoints(1.5, 0.1, -0.2, n)
+        th = 2 * np.pi / n * np.arange(n)
+        
+        tol = 1E-10
+        assert np.allclose(x, 1.5, rtol=tol, atol=tol)
+        assert np.allclose(y, -0.2 + np.cos(th) * r, rtol=tol, atol=tol)
+        assert np.allclose(z, 0.1 + np.sin(th) * r, rtol=tol, atol=tol)
+
+
+class Test_CrossSection_getProperties:
+    def test_I(self):
+        b, h, tf, tw = 0.2, 0.3, 0.02, 0.01
+        CS = CrossSection(CrossSectionTypes.I, dims=[b, h, tf, tw])
+        
+        # flanges about their own centroids plus parallel axis, and the web
+        wH = h - 2 * tf
+        d = (h - tf) / 2
+        iz = 2 * (b * tf**3 / 12 + b * tf * d**2) + tw * wH**3 / 12
+        iy = 2 * tf * b**3 / 12 + wH * tw**3 / 12
+        
+        tol = 1E-12
+        assert abs(CS.getIz() - iz) < tol
+        assert abs(CS.getIy() - iy) < tol
+        assert abs(CS.getSz() - iz / (h / 2)) < tol
+        assert abs(CS.getSy() - iy / (b / 2)) < tol
+    
+    def test_vectorized(self):
+        dims = np.array([[2, 3], [1, 4], [0.5, 0.5]])
+        
+        table = getSectionProperties(CrossSectionTypes.RECT, dims)
+        
+        for row, d in zip(table, dims):
+            CS = CrossSection(CrossSectionTypes.RECT, dims=list(d))
+            assert np.array_equal(row, CS.getProperties())
+        assert table.shape == (3, len(PROPERTY_NAMES))
+    
+    def test_cache_follows_dims(self):
+        CS = CrossSection(CrossSectionTypes.RECT, dims=[2, 3])
+        CS.getArea()
+        
+        CS.Dims = [4, 3]
+        test = CS.getArea() == 12
+        
+        assert test
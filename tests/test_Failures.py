@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from beam_analysis.Beam import Beam
+from beam_analysis.CrossSection import CrossSection, CrossSectionTypes
+from beam_analysis.Failures import StressElement, getStressField
+from beam_analysis.Support import SupportTypes
+
+
+class Test_StressElement:
+    def test_returns_values(self, capsys):
+        Se = StressElement(-30, -65, 0, shearXY=40)
+        Se.setYieldStrength(295)
+        
+        stressMSS, fosMSS = Se.getFailureAnalysis("MSS")
+        stressDE, fosDE = Se.getFailureAnalysis("DE")
+        
+        tol = 1E-10
+        r = (17.5**2 + 40**2)**.5
+        assert abs(stressMSS - (47.5 + r)) < tol
+        assert abs(stressDE - (30**2 + 65**2 - 30 * 65 + 3 * 40**2)**.5) < tol
+        assert abs(fosDE - 295 / stressDE) < tol
+        assert capsys.readouterr().out == ""
+
+    
+    def test_MSS_compression(self):
+        # principal stresses are not sorted without shear, the old signed differences gave a max shear of 0
+        Se = StressElement(-100, 0, 0)
+        Se.setYieldStrength(295)
+        
+        stress, fos = Se.getFailureAnalysis("MSS")
+        
+        tol = 1E-10
+        assert abs(stress - 100) < tol
+        assert abs(fos - 2.95) < tol
+    
+    def test_no_yield_strength(self):
+        Se = StressElement(50, 0, 0)
+        
+        result = Se.getFailureAnalysis("DE")
+        expected = (50.0, None)
+        test = result == expected
+        
+        assert test
+
+
+class Test_getStressField:
+    def test_rect_simply_supported(self):
+        l, w, h, p, n = 2.0, 0.05, 0.1, -10E3, 21
+        CS = CrossSection(CrossSectionTypes.RECT, dims=[w, h])
+        B = Beam(l, 200E9, crossSection=CS)
+        B.addSupport(0, SupportTypes.PIN)
+        B.addSupport(l, SupportTypes.ROLLER)
+        B.addPointLoad(l / 2, p, 0)
+        
+        result = B.getStressField(n, 11)
+        
+        tol = 1E-6
+        location, point, value = result.getCritical()
+        assert abs(location - l / 2) < tol
+        assert abs(abs(point[1]) - h / 2) < tol
+        assert abs(value - abs(p) * l / 4 / CS.getSz()) < tol
+        # shear at the neutral axis of the support, 3 V / (2 A)
+        axis = np.flatnonzero((result.Points[:, 1] == 0) & (result.Points[:, 0] == 0))[0]
+        assert abs(result.Shear[0, axis] - 1.5 * abs(p) / 2 / CS.getArea()) < tol
+    
+    def test_biaxial_corner(self):
+        l, w, h = 3.0, 0.06, 0.1
+        CS = CrossSection(CrossSectionTypes.RECT, dims=[w, h])
+        B = Beam(l, 200E9, crossSection=CS)
+        B.addSupport(0, SupportTypes.FIXED)
+        B.addPointLoad(l, -5E3, 30)
+        
+        result = B.getStressField(31)
+        
+        tol = 1E-6
+        analysis = B.analyze(31)
+        expected = np.max(abs(analysis.XY[1]) / CS.getSz() + abs(analysis.XZ[1]) / CS.getSy())
+        assert abs(np.max(abs(result.Normal)) - expected) < tol
+    
+    def test_matches_stress_element(self):
+        CS = CrossSection(CrossSectionTypes.I, dims=[0.1, 0.2, 0.01, 0.006])
+        xVals = np.linspace(0, 1, 5)
+        shears = np.array([np.linspace(-3E3, 3E3, 5), np.full(5, 1E3)])
+        moments = np.array([np.linspace(0, 2E3, 5), np.linspace(1E3, 0, 5)])
+        
+        result = getStressField(CS, xVals, shears, moments)
+        fos = result.getFos(250E6)
+        
+        tol = 1E-9
+        for i, j in [(0, 0), (2, 5), (4, len(result.Points) - 1)]:
+            Se = StressElement(result.Normal[i, j], 0, 0, shearXY=result.Shear[i, j])
+            Se.setYieldStrength(250E6)
+            for analysis in ["MSS", "DE"]:
+                stress, _fos = Se.getFailureAnalysis(analysis)
+                assert abs(result.getEquivalent(analysis)[i, j] - stress) < tol * stress
+            assert abs(fos[i, j] - Se.getFailureAnalysis("DE")[1]) < tol * fos[i, j]
+    
+    def test_I_web_shear(self):
+        b, h, tf, tw = 0.1, 0.2, 0.01, 0.006
+        CS = CrossSection(CrossSectionTypes.I, dims=[b, h, tf, tw])
+        v = 1E4
+        
+        result = getStressField(CS, [0], [[v], [0]], [[0], [0]])
+        
+        # V * Q / (I * t) at the neutral axis
+        q = b * tf * (h - tf) / 2 + tw * (h / 2 - tf)**2 / 2
+        tol = 1E-6
+        assert abs(np.max(result.Shear) - v * q / (CS.getIz() * tw)) < tol
+
+    def test_requires_cross_section(self):
+        B = Beam(2.0, 200E9, i=1E-6)
+        B.addSupport(0, SupportTypes.FIXED)
+        B.addPointLoad(2.0, -10E3, 0)
+        
+        with pytest.raises(Exception):
+            B.getStressField(11)
@@ -0,0 +1,60 @@
+import numpy as np
+
+from beam_analysis.LoadTable import LoadTable
+from beam_analysis.AppliedLoad import PointLoad, DistributedLoad, Moment
+from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+
+
+def getLoads():
+    return [PointLoad(1, 10), DistributedLoad(.5, 2, 5), Moment(1.5, -5), PointLoad(0, -3)]
+
+
+class Test_LoadTable:
+    def test_matches_loads(self):
+        table = LoadTable(capacity=1)
+        for load in getLoads():
+            table.appendLoad(load)
+        xVals = np.linspace(0, 2, 41)
+        
+        for bat in BeamAnalysisTypes:
+            result = table.evaluateOver(xVals, bat, chunkSize=50)
+            expected = sum(load.evaluateOver(xVals, bat) for load in getLoads())
+            
+            tol = 1E-10
+            test = np.allclose(result, expected, rtol=tol, atol=tol)
+            
+            assert test
+    
+    def test_toLoads(self):
+        table = LoadTable()
+        for load in getLoads():
+            table.appendLoad(load)
+        
+        result = [(type(load), load.getLocation(), load.Magnitude) for load in table.toLoads()]
+        expected = [(type(load), load.getLocation(), load.Magnitude) for load in getLoads()]
+        test = result == expected
+        
+        assert test
+    
+    def test_evaluateAt(self):
+        table = LoadTable()
+        table.appendLoad(PointLoad(1, 10))
+        
+        expected = 10
+        result = table.evaluateAt(1, BeamAnalysisTypes.SHEAR)
+        test = result == expected
+        
+        assert test
+    
+    def test_remove(self):
+        table = LoadTable()
+        for load in getLoads():
+            table.appendLoad(load)
+        
+        table.remove([0, 2])
+        
+        expected = [0.5, 0]
+        result = list(table.getRows()["Start"])
+        test = result == expected
+        
+        assert test
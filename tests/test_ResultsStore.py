@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from beam_analysis.Beam import Beam
+from beam_analysis.ResultsStore import ResultsStore
+from beam_analysis.Support import SupportTypes
+
+
+def getBeam(l, p):
+    B = Beam(l, 200E9, i=1E-6)
+    B.addSupport(0, SupportTypes.PIN)
+    B.addSupport(l, SupportTypes.ROLLER)
+    B.addPointLoad(l / 2, p, 0)
+    return B
+
+
+class Test_ResultsStore:
+    def test_roundtrip_and_query(self, tmp_path):
+        n = 11
+        with ResultsStore(str(tmp_path), capacity=4, parameterNames=("L", "P"), n=n) as store:
+            for beamId, (l, p) in enumerate([(2, -10), (4, -10), (6, -10)]):
+                store.append(beamId, {"L": l, "P": p}, getBeam(l, p).analyze(n))
+        
+        store = ResultsStore(str(tmp_path))
+        l = store.getParameter("L")
+        _locations, values = store.getExtrema()
+        exceeds = store.getBeamIds()[abs(values[:, 0, 3]) > l / 100000]
+        
+        assert store.Count == 3
+        assert isinstance(store.BeamIds, np.memmap)
+        assert store.getCurves().shape == (3, 9, n)
+        assert list(exceeds) == [1, 2]
+    
+    def test_full(self, tmp_path):
+        store = ResultsStore(str(tmp_path), capacity=1, parameterNames=("L",))
+        store.append(0, [2], getBeam(2, -1).analyze(5))
+        
+        with pytest.raises(Exception):
+            store.append(1, [2], getBeam(2, -1).analyze(5))
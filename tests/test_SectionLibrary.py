@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from beam_analysis.CrossSection import CrossSection, CrossSectionTypes
+from beam_analysis.SectionLibrary import SectionLibrary
+
+
+def getLibrary():
+    library = SectionLibrary()
+    library.addSections(CrossSectionTypes.RECT, [[0.05, 0.1], [0.05, 0.2], [0.1, 0.1]], ["R1", "R2", "R3"])
+    library.addSections(CrossSectionTypes.CIRC, [[0.05]], ["C1"])
+    library.addSections(CrossSectionTypes.I, [[0.1, 0.2, 0.01, 0.006], [0.15, 0.3, 0.012, 0.008]], ["I1", "I2"])
+    return library
+
+
+class Test_SectionLibrary:
+    def test_table_matches_cross_sections(self):
+        library = getLibrary()
+        
+        tol = 1E-14
+        for index, name in enumerate(library.Names):
+            CS = library.getCrossSection(name)
+            assert np.allclose(library.Table[index], CS.getProperties(), rtol=tol, atol=tol)
+        assert len(library) == 6
+    
+    def test_getIndices(self):
+        library = getLibrary()
+        
+        test = list(library.getIndices(["I2", "R1", "C1"])) == [5, 0, 3]
+        
+        assert test
+    
+    def test_getLightest(self):
+        library = getLibrary()
+        sz = library.getColumn("Sz")
+        
+        index = library.getLightest(Sz=3E-4)
+        
+        passing = 3E-4 <= sz
+        expected = np.flatnonzero(passing)[np.argmin(library.getColumn("A")[passing])]
+        assert index == expected
+        assert library.getLightest(Sz=1) is None
+    
+    def test_fromCsv(self, tmp_path):
+        filename = tmp_path / "sections.csv"
+        filename.write_text("name,type,dim1,dim2,dim3,dim4\nR1,RECT,0.05,0.1,,\nI1,I,0.1,0.2,0.01,0.006\nC1,CIRC,0.05,,,\n")
+        
+        library = SectionLibrary.fromCsv(filename)
+        
+        tol = 1E-14
+        expected = CrossSection(CrossSectionTypes.I, dims=[0.1, 0.2, 0.01, 0.006]).getProperties()
+        assert np.allclose(library.getProperties("I1"), expected, rtol=tol, atol=tol)
+        assert library.Names == ["R1", "I1", "C1"]
+        assert library.getIndices("C1") == 2
+    
+    def test_duplicate_names(self):
+        library = getLibrary()
+        
+        for names in [["R4", "R4"], ["R4", "I1"]]:
+            with pytest.raises(Exception):
+                library.addSections(CrossSectionTypes.RECT, [[0.1, 0.2], [0.2, 0.2]], names)
+        
+        assert len(library) == len(library.Table) == len(library.Dims) == len(library.Types) == 6
+        assert "R4" not in library.Indices
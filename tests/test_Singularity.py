@@ -0,0 +1,312 @@
+import numpy as np
+import pytest
+
+from beam_analysis.Singularity import Singularity, solveSingularities
+from beam_analysis.AppliedLoad import PointLoad, DistributedLoad, Moment
+from beam_analysis.BeamAnalysisTypes import BeamAnalysisTypes
+from beam_analysis.BoundaryCondition import BoundaryCondition, BoundaryConditionTypes
+from beam_analysis.Support import Support, SupportTypes
+
+
+def getSimplySupported(l=2.0, e=200E9, i=1E-6):
+    S = Singularity(l, e, i)
+    S.addAppliedLoad(PointLoad(0, 5))
+    S.addAppliedLoad(PointLoad(l / 2, -10))
+    S.addAppliedLoad(PointLoad(l, 5))
+    S.addAppliedLoad(DistributedLoad(l / 4, l, -3))
+    S.addAppliedLoad(Moment(3 * l / 4, 2))
+    S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0))
+    S.addBoundaryCondition(BoundaryCondition(l, BoundaryConditionTypes.DEFLECTION, 0))
+    S.solve()
+    return S
+
+
+class Test_Singularity_evaluateOver:
+    def test_matches_evaluateAt(self):
+        S = getSimplySupported()
+        xVals = np.linspace(0, S.L, 101)
+        
+        for bat in BeamAnalysisTypes:
+            result = S.evaluateOver(xVals, bat)
+            expected = np.array([S.evaluateAt(x, bat) for x in xVals])
+
+            tol = 1E-10
+            test = np.allclose(result, expected, rtol=tol, atol=tol)
+            
+            assert test
+    
+    def test_no_loads(self):
+        S = Singularity(1, 1, 1)
+        S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0))
+        S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0))
+        S.solve()
+        xVals = np.linspace(0, 1, 11)
+        
+        result = S.evaluateOver(xVals, BeamAnalysisTypes.DEFLECTION)
+        test = np.all(result == 0)
+        
+        assert test
+    
+    def test_evaluateAllOver(self):
+        S = getSimplySupported()
+        xVals = np.linspace(0, S.L, 11)
+
+        result = S.evaluateAllOver(xVals)
+        test = len(result) == 4 and all(r.shape == xVals.shape for r in result)
+        
+        assert test
+
+
+class Test_Singularity_compile:
+    def test_breakpoints(self):
+        S = getSimplySupported()
+        
+        expected = [0, S.L / 4, S.L / 2, 3 * S.L / 4, S.L]
+        result = S.Breakpoints
+        test = np.allclose(result, expected)
+        
+        assert test
+    
+    def test_matches_load_summation(self):
+        S = getSimplySupported()
+        xVals = np.linspace(0, S.L, 257)
+        
+        for bat in BeamAnalysisTypes:
+            result = S.evaluateCompiled(xVals, bat)
+            expected = np.zeros(xVals.shape)
+            for load in S.AppliedLoads:
+                expected += load.evaluateOver(xVals, bat)
+            if bat == BeamAnalysisTypes.ANGLE:
+                expected = (expected + S.C1) / (S.E * S.I)
+            elif bat == BeamAnalysisTypes.DEFLECTION:
+                expected = (expected + S.C1 * xVals + S.C2) / (S.E * S.I)
+            
+            tol = 1E-10
+            test = np.allclose(result, expected, rtol=tol, atol=tol)
+            
+            assert test
+    
+    def test_distributed_load_stops(self):
+        S = Singularity(2, 1, 1)
+        S.addAppliedLoad(DistributedLoad(0, 1, 4))
+        S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0))
+        S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0))
+        S.solve()
+        
+        expected = 4
+        result = S.evaluateOver([1.5, 2], BeamAnalysisTypes.SHEAR)
+        test = np.allclose(result, expected)
+        
+        assert test
+    
+    def test_distributed_load_to_end(self):
+        S = Singularity(2, 1, 1)
+        S.addAppliedLoad(DistributedLoad(1, 2, 4))
+        
+        loads = S.AppliedLoads
+        test = len(loads) == 1 and loads[0].Stop == 2
+        
+        assert test
+    
+    def test_invalidated_by_new_boundary_condition(self):
+        S = getSimplySupported()
+        S.addBoundaryCondition(BoundaryCondition(1, BoundaryConditionTypes.DEFLECTION, 0))
+
+        test = S.Coefficients is None
+        
+        assert test
+
+
+class Test_Singularity_solve:
+    def test_overdetermined_consistent(self):
+        S = getSimplySupported()
+        midspan = S.evaluateAt(S.L / 2, BeamAnalysisTypes.DEFLECTION)
+        c1, c2 = S.C1, S.C2
+        
+        S.addBoundaryCondition(BoundaryCondition(S.L / 2, BoundaryConditionTypes.DEFLECTION, midspan))
+        S.solve()
+        
+        tol = 1E-8
+        assert abs(S.C1 - c1) < tol
+        assert abs(S.C2 - c2) < tol
+        assert S.Residual < tol
+    
+    def test_overdetermined_inconsistent(self):
+        S = getSimplySupported()
+        
+        S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.ANGLE, 1))
+        S.solve()
+        
+        test = 0 < S.Residual and S.isOverdetermined()
+        
+        assert test
+    
+    def test_determined_large_loads(self):
+        S = Singularity(10, 200E9, 3E-3)
+        for location in np.linspace(0, 10, 7):
+            S.addAppliedLoad(PointLoad(location, -1E7))
+        S.addAppliedLoad(DistributedLoad(0, 10, -3E6))
+        S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0))
+        S.addBoundaryCondition(BoundaryCondition(10, BoundaryConditionTypes.DEFLECTION, 0))
+        S.solve()
+        determined = S.isOverdetermined()
+        # a consistent extra condition only leaves round-off
+        S.addBoundaryCondition(BoundaryCondition(5, BoundaryConditionTypes.DEFLECTION, S.evaluateAt(5, BeamAnalysisTypes.DEFLECTION)))
+        S.solve()
+        
+        test = not determined and not S.isOverdetermined() and 1E-6 < S.Residual
+        
+        assert test
+    
+    def test_underdetermined(self):
+        S = Singularity(1, 1, 1)
+        S.addAppliedLoad(PointLoad(1, 1))
+        S.addBoundaryCondition(BoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0))
+        
+        with pytest.raises(Exception):
+            S.solve()
+    
+    def test_solveSingularities(self):
+        S1 = getSimplySupported()
+        S2 = getSimplySupported()
+        S2.addAppliedLoad(PointLoad(S2.L / 3, 7))
+        expected = [S1.C1, S1.C2]
+        
+        solveSingularities([S1, S2])
+        S3 = getSimplySupported()
+        S3.addAppliedLoad(PointLoad(S3.L / 3, 7))
+        S3.solve()
+        
+        tol = 1E-10
+        assert np.allclose([S1.C1, S1.C2], expected, rtol=tol, atol=tol)
+        assert np.allclose([S2.C1, S2.C2], [S3.C1, S3.C2], rtol=tol, atol=tol)
+
+
+
+class Test_Singularity_getInfluenceLines:
+    def test_matches_unit_loads(self):
+        l, e, i = 2.0, 200E9, 1E-6
+        xVals = np.linspace(0, l, 41)
+        locations = [0.0, 0.3, 1.0, 1.7]
+        S = Singularity(l, e, i)
+        S.addSupport(Support(0, SupportTypes.FIXED))
+        S.addSupport(Support(l, SupportTypes.ROLLER))
+        
+        lines = S.getInfluenceLines(xVals, locations)
+        
+        tol = 1E-10
+        assert lines.shape == (4, len(locations), len(xVals))
+        for k, location in enumerate(locations):
+            U = Singularity(l, e, i)
+            U.addSupport(Support(0, SupportTypes.FIXED))
+            U.addSupport(Support(l, SupportTypes.ROLLER))
+            U.addAppliedLoad(PointLoad(location, 1))
+            U.solve()
+            
+            test = np.allclose(lines[:, k], np.stack(U.evaluateAllOver(xVals)), rtol=tol, atol=tol)
+            assert test
+    
+    def test_homogeneous(self):
+        l = 2.0
+        S = getSimplySupported(l)
+        S.BoundaryConditions[0].Value = 1E-3
+        
+        lines = S.getInfluenceLines([0, l], [l / 2])
+        
+        tol = 1E-10
+        test = np.allclose(lines[3, 0], 0, rtol=tol, atol=tol)
+        assert test
+
+
+class Test_Singularity_incremental:
+    def getSupported(self, l, e, i):
+        S = Singularity(l, e, i)
+        S.addSupport(Support(0, SupportTypes.FIXED))
+        S.addSupport(Support(2 * l / 3, SupportTypes.ROLLER))
+        S.addAppliedLoad(DistributedLoad(0, l, -2))
+        return S
+
+    def test_add_matches_solve(self):
+        l, e, i = 3.0, 200E9, 1E-6
+        xVals = np.linspace(0, l, 61)
+        S = self.getSupported(l, e, i)
+        S.solve()
+        
+        S.addAppliedLoad(PointLoad(0.7, -10))
+        S.addAppliedLoad(DistributedLoad(1.1, 2.9, 4))
+        S.addAppliedLoad(Moment(l, 3))
+        F = self.getSupported(l, e, i)
+        F.addAppliedLoad(PointLoad(0.7, -10))
+        F.addAppliedLoad(DistributedLoad(1.1, 2.9, 4))
+        F.addAppliedLoad(Moment(l, 3))
+        F.solve()
+        
+        tol = 1E-9
+        assert np.allclose(S.Solution, F.Solution, rtol=tol, atol=tol)
+        assert np.allclose(np.stack(S.evaluateAllOver(xVals)), np.stack(F.evaluateAllOver(xVals)), rtol=tol, atol=tol)
+    
+    def test_remove_matches_solve(self):
+        l, e, i = 3.0, 200E9, 1E-6
+        xVals = np.linspace(0, l, 61)
+        S = self.getSupported(l, e, i)
+        first = S.addAppliedLoad(DistributedLoad(0.5, 1.5, -6))
+        S.solve()
+        second = S.addAppliedLoad(PointLoad(2.5, -10))
+        
+        S.removeAppliedLoad(first)
+        S.removeAppliedLoad(second)
+        F = self.getSupported(l, e, i)
+        F.solve()
+        
+        tol = 1E-9
+        assert len(S.Loads) == 1
+        assert np.allclose(S.Solution, F.Solution, rtol=tol, atol=tol)
+        assert np.allclose(np.stack(S.evaluateAllOver(xVals)), np.stack(F.evaluateAllOver(xVals)), rtol=tol, atol=tol)
+    
+    def test_overdetermined(self):
+        l = 2.0
+        S = getSimplySupported(l)
+        S.addBoundaryCondition(BoundaryCondition(l / 2, BoundaryConditionTypes.DEFLECTION, 1E-6))
+        S.solve()
+        
+        S.addAppliedLoad(PointLoad(l / 3, 7))
+        F = getSimplySupported(l)
+        F.addBoundaryCondition(BoundaryCondition(l / 2, BoundaryConditionTypes.DEFLECTION, 1E-6))
+        F.addAppliedLoad(PointLoad(l / 3, 7))
+        F.solve()
+        
+        tol = 1E-9
+        assert np.allclose([S.C1, S.C2, S.Residual], [F.C1, F.C2, F.Residual], rtol=tol, atol=tol)
+    
+    def test_remove_keeps_order(self):
+        S = Singularity(4, 1, 1)
+        ids = [S.addAppliedLoad(PointLoad(x, -1)) for x in [1.0, 2.0, 3.0]]
+        S.addAppliedLoad(DistributedLoad(0.5, 1.5, 2))
+        
+        S.removeAppliedLoad(ids[0])
+        S.removeAppliedLoad(ids[2])
+        S.addAppliedLoad(Moment(3.5, 1))
+        
+        result = [load.getLocation() for load in S.AppliedLoads]
+        expected = [2.0, 0.5, 1.5, 3.5]
+        test = result == expected
+        
+        assert test
+        assert S.LoadRows == {1: [0], 3: [1, 2], 4: [3]}
+    
+    def test_applied_loads_read_only(self):
+        S = getSimplySupported()
+        
+        with pytest.raises(AttributeError):
+            S.AppliedLoads.append(PointLoad(1, 1))
+    
+    def test_version(self):
+        S = getSimplySupported()
+        version = S.Version
+        
+        loadId = S.addAppliedLoad(PointLoad(1, 1))
+        S.removeAppliedLoad(loadId)
+        
+        assert S.Version == version + 2
+        with pytest.raises(Exception):
+            S.removeAppliedLoad(loadId)
@@ -0,0 +1,42 @@
+import os
+
+from benchmarks.run import compare, main, runAll, runCase
+from benchmarks.cases import CASES, getSyntheticLoads
+
+
+class Test_Benchmarks:
+    def test_reproducible_loads(self):
+        first = [(type(load), load.Magnitude) for load in getSyntheticLoads(9)]
+        second = [(type(load), load.Magnitude) for load in getSyntheticLoads(9)]
+        
+        assert first == second
+    
+    def test_compare(self):
+        baseline = {"a[1]": 1.0, "b[1]": 1.0}
+        results = {"a[1]": 1.2, "b[1]": 2.0, "c[1]": 5.0}
+        
+        regressions = compare(results, baseline, threshold=1.25)
+        
+        assert [r[0] for r in regressions] == ["b[1]"]
+    
+    def test_quick_run(self):
+        results = runAll(["CrossSection.getPlotPoints"], quick=True, repeat=1)
+        
+        assert list(results) == ["CrossSection.getPlotPoints[20]"]
+        assert 0 < results["CrossSection.getPlotPoints[20]"]
+
+    def test_teardown(self, monkeypatch):
+        cleaned = []
+        monkeypatch.setitem(CASES, "teardown", (lambda size: (lambda: None, lambda: cleaned.append(size)), [1], [1]))
+        
+        runCase("teardown", 1, repeat=1)
+        
+        assert cleaned == [1]
+    
+    def test_missing_baseline(self, tmp_path, capsys):
+        filename = os.path.join(tmp_path, "missing.json")
+        
+        status = main(["--filter", "CrossSection.getPlotPoints", "--quick", "--repeat", "1", "--compare", filename])
+        
+        assert status == 0
+        assert "[SKIP]" in capsys.readouterr().out
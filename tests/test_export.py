@@ -0,0 +1,71 @@
+import os
+import numpy as np
+
+from beam_analysis.Beam import Beam
+from beam_analysis.BoundaryCondition import BoundaryConditionTypes
+from beam_analysis.parallel import runMany
+import beam_analysis.export as export
+
+
+def getResult(n=101):
+    B = Beam(1.0, 200E9, i=1E-6)
+    B.addPointLoad(1.0, -10, 30)
+    B.addBoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0)
+    B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+    return B, B.analyze(n)
+
+
+class Test_export:
+    def test_csv(self, tmp_path):
+        _B, result = getResult()
+        filename = os.path.join(tmp_path, "diagrams.csv")
+        
+        export.writeCsv(result, filename, chunkSize=7)
+        rows = np.loadtxt(filename, delimiter=",", skiprows=1)
+        
+        assert rows.shape == (101, 9)
+        assert np.allclose(rows, export.getRows(result), rtol=1E-9)
+    
+    def test_npz(self, tmp_path):
+        _B, result = getResult()
+        filename = os.path.join(tmp_path, "diagrams.npz")
+        
+        export.writeNpz(result, filename)
+        data = np.load(filename)
+        
+        assert np.array_equal(data["XY"], result.XY)
+        assert np.array_equal(data["ExtremaValues"], result.ExtremaValues)
+    
+    def test_npy(self, tmp_path):
+        _B, result = getResult()
+        filename = os.path.join(tmp_path, "diagrams.npy")
+        
+        export.writeNpy(result, filename)
+        data = np.load(filename, mmap_mode="r")
+        
+        assert data.shape == (9, 101)
+        assert np.array_equal(data.T, export.getRows(result))
+    
+    def test_stream_many(self, tmp_path):
+        beams = [getResult()[0] for _i in range(5)]
+        filename = os.path.join(tmp_path, "many.npy")
+        
+        result = runMany(beams, n=11, workers=1, chunkSize=2, filename=filename)
+        expected = runMany(beams, n=11, workers=1)
+        
+        assert isinstance(result, np.memmap)
+        assert np.array_equal(result, expected)
+    
+    def test_run_analysis_diagrams(self, tmp_path, monkeypatch, capsys):
+        B, _result = getResult()
+        monkeypatch.chdir(tmp_path)
+        
+        B.runAnalysis(11, showPlots=False, outputToFile=True)
+        default = sorted(os.listdir("beam-analysis-results"))
+        B.runAnalysis(11, showPlots=False, outputToFile=True, outputDiagrams=True)
+        requested = sorted(os.listdir("beam-analysis-results"))
+        capsys.readouterr()
+        
+        assert len(default) == 1
+        assert len(requested) == 2
+        assert requested[0].endswith("-diagrams.csv")
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+
+# generous budget for a cold `from beam_analysis.Beam import Beam`, numpy dominates
+IMPORT_BUDGET = 2.0
+
+
+def importInFreshProcess(statement):
+    """
+    returns (seconds to run `statement`, whether matplotlib was imported) in a fresh interpreter
+    """
+    code = "\n".join([
+        "import sys, time",
+        "t0 = time.perf_counter()",
+        statement,
+        "t1 = time.perf_counter()",
+        "print(t1 - t0, 'matplotlib' in sys.modules)"
+    ])
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), out[1] == "True"
+
+
+class Test_Import:
+    def test_no_matplotlib(self):
+        _seconds, hasMatplotlib = importInFreshProcess("from beam_analysis.Beam import Beam")
+        
+        assert not hasMatplotlib
+    
+    def test_import_budget(self):
+        seconds, _hasMatplotlib = importInFreshProcess("from beam_analysis.Beam import Beam")
+        
+        assert seconds < IMPORT_BUDGET
@@ -0,0 +1,46 @@
+import numpy as np
+
+from beam_analysis.Beam import Beam
+from beam_analysis.BoundaryCondition import BoundaryConditionTypes
+from beam_analysis.parallel import runMany
+
+
+def getCantilever(p):
+    B = Beam(1.0, 200E9, i=1E-6)
+    B.addPointLoad(1.0, p, 30)
+    B.addBoundaryCondition(0, BoundaryConditionTypes.ANGLE, 0)
+    B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+    return B
+
+
+class Test_parallel_runMany:
+    def test_input_order(self):
+        beams = [getCantilever(p) for p in range(1, 8)]
+        n = 21
+        
+        result = runMany(beams, n=n, workers=2, chunkSize=3)
+        
+        assert result.shape == (len(beams), 9, n)
+        for i, beam in enumerate(beams):
+            expected = beam.analyze(n)
+            assert np.allclose(result[i, 1:5], expected.XY)
+            assert np.allclose(result[i, 5:], expected.XZ)
+    
+    def test_in_process(self):
+        beams = [getCantilever(p) for p in range(1, 4)]
+        
+        result = runMany(beams, n=11, workers=1)
+        expected = runMany(beams, n=11, workers=2)
+        test = np.array_equal(result, expected)
+        
+        assert test
+    
+    def test_bounded_window(self):
+        # more chunks than the 2 per worker that are submitted at once
+        beams = [getCantilever(p) for p in range(1, 8)]
+        
+        result = runMany(beams, n=11, workers=2, chunkSize=1)
+        expected = runMany(beams, n=11, workers=1)
+        test = np.allclose(result, expected)
+        
+        assert test
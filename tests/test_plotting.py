@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import numpy as np
+
+from beam_analysis.Beam import Beam
+from beam_analysis.BoundaryCondition import BoundaryConditionTypes
+from beam_analysis.plotting import getStationIndices
+
+
+def getSimplySupported(l=2.0, p=-10.0):
+    """
+    simply supported beam with reactions entered by hand, load `p` at midspan
+    """
+    B = Beam(l, 200E9, i=1E-6)
+    B.addPointLoad(0, -p / 2, 0)
+    B.addPointLoad(l / 2, p, 0)
+    B.addPointLoad(l, -p / 2, 0)
+    B.addBoundaryCondition(0, BoundaryConditionTypes.DEFLECTION, 0)
+    B.addBoundaryCondition(l, BoundaryConditionTypes.DEFLECTION, 0)
+    return B
+
+
+class Test_plotting:
+    def test_file_output(self, tmp_path):
+        B = getSimplySupported()
+        result = B.analyze(10**5)
+        
+        for filename in [os.path.join(tmp_path, "beam.png"), os.path.join(tmp_path, "beam.svg")]:
+            B.showPlots(result.X, result.XY, result.XZ, filename=filename)
+            
+            assert 0 < os.path.getsize(filename)
+    
+    def test_file_output_without_pyplot(self, tmp_path):
+        filename = os.path.join(tmp_path, "beam.png")
+        code = "\n".join([
+            "import sys",
+            "from beam_analysis.Beam import Beam",
+            "from beam_analysis.Support import SupportTypes",
+            "B = Beam(2.0, 200E9, i=1E-6)",
+            "B.addSupport(0, SupportTypes.FIXED)",
+            "B.addPointLoad(2.0, -10.0, 0)",
+            "result = B.analyze(1000)",
+            f"B.showPlots(result.X, result.XY, result.XZ, filename={filename!r})",
+            "print('matplotlib.pyplot' in sys.modules)"
+        ])
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True).stdout.split()
+        
+        assert out[-1] == "False"
+        assert os.path.exists(filename)
+    
+    def test_station_spacing(self):
+        # points bunched near a discontinuity at 0.5
+        xVals = np.unique(np.concatenate((np.linspace(0, 1, 101), np.linspace(0.49, 0.51, 1001))))
+        
+        result = xVals[getStationIndices(xVals, 1.0, 11)]
+        expected = np.linspace(0, 1, 11)
+        test = np.allclose(result, expected, atol=0.01)
+        
+        assert test
@@ -1,4 +1,6 @@
-from beam_analysis.utils import getAbsMax
+import numpy as np
+
+from beam_analysis.utils import getAbsMax, getDecimatedIndices
 
 
 class Test_Utils_getAbsMax:
@@ -39,4 +41,31 @@ class Test_Utils_getAbsMax:
         result = getAbsMax(uniform)
         test = result == expected
         
-        assert test
\ No newline at end of file
+        assert test
+
+class Test_Utils_getDecimatedIndices:
+    def test_keeps_extrema(self):
+        x = np.linspace(0, 1, 10**5)
+        y = np.sin(40 * x) + (x > 0.37)
+        
+        indices = getDecimatedIndices(x, y, 200, breakpoints=[0.37])
+        
+        assert len(indices) < 1000
+        assert y[indices].max() == y.max()
+        assert y[indices].min() == y.min()
+        assert indices[0] == 0 and indices[-1] == len(x) - 1
+        at = np.searchsorted(x, 0.37)
+        assert at - 1 in indices and at in indices
+    
+    def test_repeated_x(self):
+        x = np.concatenate((np.linspace(0, 1, 5000), np.linspace(1, 2, 5000)))
+        y = np.concatenate((np.zeros(5000), np.ones(5000)))
+        
+        indices = getDecimatedIndices(x, y, 10)
+        
+        assert 4999 in indices and 5000 in indices
+    
+    def test_small(self):
+        indices = getDecimatedIndices(np.arange(10), np.arange(10), 100)
+        
+        assert np.array_equal(indices, np.arange(10))